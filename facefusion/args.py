@@ -45,6 +45,7 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	# paths
 	apply_state_item('temp_path', args.get('temp_path'))
 	apply_state_item('jobs_path', args.get('jobs_path'))
+	apply_state_item('face_cache_path', args.get('face_cache_path'))
 	apply_state_item('source_paths', args.get('source_paths'))
 	apply_state_item('target_path', args.get('target_path'))
 	apply_state_item('output_path', args.get('output_path'))
@@ -56,7 +57,10 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('face_detector_model', args.get('face_detector_model'))
 	apply_state_item('face_detector_size', args.get('face_detector_size'))
 	apply_state_item('face_detector_angles', args.get('face_detector_angles'))
+	apply_state_item('face_detector_angle_strategy', args.get('face_detector_angle_strategy'))
 	apply_state_item('face_detector_score', args.get('face_detector_score'))
+	apply_state_item('face_detector_batch_size', args.get('face_detector_batch_size'))
+	apply_state_item('face_tracker_interval', args.get('face_tracker_interval'))
 	# face landmarker
 	apply_state_item('face_landmarker_model', args.get('face_landmarker_model'))
 	apply_state_item('face_landmarker_score', args.get('face_landmarker_score'))
@@ -81,6 +85,7 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('trim_frame_start', args.get('trim_frame_start'))
 	apply_state_item('trim_frame_end', args.get('trim_frame_end'))
 	apply_state_item('temp_frame_format', args.get('temp_frame_format'))
+	apply_state_item('frame_extraction_strategy', args.get('frame_extraction_strategy'))
 	apply_state_item('keep_temp', args.get('keep_temp'))
 	# output creation
 	apply_state_item('output_image_quality', args.get('output_image_quality'))
@@ -105,10 +110,12 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	if args.get('output_video_fps') or is_video(args.get('target_path')):
 		output_video_fps = normalize_fps(args.get('output_video_fps')) or detect_video_fps(args.get('target_path'))
 		apply_state_item('output_video_fps', output_video_fps)
+	apply_state_item('video_merge_strategy', args.get('video_merge_strategy'))
 	apply_state_item('skip_audio', args.get('skip_audio'))
 	# processors
 	available_processors = [ file.get('name') for file in list_directory('facefusion/processors/modules') ]
 	apply_state_item('processors', args.get('processors'))
+	apply_state_item('processor_strategy', args.get('processor_strategy'))
 	for processor_module in get_processors_modules(available_processors):
 		processor_module.apply_args(args, apply_state_item)
 	# uis
@@ -120,15 +127,36 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('execution_providers', args.get('execution_providers'))
 	apply_state_item('execution_thread_count', args.get('execution_thread_count'))
 	apply_state_item('execution_queue_count', args.get('execution_queue_count'))
+	apply_state_item('execution_worker_strategy', args.get('execution_worker_strategy'))
+	apply_state_item('execution_shard_count', args.get('execution_shard_count'))
+	apply_state_item('execution_intra_op_thread_count', args.get('execution_intra_op_thread_count'))
+	apply_state_item('execution_inter_op_thread_count', args.get('execution_inter_op_thread_count'))
+	apply_state_item('execution_session_concurrency', args.get('execution_session_concurrency'))
+	apply_state_item('execution_batch_size', args.get('execution_batch_size'))
+	apply_state_item('execution_batch_timeout', args.get('execution_batch_timeout'))
+	apply_state_item('execution_mode', args.get('execution_mode'))
+	apply_state_item('execution_graph_optimization', args.get('execution_graph_optimization'))
+	apply_state_item('execution_memory_optimizations', args.get('execution_memory_optimizations'))
+	apply_state_item('execution_model_cache', args.get('execution_model_cache'))
+	apply_state_item('execution_model_precision', args.get('execution_model_precision'))
 	# download
 	apply_state_item('download_providers', args.get('download_providers'))
 	apply_state_item('download_scope', args.get('download_scope'))
 	# memory
 	apply_state_item('video_memory_strategy', args.get('video_memory_strategy'))
 	apply_state_item('system_memory_limit', args.get('system_memory_limit'))
+	apply_state_item('face_store_memory_limit', args.get('face_store_memory_limit'))
 	# misc
 	apply_state_item('log_level', args.get('log_level'))
+	# quantize
+	apply_state_item('quantize_model_names', args.get('quantize_model_names'))
+	apply_state_item('quantize_method', args.get('quantize_method'))
+	apply_state_item('quantize_calibration_pattern', args.get('quantize_calibration_pattern'))
+	apply_state_item('quantize_min_similarity', args.get('quantize_min_similarity'))
+	apply_state_item('quantize_min_psnr', args.get('quantize_min_psnr'))
 	# jobs
 	apply_state_item('job_id', args.get('job_id'))
 	apply_state_item('job_status', args.get('job_status'))
 	apply_state_item('step_index', args.get('step_index'))
+	apply_state_item('job_runner_workers', args.get('job_runner_workers'))
+	apply_state_item('job_api_port', args.get('job_api_port'))
@@ -2,7 +2,7 @@ import logging
 from typing import List, Sequence
 
 from facefusion.common_helper import create_float_range, create_int_range
-from facefusion.typing import Angle, DownloadProvider, DownloadProviderSet, DownloadScope, ExecutionProvider, ExecutionProviderSet, FaceDetectorModel, FaceDetectorSet, FaceLandmarkerModel, FaceMaskRegion, FaceMaskRegionSet, FaceMaskType, FaceOccluderModel, FaceParserModel, FaceSelectorMode, FaceSelectorOrder, Gender, JobStatus, LogLevel, LogLevelSet, OutputAudioEncoder, OutputVideoEncoder, OutputVideoPreset, Race, Score, TempFrameFormat, UiWorkflow, VideoMemoryStrategy
+from facefusion.typing import Angle, DownloadProvider, DownloadProviderSet, DownloadScope, ExecutionGraphOptimization, ExecutionMemoryOptimization, ExecutionMode, ExecutionModelPrecision, ExecutionProvider, ExecutionProviderSet, ExecutionWorkerStrategy, FaceDetectorAngleStrategy, FaceDetectorModel, FaceDetectorSet, FaceLandmarkerModel, FaceMaskRegion, FaceMaskRegionSet, FaceMaskType, FaceOccluderModel, FaceParserModel, FaceSelectorMode, FaceSelectorOrder, FrameExtractionStrategy, Gender, JobStatus, LogLevel, LogLevelSet, OutputAudioEncoder, OutputVideoEncoder, OutputVideoPreset, ProcessorStrategy, QuantizeMethod, Race, Score, TempFrameFormat, UiWorkflow, VideoMemoryStrategy, VideoMergeStrategy
 
 face_detector_set : FaceDetectorSet =\
 {
@@ -12,6 +12,7 @@ face_detector_set : FaceDetectorSet =\
 	'yoloface': [ '640x640' ]
 }
 face_detector_models : List[FaceDetectorModel] = list(face_detector_set.keys())
+face_detector_angle_strategies : List[FaceDetectorAngleStrategy] = [ 'full', 'adaptive' ]
 face_landmarker_models : List[FaceLandmarkerModel] = [ 'many', '2dfan4', 'peppa_wutz' ]
 face_selector_modes : List[FaceSelectorMode] = [ 'many', 'one', 'reference' ]
 face_selector_orders : List[FaceSelectorOrder] = [ 'left-right', 'right-left', 'top-bottom', 'bottom-top', 'small-large', 'large-small', 'best-worst', 'worst-best' ]
@@ -35,13 +36,17 @@ face_mask_region_set : FaceMaskRegionSet =\
 }
 face_mask_regions : List[FaceMaskRegion] = list(face_mask_region_set.keys())
 temp_frame_formats : List[TempFrameFormat] = [ 'bmp', 'jpg', 'png' ]
+frame_extraction_strategies : List[FrameExtractionStrategy] = [ 'disk', 'pipe' ]
 output_audio_encoders : List[OutputAudioEncoder] = [ 'aac', 'libmp3lame', 'libopus', 'libvorbis' ]
 output_video_encoders : List[OutputVideoEncoder] = [ 'libx264', 'libx265', 'libvpx-vp9', 'h264_nvenc', 'hevc_nvenc', 'h264_amf', 'hevc_amf', 'h264_qsv', 'hevc_qsv', 'h264_videotoolbox', 'hevc_videotoolbox' ]
 output_video_presets : List[OutputVideoPreset] = [ 'ultrafast', 'superfast', 'veryfast', 'faster', 'fast', 'medium', 'slow', 'slower', 'veryslow' ]
+video_merge_strategies : List[VideoMergeStrategy] = [ 'disk', 'pipe' ]
 
 image_template_sizes : List[float] = [ 0.25, 0.5, 0.75, 1, 1.5, 2, 2.5, 3, 3.5, 4 ]
 video_template_sizes : List[int] = [ 240, 360, 480, 540, 720, 1080, 1440, 2160, 4320 ]
 
+processor_strategies : List[ProcessorStrategy] = [ 'sequential', 'fused' ]
+
 execution_provider_set : ExecutionProviderSet =\
 {
 	'cpu': 'CPUExecutionProvider',
@@ -53,6 +58,11 @@ execution_provider_set : ExecutionProviderSet =\
 	'tensorrt': 'TensorrtExecutionProvider'
 }
 execution_providers : List[ExecutionProvider] = list(execution_provider_set.keys())
+execution_worker_strategies : List[ExecutionWorkerStrategy] = [ 'thread', 'process' ]
+execution_modes : List[ExecutionMode] = [ 'sequential', 'parallel' ]
+execution_graph_optimizations : List[ExecutionGraphOptimization] = [ 'disable', 'basic', 'extended', 'all' ]
+execution_memory_optimizations : List[ExecutionMemoryOptimization] = [ 'arena', 'pattern' ]
+execution_model_precisions : List[ExecutionModelPrecision] = [ 'fp32', 'int8' ]
 download_provider_set : DownloadProviderSet =\
 {
 	'github':
@@ -85,9 +95,21 @@ job_statuses : List[JobStatus] = [ 'drafted', 'queued', 'completed', 'failed' ]
 
 execution_thread_count_range : Sequence[int] = create_int_range(1, 32, 1)
 execution_queue_count_range : Sequence[int] = create_int_range(1, 4, 1)
+execution_op_thread_count_range : Sequence[int] = create_int_range(0, 32, 1)
+execution_session_concurrency_range : Sequence[int] = create_int_range(0, 32, 1)
+execution_batch_size_range : Sequence[int] = create_int_range(1, 64, 1)
+execution_batch_timeout_range : Sequence[int] = create_int_range(0, 20, 1)
+quantize_methods : List[QuantizeMethod] = [ 'dynamic', 'static' ]
+quantize_min_similarity_range : Sequence[float] = create_float_range(0.9, 1.0, 0.01)
+quantize_min_psnr_range : Sequence[int] = create_int_range(20, 60, 1)
+execution_shard_count_range : Sequence[int] = create_int_range(1, 16, 1)
 system_memory_limit_range : Sequence[int] = create_int_range(0, 128, 4)
+face_store_memory_limit_range : Sequence[int] = create_int_range(0, 4096, 128)
+job_runner_workers_range : Sequence[int] = create_int_range(1, 16, 1)
 face_detector_angles : Sequence[Angle] = create_int_range(0, 270, 90)
 face_detector_score_range : Sequence[Score] = create_float_range(0.0, 1.0, 0.05)
+face_detector_batch_size_range : Sequence[int] = create_int_range(1, 32, 1)
+face_tracker_interval_range : Sequence[int] = create_int_range(1, 30, 1)
 face_landmarker_score_range : Sequence[Score] = create_float_range(0.0, 1.0, 0.05)
 face_mask_blur_range : Sequence[float] = create_float_range(0.0, 1.0, 0.05)
 face_mask_padding_range : Sequence[int] = create_int_range(0, 100, 1)
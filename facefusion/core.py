@@ -2,7 +2,9 @@ import itertools
 import shutil
 import signal
 import sys
-from time import time
+from time import sleep, time
+from types import ModuleType
+from typing import List
 
 import numpy
 
@@ -15,18 +17,19 @@ from facefusion.exit_helper import conditional_exit, graceful_exit, hard_exit
 from facefusion.face_analyser import get_average_face, get_many_faces, get_one_face
 from facefusion.face_selector import sort_and_filter_faces
 from facefusion.face_store import append_reference_face, clear_reference_faces, get_reference_faces
-from facefusion.ffmpeg import copy_image, extract_frames, finalize_image, merge_video, replace_audio, restore_audio
-from facefusion.filesystem import filter_audio_paths, is_image, is_video, list_directory, resolve_file_pattern
-from facefusion.jobs import job_helper, job_manager, job_runner
+from facefusion.face_tracker import clear_face_tracker
+from facefusion.ffmpeg import copy_image, extract_frames, finalize_image, close_pipe_video, merge_video, pipe_frames, pipe_video, replace_audio, restore_audio, write_pipe_video
+from facefusion.filesystem import filter_audio_paths, filter_image_paths, is_file, is_image, is_video, list_directory, resolve_file_pattern
+from facefusion.jobs import job_api, job_checkpoint, job_helper, job_manager, job_runner, job_shard
 from facefusion.jobs.job_list import compose_job_list
 from facefusion.memory import limit_system_memory
-from facefusion.processors.core import get_processors_modules
+from facefusion.processors.core import get_processors_modules, multi_process_frames, multi_process_pipe_frames, process_chain_frames
 from facefusion.program import create_program
 from facefusion.program_helper import validate_args
 from facefusion.statistics import conditional_log_statistics
 from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_file_path, get_temp_frame_paths, move_temp_file
 from facefusion.typing import Args, ErrorCode
-from facefusion.vision import get_video_frame, pack_resolution, read_image, read_static_images, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, unpack_resolution
+from facefusion.vision import count_trim_frame_total, get_video_frame, pack_resolution, read_image, read_static_images, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, unpack_resolution
 
 
 def cli() -> None:
@@ -53,6 +56,9 @@ def route(args : Args) -> None:
 	if state_manager.get_item('command') == 'force-download':
 		error_code = force_download()
 		return conditional_exit(error_code)
+	if state_manager.get_item('command') == 'quantize-models':
+		error_code = quantize_models()
+		return conditional_exit(error_code)
 	if state_manager.get_item('command') in [ 'job-list', 'job-create', 'job-submit', 'job-submit-all', 'job-delete', 'job-delete-all', 'job-add-step', 'job-remix-step', 'job-insert-step', 'job-remove-step' ]:
 		if not job_manager.init_jobs(state_manager.get_item('jobs_path')):
 			hard_exit(1)
@@ -80,7 +86,7 @@ def route(args : Args) -> None:
 			hard_exit(1)
 		error_core = process_batch(args)
 		hard_exit(error_core)
-	if state_manager.get_item('command') in [ 'job-run', 'job-run-all', 'job-retry', 'job-retry-all' ]:
+	if state_manager.get_item('command') in [ 'job-run', 'job-run-all', 'job-retry', 'job-retry-all', 'job-daemon' ]:
 		if not job_manager.init_jobs(state_manager.get_item('jobs_path')):
 			hard_exit(1)
 		error_code = route_job_runner()
@@ -122,7 +128,7 @@ def processors_pre_check() -> bool:
 	return True
 
 
-def force_download() -> ErrorCode:
+def get_model_modules() -> List[ModuleType]:
 	common_modules =\
 	[
 		content_analyser,
@@ -135,8 +141,11 @@ def force_download() -> ErrorCode:
 	]
 	available_processors = [ file.get('name') for file in list_directory('facefusion/processors/modules') ]
 	processor_modules = get_processors_modules(available_processors)
+	return common_modules + processor_modules
 
-	for module in common_modules + processor_modules:
+
+def force_download() -> ErrorCode:
+	for module in get_model_modules():
 		if hasattr(module, 'create_static_model_set'):
 			for model in module.create_static_model_set(state_manager.get_item('download_scope')).values():
 				model_hashes = model.get('hashes')
@@ -149,6 +158,39 @@ def force_download() -> ErrorCode:
 	return 0
 
 
+def quantize_models() -> ErrorCode:
+	import facefusion.model_quantizer as model_quantizer
+
+	calibration_paths = filter_image_paths(resolve_file_pattern(state_manager.get_item('quantize_calibration_pattern')))
+	calibration_vision_frames = read_static_images(calibration_paths)
+	model_paths = []
+
+	if not calibration_vision_frames:
+		logger.error(wording.get('choose_calibration_frames'), __name__)
+		return 1
+	if not face_classifier.pre_check() or not face_detector.pre_check() or not face_landmarker.pre_check() or not face_recognizer.pre_check():
+		return 1
+	calibration_faces_set = [ get_many_faces([ calibration_vision_frame ]) for calibration_vision_frame in calibration_vision_frames ]
+
+	for module in get_model_modules():
+		if hasattr(module, 'create_static_model_set'):
+			for model_name, model in module.create_static_model_set('full').items():
+				model_hashes = model.get('hashes')
+				model_sources = model.get('sources')
+
+				if model_name in state_manager.get_item('quantize_model_names') and model_hashes and model_sources:
+					if not conditional_download_hashes(model_hashes) or not conditional_download_sources(model_sources):
+						return 1
+					for model_source_name, model_source in model_sources.items():
+						model_path = model_source.get('path')
+
+						if model_path not in model_paths:
+							model_inputs = model_quantizer.collect_model_inputs(module, model_name, model_source_name, model_path, calibration_vision_frames, calibration_faces_set)
+							model_quantizer.quantize_model(model_path, model_inputs)
+							model_paths.append(model_path)
+	return 0
+
+
 def route_job_manager(args : Args) -> ErrorCode:
 	if state_manager.get_item('command') == 'job-list':
 		job_headers, job_contents = compose_job_list(state_manager.get_item('job_status'))
@@ -230,7 +272,7 @@ def route_job_runner() -> ErrorCode:
 		return 1
 	if state_manager.get_item('command') == 'job-run-all':
 		logger.info(wording.get('running_jobs'), __name__)
-		if job_runner.run_jobs(process_step):
+		if job_runner.run_jobs(process_step, state_manager.get_item('job_runner_workers')):
 			logger.info(wording.get('processing_jobs_succeed'), __name__)
 			return 0
 		logger.info(wording.get('processing_jobs_failed'), __name__)
@@ -244,14 +286,49 @@ def route_job_runner() -> ErrorCode:
 		return 1
 	if state_manager.get_item('command') == 'job-retry-all':
 		logger.info(wording.get('retrying_jobs'), __name__)
-		if job_runner.retry_jobs(process_step):
+		if job_runner.retry_jobs(process_step, state_manager.get_item('job_runner_workers')):
 			logger.info(wording.get('processing_jobs_succeed'), __name__)
 			return 0
 		logger.info(wording.get('processing_jobs_failed'), __name__)
 		return 1
+	if state_manager.get_item('command') == 'job-daemon':
+		logger.info(wording.get('watching_jobs'), __name__)
+		if state_manager.get_item('video_memory_strategy') == 'strict':
+			logger.info(wording.get('video_memory_strategy_overridden'), __name__)
+			state_manager.set_item('video_memory_strategy', 'tolerant')
+		if state_manager.get_item('job_api_port'):
+			job_api.start_job_api(state_manager.get_item('job_api_port'))
+		while True:
+			for job_id in job_manager.find_job_ids('queued'):
+				if not job_manager.is_job_locked(job_id) and not has_job_processors(job_id):
+					logger.error(wording.get('processing_job_failed').format(job_id = job_id), __name__)
+					if job_manager.lock_job(job_id):
+						job_manager.set_steps_status(job_id, 'failed')
+						job_manager.move_job_file(job_id, 'failed')
+						job_manager.unlock_job(job_id)
+				if not job_manager.is_job_locked(job_id) and job_id in job_manager.find_job_ids('queued'):
+					logger.info(wording.get('running_job').format(job_id = job_id), __name__)
+					job_api.init_job_progress(job_id)
+					if job_runner.run_job(job_id, process_step):
+						logger.info(wording.get('processing_job_succeed').format(job_id = job_id), __name__)
+					else:
+						logger.info(wording.get('processing_job_failed').format(job_id = job_id), __name__)
+					job_api.init_job_progress(None)
+			sleep(1)
 	return 2
 
 
+def has_job_processors(job_id : str) -> bool:
+	available_processors = [ file.get('name') for file in list_directory('facefusion/processors/modules') ]
+
+	for step in job_manager.get_steps(job_id):
+		for processor in step.get('args').get('processors') or []:
+			if processor not in available_processors:
+				logger.error(wording.get('processor_not_loaded').format(processor = processor), __name__)
+				return False
+	return True
+
+
 def process_headless(args : Args) -> ErrorCode:
 	job_id = job_helper.suggest_job_id('headless')
 	step_args = reduce_step_args(args)
@@ -292,15 +369,21 @@ def process_batch(args : Args) -> ErrorCode:
 
 def process_step(job_id : str, step_index : int, step_args : Args) -> bool:
 	clear_reference_faces()
+	clear_face_tracker()
 	step_total = job_manager.count_step_total(job_id)
+	job_checkpoint.init_checkpoint(job_id, step_index, step_args)
 	step_args.update(collect_job_args())
 	apply_args(step_args, state_manager.set_item)
 
-	logger.info(wording.get('processing_step').format(step_current = step_index + 1, step_total = step_total), __name__)
-	if common_pre_check() and processors_pre_check():
-		error_code = conditional_process()
-		return error_code == 0
-	return False
+	try:
+		logger.info(wording.get('processing_step').format(step_current = step_index + 1, step_total = step_total), __name__)
+		if common_pre_check() and processors_pre_check():
+			error_code = conditional_process()
+			if error_code == 0:
+				return job_checkpoint.clear_checkpoint()
+		return False
+	finally:
+		job_checkpoint.release_checkpoint(job_id, step_index)
 
 
 def conditional_process() -> ErrorCode:
@@ -393,49 +476,118 @@ def process_video(start_time : float) -> ErrorCode:
 	if analyse_video(state_manager.get_item('target_path'), trim_frame_start, trim_frame_end):
 		return 3
 	# clear temp
-	logger.debug(wording.get('clearing_temp'), __name__)
-	clear_temp_directory(state_manager.get_item('target_path'))
+	if job_checkpoint.has_checkpoint():
+		logger.info(wording.get('resuming_checkpoint'), __name__)
+	else:
+		logger.debug(wording.get('clearing_temp'), __name__)
+		clear_temp_directory(state_manager.get_item('target_path'))
 	# create temp
 	logger.debug(wording.get('creating_temp'), __name__)
 	create_temp_directory(state_manager.get_item('target_path'))
+	if not job_checkpoint.verify_frame_progress(state_manager.get_item('target_path')):
+		logger.debug(wording.get('resetting_checkpoint'), __name__)
 	# extract frames
 	process_manager.start()
 	temp_video_resolution = pack_resolution(restrict_video_resolution(state_manager.get_item('target_path'), unpack_resolution(state_manager.get_item('output_video_resolution'))))
 	temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
-	logger.info(wording.get('extracting_frames').format(resolution = temp_video_resolution, fps = temp_video_fps), __name__)
-	if extract_frames(state_manager.get_item('target_path'), temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end):
-		logger.debug(wording.get('extracting_frames_succeed'), __name__)
-	else:
-		if is_process_stopping():
+	if state_manager.get_item('execution_shard_count') > 1 and 'lip_syncer' in state_manager.get_item('processors'):
+		logger.warn(wording.get('processing_shards_overridden'), __name__)
+	if state_manager.get_item('execution_shard_count') > 1 and 'lip_syncer' not in state_manager.get_item('processors'):
+		logger.info(wording.get('processing_shards').format(shard_total = state_manager.get_item('execution_shard_count')), __name__)
+		if job_shard.run_shards(state_manager.get_item('target_path'), trim_frame_start, trim_frame_end):
+			logger.debug(wording.get('processing_shards_succeed'), __name__)
+		else:
+			if is_process_stopping():
+				return 4
+			logger.error(wording.get('processing_shards_failed'), __name__)
 			process_manager.end()
-			return 4
-		logger.error(wording.get('extracting_frames_failed'), __name__)
-		process_manager.end()
-		return 1
-	# process frames
-	temp_frame_paths = get_temp_frame_paths(state_manager.get_item('target_path'))
-	if temp_frame_paths:
+			return 1
+	elif state_manager.get_item('frame_extraction_strategy') == 'pipe':
+		if state_manager.get_item('processor_strategy') == 'sequential':
+			logger.warn(wording.get('processor_strategy_overridden'), __name__)
+		logger.info(wording.get('piping_frames').format(resolution = temp_video_resolution, fps = temp_video_fps), __name__)
+		temp_frame_total = count_trim_frame_total(state_manager.get_item('target_path'), trim_frame_start, trim_frame_end)
+		target_vision_frames = pipe_frames(state_manager.get_item('target_path'), temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end)
+		if state_manager.get_item('video_merge_strategy') == 'pipe':
+			logger.info(wording.get('piping_video').format(resolution = state_manager.get_item('output_video_resolution'), fps = state_manager.get_item('output_video_fps')), __name__)
+			merge_process = pipe_video(state_manager.get_item('target_path'), state_manager.get_item('output_video_resolution'), state_manager.get_item('output_video_fps'))
+			try:
+				multi_process_pipe_frames(state_manager.get_item('source_paths'), target_vision_frames, temp_frame_total, lambda vision_frame: write_pipe_video(merge_process, vision_frame, state_manager.get_item('output_video_resolution')))
+			except BrokenPipeError:
+				target_vision_frames.close()
+				close_pipe_video(merge_process)
+				logger.error(wording.get('merging_video_failed'), __name__)
+				process_manager.end()
+				return 1
+			if close_pipe_video(merge_process):
+				logger.debug(wording.get('merging_video_succeed'), __name__)
+			else:
+				if is_process_stopping():
+					return 4
+				logger.error(wording.get('merging_video_failed'), __name__)
+				process_manager.end()
+				return 1
+		else:
+			multi_process_pipe_frames(state_manager.get_item('source_paths'), target_vision_frames, temp_frame_total, None)
 		for processor_module in get_processors_modules(state_manager.get_item('processors')):
-			logger.info(wording.get('processing'), processor_module.__name__)
-			processor_module.process_video(state_manager.get_item('source_paths'), temp_frame_paths)
 			processor_module.post_process()
 		if is_process_stopping():
 			return 4
+		if get_temp_frame_paths(state_manager.get_item('target_path')) or is_file(get_temp_file_path(state_manager.get_item('target_path'))):
+			logger.debug(wording.get('piping_frames_succeed'), __name__)
+		else:
+			logger.error(wording.get('piping_frames_failed'), __name__)
+			process_manager.end()
+			return 1
 	else:
-		logger.error(wording.get('temp_frames_not_found'), __name__)
-		process_manager.end()
-		return 1
+		if state_manager.get_item('video_merge_strategy') == 'pipe':
+			logger.warn(wording.get('video_merge_strategy_overridden'), __name__)
+		if state_manager.get_item('execution_worker_strategy') == 'process':
+			logger.warn(wording.get('execution_worker_strategy_overridden'), __name__)
+		logger.info(wording.get('extracting_frames').format(resolution = temp_video_resolution, fps = temp_video_fps), __name__)
+		if job_checkpoint.are_frames_extracted() and get_temp_frame_paths(state_manager.get_item('target_path')):
+			logger.info(wording.get('extracting_frames_skipped'), __name__)
+		elif extract_frames(state_manager.get_item('target_path'), temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end):
+			logger.debug(wording.get('extracting_frames_succeed'), __name__)
+			job_checkpoint.mark_frames_extracted()
+		else:
+			if is_process_stopping():
+				process_manager.end()
+				return 4
+			logger.error(wording.get('extracting_frames_failed'), __name__)
+			process_manager.end()
+			return 1
+		# process frames
+		temp_frame_paths = get_temp_frame_paths(state_manager.get_item('target_path'))
+		if temp_frame_paths:
+			if state_manager.get_item('processor_strategy') == 'fused':
+				logger.info(wording.get('processing'), __name__)
+				multi_process_frames(state_manager.get_item('source_paths'), temp_frame_paths, process_chain_frames)
+				for processor_module in get_processors_modules(state_manager.get_item('processors')):
+					processor_module.post_process()
+			else:
+				for processor_module in get_processors_modules(state_manager.get_item('processors')):
+					logger.info(wording.get('processing'), processor_module.__name__)
+					processor_module.process_video(state_manager.get_item('source_paths'), temp_frame_paths)
+					processor_module.post_process()
+			if is_process_stopping():
+				return 4
+		else:
+			logger.error(wording.get('temp_frames_not_found'), __name__)
+			process_manager.end()
+			return 1
 	# merge video
-	logger.info(wording.get('merging_video').format(resolution = state_manager.get_item('output_video_resolution'), fps = state_manager.get_item('output_video_fps')), __name__)
-	if merge_video(state_manager.get_item('target_path'), state_manager.get_item('output_video_resolution'), state_manager.get_item('output_video_fps')):
-		logger.debug(wording.get('merging_video_succeed'), __name__)
-	else:
-		if is_process_stopping():
+	if get_temp_frame_paths(state_manager.get_item('target_path')):
+		logger.info(wording.get('merging_video').format(resolution = state_manager.get_item('output_video_resolution'), fps = state_manager.get_item('output_video_fps')), __name__)
+		if merge_video(state_manager.get_item('target_path'), state_manager.get_item('output_video_resolution'), state_manager.get_item('output_video_fps')):
+			logger.debug(wording.get('merging_video_succeed'), __name__)
+		else:
+			if is_process_stopping():
+				process_manager.end()
+				return 4
+			logger.error(wording.get('merging_video_failed'), __name__)
 			process_manager.end()
-			return 4
-		logger.error(wording.get('merging_video_failed'), __name__)
-		process_manager.end()
-		return 1
+			return 1
 	# handle audio
 	if state_manager.get_item('skip_audio'):
 		logger.info(wording.get('skipping_audio'), __name__)
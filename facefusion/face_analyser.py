@@ -4,54 +4,58 @@ import numpy
 
 from facefusion import state_manager
 from facefusion.common_helper import get_first
-from facefusion.face_classifier import classify_face
-from facefusion.face_detector import detect_faces, detect_rotated_faces
+from facefusion.face_cache import get_cached_faces, set_many_cached_faces
+from facefusion.face_classifier import classify_faces
+from facefusion.face_detector import detect_adaptive_faces_batch, detect_angled_faces_batch
 from facefusion.face_helper import apply_nms, convert_to_face_landmark_5, estimate_face_angle, get_nms_threshold
-from facefusion.face_landmarker import detect_face_landmarks, estimate_face_landmark_68_5
-from facefusion.face_recognizer import calc_embedding
-from facefusion.face_store import get_static_faces, set_static_faces
-from facefusion.typing import BoundingBox, Face, FaceLandmark5, FaceLandmarkSet, FaceScoreSet, Score, VisionFrame
+from facefusion.face_landmarker import detect_face_landmarks_batch, estimate_face_landmarks_68_5
+from facefusion.face_recognizer import calc_embeddings
+from facefusion.face_store import create_frame_hash, get_static_faces, set_static_faces
+from facefusion.face_tracker import advance_track_faces, get_face_tracker, get_track_angle, set_track_faces, track_faces
+from facefusion.typing import Angle, BoundingBoxes, Face, FaceDetection, FaceLandmarkSet, FaceLandmarks5, FaceScoreSet, Scores, VisionFrame
 
 
-def create_faces(vision_frame : VisionFrame, bounding_boxes : List[BoundingBox], face_scores : List[Score], face_landmarks_5 : List[FaceLandmark5]) -> List[Face]:
+def create_faces(vision_frame : VisionFrame, bounding_boxes : BoundingBoxes, face_scores : Scores, face_landmarks_5 : FaceLandmarks5) -> List[Face]:
 	faces = []
 	nms_threshold = get_nms_threshold(state_manager.get_item('face_detector_model'), state_manager.get_item('face_detector_angles'))
 	keep_indices = apply_nms(bounding_boxes, face_scores, state_manager.get_item('face_detector_score'), nms_threshold)
 
-	for index in keep_indices:
-		bounding_box = bounding_boxes[index]
-		face_score = face_scores[index]
-		face_landmark_5 = face_landmarks_5[index]
-		face_landmark_5_68 = face_landmark_5
-		face_landmark_68_5 = estimate_face_landmark_68_5(face_landmark_5_68)
-		face_landmark_68 = face_landmark_68_5
-		face_landmark_score_68 = 0.0
-		face_angle = estimate_face_angle(face_landmark_68_5)
-
-		if state_manager.get_item('face_landmarker_score') > 0:
-			face_landmark_68, face_landmark_score_68 = detect_face_landmarks(vision_frame, bounding_box, face_angle)
-		if face_landmark_score_68 > state_manager.get_item('face_landmarker_score'):
-			face_landmark_5_68 = convert_to_face_landmark_5(face_landmark_68)
-
+	if len(keep_indices) == 0:
+		return faces
+	bounding_boxes = bounding_boxes[keep_indices]
+	face_scores = face_scores[keep_indices]
+	face_landmarks_5 = face_landmarks_5[keep_indices]
+	face_landmarks_68_5 = estimate_face_landmarks_68_5(face_landmarks_5)
+	face_angles = [ estimate_face_angle(face_landmark_68_5) for face_landmark_68_5 in face_landmarks_68_5 ]
+	face_landmarks_68 = [ (face_landmark_68_5, 0.0) for face_landmark_68_5 in face_landmarks_68_5 ]
+
+	if state_manager.get_item('face_landmarker_score') > 0:
+		face_landmarks_68 = detect_face_landmarks_batch(vision_frame, bounding_boxes, face_angles)
+	face_landmarks_5_68 = [ convert_to_face_landmark_5(face_landmark_68) if face_landmark_score_68 > state_manager.get_item('face_landmarker_score') else face_landmark_5 for face_landmark_5, (face_landmark_68, face_landmark_score_68) in zip(face_landmarks_5, face_landmarks_68) ]
+	embeddings = calc_embeddings(vision_frame, face_landmarks_5_68)
+	face_classes = classify_faces(vision_frame, face_landmarks_5_68)
+
+	for index, bounding_box in enumerate(bounding_boxes):
+		face_landmark_68, face_landmark_score_68 = face_landmarks_68[index]
+		embedding, normed_embedding = embeddings[index]
+		gender, age, race = face_classes[index]
 		face_landmark_set : FaceLandmarkSet =\
 		{
-			'5': face_landmark_5,
-			'5/68': face_landmark_5_68,
+			'5': face_landmarks_5[index],
+			'5/68': face_landmarks_5_68[index],
 			'68': face_landmark_68,
-			'68/5': face_landmark_68_5
+			'68/5': face_landmarks_68_5[index]
 		}
 		face_score_set : FaceScoreSet =\
 		{
-			'detector': face_score,
+			'detector': face_scores[index],
 			'landmarker': face_landmark_score_68
 		}
-		embedding, normed_embedding = calc_embedding(vision_frame, face_landmark_set.get('5/68'))
-		gender, age, race = classify_face(vision_frame, face_landmark_set.get('5/68'))
 		faces.append(Face(
 			bounding_box = bounding_box,
 			score_set = face_score_set,
 			landmark_set = face_landmark_set,
-			angle = face_angle,
+			angle = face_angles[index],
 			embedding = embedding,
 			normed_embedding = normed_embedding,
 			gender = gender,
@@ -93,32 +97,57 @@ def get_average_face(faces : List[Face]) -> Optional[Face]:
 	return None
 
 
-def get_many_faces(vision_frames : List[VisionFrame]) -> List[Face]:
+def get_many_faces(vision_frames : List[VisionFrame], frame_numbers : Optional[List[int]] = None) -> List[Face]:
 	many_faces : List[Face] = []
-
-	for vision_frame in vision_frames:
-		if numpy.any(vision_frame):
-			static_faces = get_static_faces(vision_frame)
-			if static_faces:
-				many_faces.extend(static_faces)
+	frame_faces : List[List[Face]] = [ [] for _ in vision_frames ]
+	detect_indices = []
+
+	frame_hashes = [ create_frame_hash(vision_frame) for vision_frame in vision_frames ]
+
+	for index, vision_frame in enumerate(vision_frames):
+		if frame_hashes[index]:
+			static_faces = get_static_faces(frame_hashes[index])
+			if static_faces is None:
+				static_faces = get_cached_faces(frame_hashes[index])
+				if static_faces is not None:
+					set_static_faces(frame_hashes[index], static_faces)
+			if static_faces is None and frame_numbers and state_manager.get_item('face_tracker_interval') > 1:
+				static_faces = track_faces(frame_numbers[index], vision_frame)
+				if static_faces is not None:
+					set_static_faces(frame_hashes[index], static_faces)
+			if static_faces is None:
+				detect_indices.append(index)
 			else:
-				all_bounding_boxes = []
-				all_face_scores = []
-				all_face_landmarks_5 = []
-
-				for face_detector_angle in state_manager.get_item('face_detector_angles'):
-					if face_detector_angle == 0:
-						bounding_boxes, face_scores, face_landmarks_5 = detect_faces(vision_frame)
-					else:
-						bounding_boxes, face_scores, face_landmarks_5 = detect_rotated_faces(vision_frame, face_detector_angle)
-					all_bounding_boxes.extend(bounding_boxes)
-					all_face_scores.extend(face_scores)
-					all_face_landmarks_5.extend(face_landmarks_5)
-
-				if all_bounding_boxes and all_face_scores and all_face_landmarks_5 and state_manager.get_item('face_detector_score') > 0:
-					faces = create_faces(vision_frame, all_bounding_boxes, all_face_scores, all_face_landmarks_5)
-
-					if faces:
-						many_faces.extend(faces)
-						set_static_faces(vision_frame, faces)
+				frame_faces[index] = static_faces
+				if frame_numbers and state_manager.get_item('face_tracker_interval') > 1 and not get_face_tracker(frame_numbers[index]):
+					advance_track_faces(frame_numbers[index], vision_frame, static_faces)
+
+	if detect_indices:
+		detect_vision_frames = [ vision_frames[index] for index in detect_indices ]
+		track_angle = get_track_angle(frame_numbers[detect_indices[0]]) if frame_numbers else 0
+
+		for index, (all_bounding_boxes, all_face_scores, all_face_landmarks_5) in zip(detect_indices, detect_many_faces(detect_vision_frames, track_angle)):
+			if len(all_bounding_boxes) > 0 and len(all_face_scores) > 0 and len(all_face_landmarks_5) > 0 and state_manager.get_item('face_detector_score') > 0:
+				faces = create_faces(vision_frames[index], all_bounding_boxes, all_face_scores, all_face_landmarks_5)
+
+				if faces:
+					frame_faces[index] = faces
+			set_static_faces(frame_hashes[index], frame_faces[index])
+			if frame_numbers and state_manager.get_item('face_tracker_interval') > 1:
+				set_track_faces(frame_numbers[index], vision_frames[index], frame_faces[index])
+
+		if frame_numbers:
+			set_many_cached_faces([ frame_hashes[index] for index in detect_indices ], [ frame_faces[index] for index in detect_indices ])
+
+	for faces in frame_faces:
+		many_faces.extend(faces)
 	return many_faces
+
+
+def detect_many_faces(vision_frames : List[VisionFrame], track_angle : Angle) -> List[FaceDetection]:
+	face_detector_angles = state_manager.get_item('face_detector_angles')
+
+	if state_manager.get_item('face_detector_angle_strategy') == 'adaptive':
+		face_detector_angles = sorted(face_detector_angles, key = lambda face_detector_angle: (face_detector_angle != track_angle, face_detector_angle != 0))
+		return detect_adaptive_faces_batch(vision_frames, face_detector_angles)
+	return detect_angled_faces_batch(vision_frames, face_detector_angles)
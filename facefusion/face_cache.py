@@ -0,0 +1,131 @@
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+import numpy
+
+from facefusion import face_classifier, face_recognizer, state_manager
+from facefusion.inference_manager import resolve_model_path
+from facefusion.typing import Face, ModelOptions
+
+FACE_CACHE_CONNECTIONS : Dict[str, sqlite3.Connection] = {}
+FACE_CACHE_LOCK : threading.Lock = threading.Lock()
+
+
+def get_face_cache_connection() -> Optional[sqlite3.Connection]:
+	face_cache_path = state_manager.get_item('face_cache_path')
+
+	if face_cache_path:
+		with FACE_CACHE_LOCK:
+			if face_cache_path not in FACE_CACHE_CONNECTIONS:
+				os.makedirs(os.path.dirname(os.path.abspath(face_cache_path)), exist_ok = True)
+				face_cache_connection = sqlite3.connect(face_cache_path, timeout = 30, isolation_level = None, check_same_thread = False)
+				face_cache_connection.execute('PRAGMA journal_mode = WAL')
+				face_cache_connection.execute('CREATE TABLE IF NOT EXISTS faces (face_key TEXT PRIMARY KEY, faces BLOB NOT NULL)')
+				FACE_CACHE_CONNECTIONS[face_cache_path] = face_cache_connection
+			return FACE_CACHE_CONNECTIONS.get(face_cache_path)
+	return None
+
+
+def get_cached_faces(frame_hash : str) -> Optional[List[Face]]:
+	face_cache_connection = get_face_cache_connection()
+
+	if face_cache_connection:
+		with FACE_CACHE_LOCK:
+			face_row = face_cache_connection.execute('SELECT faces FROM faces WHERE face_key = ?', (create_face_key(frame_hash),)).fetchone()
+		if face_row:
+			return unpack_faces(face_row[0])
+	return None
+
+
+def set_cached_faces(frame_hash : str, faces : List[Face]) -> None:
+	set_many_cached_faces([ frame_hash ], [ faces ])
+
+
+def set_many_cached_faces(frame_hashes : List[str], many_faces : List[List[Face]]) -> None:
+	face_cache_connection = get_face_cache_connection()
+
+	if face_cache_connection:
+		face_rows = [ (create_face_key(frame_hash), pack_faces(faces)) for frame_hash, faces in zip(frame_hashes, many_faces) if frame_hash ]
+
+		with FACE_CACHE_LOCK:
+			face_cache_connection.execute('BEGIN')
+			face_cache_connection.executemany('INSERT OR REPLACE INTO faces (face_key, faces) VALUES (?, ?)', face_rows)
+			face_cache_connection.execute('COMMIT')
+
+
+def create_face_key(frame_hash : str) -> str:
+	face_analyser_set =\
+	{
+		'face_detector_model': state_manager.get_item('face_detector_model'),
+		'face_detector_size': state_manager.get_item('face_detector_size'),
+		'face_detector_angles': state_manager.get_item('face_detector_angles'),
+		'face_detector_angle_strategy': state_manager.get_item('face_detector_angle_strategy'),
+		'face_detector_score': state_manager.get_item('face_detector_score'),
+		'face_landmarker_model': state_manager.get_item('face_landmarker_model'),
+		'face_landmarker_score': state_manager.get_item('face_landmarker_score'),
+		'face_classifier_model': resolve_model_names(face_classifier.get_model_options()),
+		'face_recognizer_model': resolve_model_names(face_recognizer.get_model_options()),
+		'execution_model_precision': state_manager.get_item('execution_model_precision')
+	}
+	face_analyser_hash = hashlib.sha1(json.dumps(face_analyser_set, sort_keys = True).encode()).hexdigest()[:16]
+	return face_analyser_hash + '-' + frame_hash
+
+
+def resolve_model_names(model_options : ModelOptions) -> List[str]:
+	return [ os.path.basename(resolve_model_path(model_source.get('path'), state_manager.get_item('execution_providers'))) for model_source in model_options.get('sources').values() ]
+
+
+def pack_faces(faces : List[Face]) -> bytes:
+	face_buffer = io.BytesIO()
+	numpy.savez(face_buffer,
+		bounding_boxes = numpy.array([ face.bounding_box for face in faces ]),
+		detector_scores = numpy.array([ face.score_set.get('detector') for face in faces ]),
+		landmarker_scores = numpy.array([ face.score_set.get('landmarker') for face in faces ]),
+		landmarks_5 = numpy.array([ face.landmark_set.get('5') for face in faces ]),
+		landmarks_5_68 = numpy.array([ face.landmark_set.get('5/68') for face in faces ]),
+		landmarks_68 = numpy.array([ face.landmark_set.get('68') for face in faces ]),
+		landmarks_68_5 = numpy.array([ face.landmark_set.get('68/5') for face in faces ]),
+		angles = numpy.array([ face.angle for face in faces ]),
+		embeddings = numpy.array([ face.embedding for face in faces ]),
+		normed_embeddings = numpy.array([ face.normed_embedding for face in faces ]),
+		genders = numpy.array([ face.gender for face in faces ]),
+		ages = numpy.array([ (face.age.start, face.age.stop) for face in faces ]),
+		races = numpy.array([ face.race for face in faces ])
+	)
+	return face_buffer.getvalue()
+
+
+def unpack_faces(face_bytes : bytes) -> List[Face]:
+	faces = []
+
+	with numpy.load(io.BytesIO(face_bytes), allow_pickle = False) as face_file:
+		face_arrays = dict(face_file)
+
+	for index in range(len(face_arrays.get('bounding_boxes'))):
+		faces.append(Face(
+			bounding_box = face_arrays.get('bounding_boxes')[index],
+			score_set =
+			{
+				'detector': float(face_arrays.get('detector_scores')[index]),
+				'landmarker': float(face_arrays.get('landmarker_scores')[index])
+			},
+			landmark_set =
+			{
+				'5': face_arrays.get('landmarks_5')[index],
+				'5/68': face_arrays.get('landmarks_5_68')[index],
+				'68': face_arrays.get('landmarks_68')[index],
+				'68/5': face_arrays.get('landmarks_68_5')[index]
+			},
+			angle = int(face_arrays.get('angles')[index]),
+			embedding = face_arrays.get('embeddings')[index],
+			normed_embedding = face_arrays.get('normed_embeddings')[index],
+			gender = str(face_arrays.get('genders')[index]),
+			age = range(*face_arrays.get('ages')[index].tolist()),
+			race = str(face_arrays.get('races')[index])
+		))
+	return faces
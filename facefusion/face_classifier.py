@@ -4,10 +4,10 @@ from typing import List, Tuple
 import numpy
 
 from facefusion import inference_manager
+from facefusion.common_helper import get_first
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_helper import warp_face_by_face_landmark_5
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.typing import Age, DownloadScope, FaceLandmark5, Gender, InferencePool, ModelOptions, ModelSet, Race, VisionFrame
 
 
@@ -62,33 +62,38 @@ def pre_check() -> bool:
 
 
 def classify_face(temp_vision_frame : VisionFrame, face_landmark_5 : FaceLandmark5) -> Tuple[Gender, Age, Race]:
+	return get_first(classify_faces(temp_vision_frame, [ face_landmark_5 ]))
+
+
+def classify_faces(temp_vision_frame : VisionFrame, face_landmarks_5 : List[FaceLandmark5]) -> List[Tuple[Gender, Age, Race]]:
 	model_template = get_model_options().get('template')
 	model_size = get_model_options().get('size')
 	model_mean = get_model_options().get('mean')
 	model_standard_deviation = get_model_options().get('standard_deviation')
-	crop_vision_frame, _ = warp_face_by_face_landmark_5(temp_vision_frame, face_landmark_5, model_template, model_size)
-	crop_vision_frame = crop_vision_frame.astype(numpy.float32)[:, :, ::-1] / 255
-	crop_vision_frame -= model_mean
-	crop_vision_frame /= model_standard_deviation
-	crop_vision_frame = crop_vision_frame.transpose(2, 0, 1)
-	crop_vision_frame = numpy.expand_dims(crop_vision_frame, axis = 0)
-	gender_id, age_id, race_id = forward(crop_vision_frame)
-	gender = categorize_gender(gender_id[0])
-	age = categorize_age(age_id[0])
-	race = categorize_race(race_id[0])
-	return gender, age, race
-
-
-def forward(crop_vision_frame : VisionFrame) -> Tuple[List[int], List[int], List[int]]:
+	face_classes = []
+	crop_vision_frames = []
+
+	for face_landmark_5 in face_landmarks_5:
+		crop_vision_frame, _ = warp_face_by_face_landmark_5(temp_vision_frame, face_landmark_5, model_template, model_size)
+		crop_vision_frame = crop_vision_frame.astype(numpy.float32)[:, :, ::-1] / 255
+		crop_vision_frame -= model_mean
+		crop_vision_frame /= model_standard_deviation
+		crop_vision_frame = crop_vision_frame.transpose(2, 0, 1)
+		crop_vision_frames.append(numpy.expand_dims(crop_vision_frame, axis = 0))
+
+	for gender_id, age_id, race_id in forward(crop_vision_frames):
+		gender = categorize_gender(gender_id[0])
+		age = categorize_age(age_id[0])
+		race = categorize_race(race_id[0])
+		face_classes.append((gender, age, race))
+	return face_classes
+
+
+def forward(crop_vision_frames : List[VisionFrame]) -> List[Tuple[List[int], List[int], List[int]]]:
 	face_classifier = get_inference_pool().get('face_classifier')
 
-	with conditional_thread_semaphore():
-		race_id, gender_id, age_id = face_classifier.run(None,
-		{
-			'input': crop_vision_frame
-		})
-
-	return gender_id, age_id, race_id
+	predictions = inference_manager.run_brokered_batch(face_classifier, 'input', crop_vision_frames)
+	return [ (gender_id, age_id, race_id) for race_id, gender_id, age_id in predictions ]
 
 
 def categorize_gender(gender_id : int) -> Gender:
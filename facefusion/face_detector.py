@@ -3,13 +3,14 @@ from typing import List, Tuple
 import cv2
 import numpy
 from charset_normalizer.md import lru_cache
+from onnxruntime import InferenceSession
 
 from facefusion import inference_manager, state_manager
+from facefusion.common_helper import get_first
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
-from facefusion.face_helper import create_rotated_matrix_and_size, create_static_anchors, distance_to_bounding_box, distance_to_face_landmark_5, normalize_bounding_box, transform_bounding_box, transform_points
+from facefusion.face_helper import create_rotated_matrix_and_size, create_static_anchors, distance_to_bounding_box, distance_to_face_landmark_5, normalize_bounding_boxes, transform_bounding_boxes, transform_points
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import thread_semaphore
-from facefusion.typing import Angle, BoundingBox, Detection, DownloadScope, DownloadSet, FaceLandmark5, InferencePool, ModelSet, Score, VisionFrame
+from facefusion.typing import Angle, BoundingBoxes, Detection, DownloadScope, DownloadSet, FaceDetection, FaceLandmarks5, InferencePool, ModelSet, Scores, VisionFrame
 from facefusion.vision import resize_frame_resolution, unpack_resolution
 
 
@@ -112,197 +113,195 @@ def pre_check() -> bool:
 	return conditional_download_hashes(model_hashes) and conditional_download_sources(model_sources)
 
 
-def detect_faces(vision_frame : VisionFrame) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	all_bounding_boxes : List[BoundingBox] = []
-	all_face_scores : List[Score] = []
-	all_face_landmarks_5 : List[FaceLandmark5] = []
+def detect_faces(vision_frame : VisionFrame) -> FaceDetection:
+	return get_first(detect_faces_batch([ vision_frame ]))
+
+
+def detect_faces_batch(vision_frames : List[VisionFrame]) -> List[FaceDetection]:
+	face_detections = [ create_face_detection([], [], []) for _ in vision_frames ]
 
 	if state_manager.get_item('face_detector_model') in [ 'many', 'retinaface' ]:
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_retinaface(vision_frame, state_manager.get_item('face_detector_size'))
-		all_bounding_boxes.extend(bounding_boxes)
-		all_face_scores.extend(face_scores)
-		all_face_landmarks_5.extend(face_landmarks_5)
+		face_detections = merge_face_detections(face_detections, detect_with_retinaface_batch(vision_frames, state_manager.get_item('face_detector_size')))
 
 	if state_manager.get_item('face_detector_model') in [ 'many', 'scrfd' ]:
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_scrfd(vision_frame, state_manager.get_item('face_detector_size'))
-		all_bounding_boxes.extend(bounding_boxes)
-		all_face_scores.extend(face_scores)
-		all_face_landmarks_5.extend(face_landmarks_5)
+		face_detections = merge_face_detections(face_detections, detect_with_scrfd_batch(vision_frames, state_manager.get_item('face_detector_size')))
 
 	if state_manager.get_item('face_detector_model') in [ 'many', 'yoloface' ]:
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_yoloface(vision_frame, state_manager.get_item('face_detector_size'))
-		all_bounding_boxes.extend(bounding_boxes)
-		all_face_scores.extend(face_scores)
-		all_face_landmarks_5.extend(face_landmarks_5)
-
-	all_bounding_boxes = [ normalize_bounding_box(all_bounding_box) for all_bounding_box in all_bounding_boxes ]
-	return all_bounding_boxes, all_face_scores, all_face_landmarks_5
-
-
-def detect_rotated_faces(vision_frame : VisionFrame, angle : Angle) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	rotated_matrix, rotated_size = create_rotated_matrix_and_size(angle, vision_frame.shape[:2][::-1])
-	rotated_vision_frame = cv2.warpAffine(vision_frame, rotated_matrix, rotated_size)
-	rotated_inverse_matrix = cv2.invertAffineTransform(rotated_matrix)
-	bounding_boxes, face_scores, face_landmarks_5 = detect_faces(rotated_vision_frame)
-	bounding_boxes = [ transform_bounding_box(bounding_box, rotated_inverse_matrix) for bounding_box in bounding_boxes ]
-	face_landmarks_5 = [ transform_points(face_landmark_5, rotated_inverse_matrix) for face_landmark_5 in face_landmarks_5 ]
+		face_detections = merge_face_detections(face_detections, detect_with_yoloface_batch(vision_frames, state_manager.get_item('face_detector_size')))
+
+	return [ (normalize_bounding_boxes(bounding_boxes), face_scores, face_landmarks_5) for bounding_boxes, face_scores, face_landmarks_5 in face_detections ]
+
+
+def create_face_detection(bounding_boxes : List[BoundingBoxes], face_scores : List[Scores], face_landmarks_5 : List[FaceLandmarks5]) -> FaceDetection:
+	bounding_boxes = numpy.concatenate([ numpy.empty((0, 4)) ] + bounding_boxes)
+	face_scores = numpy.concatenate([ numpy.empty(0) ] + face_scores)
+	face_landmarks_5 = numpy.concatenate([ numpy.empty((0, 5, 2)) ] + face_landmarks_5)
 	return bounding_boxes, face_scores, face_landmarks_5
 
 
-def detect_with_retinaface(vision_frame : VisionFrame, face_detector_size : str) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	bounding_boxes = []
-	face_scores = []
-	face_landmarks_5 = []
-	feature_strides = [ 8, 16, 32 ]
-	feature_map_channel = 3
-	anchor_total = 2
+def merge_face_detections(face_detections : List[FaceDetection], temp_face_detections : List[FaceDetection]) -> List[FaceDetection]:
+	merged_face_detections = []
+
+	for (bounding_boxes, face_scores, face_landmarks_5), (temp_bounding_boxes, temp_face_scores, temp_face_landmarks_5) in zip(face_detections, temp_face_detections):
+		merged_face_detections.append(create_face_detection([ bounding_boxes, temp_bounding_boxes ], [ face_scores, temp_face_scores ], [ face_landmarks_5, temp_face_landmarks_5 ]))
+	return merged_face_detections
+
+
+def detect_rotated_faces(vision_frame : VisionFrame, angle : Angle) -> FaceDetection:
+	return get_first(detect_rotated_faces_batch([ vision_frame ], [ angle ]))
+
+
+def detect_rotated_faces_batch(vision_frames : List[VisionFrame], angles : List[Angle]) -> List[FaceDetection]:
+	rotated_vision_frames = []
+	rotated_inverse_matrices = []
+	face_detections = []
+
+	for vision_frame, angle in zip(vision_frames, angles):
+		rotated_matrix, rotated_size = create_rotated_matrix_and_size(angle, vision_frame.shape[:2][::-1])
+		rotated_inverse_matrices.append(cv2.invertAffineTransform(rotated_matrix))
+
+		if angle == 0:
+			rotated_vision_frames.append(vision_frame)
+		else:
+			rotated_vision_frames.append(cv2.warpAffine(vision_frame, rotated_matrix, rotated_size))
+
+	for (bounding_boxes, face_scores, face_landmarks_5), rotated_inverse_matrix, angle in zip(detect_faces_batch(rotated_vision_frames), rotated_inverse_matrices, angles):
+		if angle != 0 and len(bounding_boxes) > 0:
+			bounding_boxes = transform_bounding_boxes(bounding_boxes, rotated_inverse_matrix)
+			face_landmarks_5 = transform_points(face_landmarks_5.reshape(-1, 2), rotated_inverse_matrix).reshape(-1, 5, 2)
+		face_detections.append((bounding_boxes, face_scores, face_landmarks_5))
+	return face_detections
+
+
+def detect_angled_faces_batch(vision_frames : List[VisionFrame], angles : List[Angle]) -> List[FaceDetection]:
+	face_detections = []
+	temp_vision_frames = [ vision_frame for vision_frame in vision_frames for _ in angles ]
+	temp_angles = [ angle for _ in vision_frames for angle in angles ]
+	temp_face_detections = detect_rotated_faces_batch(temp_vision_frames, temp_angles)
+
+	for index in range(len(vision_frames)):
+		bounding_boxes, face_scores, face_landmarks_5 = zip(*temp_face_detections[index * len(angles):(index + 1) * len(angles)])
+		face_detections.append(create_face_detection(list(bounding_boxes), list(face_scores), list(face_landmarks_5)))
+	return face_detections
+
+
+def detect_adaptive_faces_batch(vision_frames : List[VisionFrame], angles : List[Angle]) -> List[FaceDetection]:
+	face_detections = detect_rotated_faces_batch(vision_frames, [ get_first(angles) ] * len(vision_frames))
+	detect_indices = [ index for index, (bounding_boxes, _, _) in enumerate(face_detections) if len(bounding_boxes) == 0 ]
+
+	if detect_indices and len(angles) > 1:
+		for index, face_detection in zip(detect_indices, detect_angled_faces_batch([ vision_frames[index] for index in detect_indices ], angles[1:])):
+			face_detections[index] = face_detection
+	return face_detections
+
+
+def detect_with_retinaface(vision_frame : VisionFrame, face_detector_size : str) -> FaceDetection:
+	return get_first(detect_with_retinaface_batch([ vision_frame ], face_detector_size))
+
+
+def detect_with_retinaface_batch(vision_frames : List[VisionFrame], face_detector_size : str) -> List[FaceDetection]:
 	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
-	temp_vision_frame = resize_frame_resolution(vision_frame, (face_detector_width, face_detector_height))
-	ratio_height = vision_frame.shape[0] / temp_vision_frame.shape[0]
-	ratio_width = vision_frame.shape[1] / temp_vision_frame.shape[1]
-	detect_vision_frame = prepare_detect_frame(temp_vision_frame, face_detector_size)
-	detection = forward_with_retinaface(detect_vision_frame)
+	temp_vision_frames = [ resize_frame_resolution(vision_frame, (face_detector_width, face_detector_height)) for vision_frame in vision_frames ]
+	detect_vision_frames = [ prepare_detect_frame(temp_vision_frame, face_detector_size) for temp_vision_frame in temp_vision_frames ]
+	detections = forward_with_retinaface(detect_vision_frames)
+	return decode_anchor_detections(vision_frames, temp_vision_frames, detections, face_detector_size)
 
-	for index, feature_stride in enumerate(feature_strides):
-		keep_indices = numpy.where(detection[index] >= state_manager.get_item('face_detector_score'))[0]
 
-		if numpy.any(keep_indices):
-			stride_height = face_detector_height // feature_stride
-			stride_width = face_detector_width // feature_stride
-			anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)
-			bounding_box_raw = detection[index + feature_map_channel] * feature_stride
-			face_landmark_5_raw = detection[index + feature_map_channel * 2] * feature_stride
-
-			for bounding_box in distance_to_bounding_box(anchors, bounding_box_raw)[keep_indices]:
-				bounding_boxes.append(numpy.array(
-				[
-					bounding_box[0] * ratio_width,
-					bounding_box[1] * ratio_height,
-					bounding_box[2] * ratio_width,
-					bounding_box[3] * ratio_height,
-				]))
-
-			for score in detection[index][keep_indices]:
-				face_scores.append(score[0])
-
-			for face_landmark_5 in distance_to_face_landmark_5(anchors, face_landmark_5_raw)[keep_indices]:
-				face_landmarks_5.append(face_landmark_5 * [ ratio_width, ratio_height ])
+def detect_with_scrfd(vision_frame : VisionFrame, face_detector_size : str) -> FaceDetection:
+	return get_first(detect_with_scrfd_batch([ vision_frame ], face_detector_size))
 
-	return bounding_boxes, face_scores, face_landmarks_5
+
+def detect_with_scrfd_batch(vision_frames : List[VisionFrame], face_detector_size : str) -> List[FaceDetection]:
+	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
+	temp_vision_frames = [ resize_frame_resolution(vision_frame, (face_detector_width, face_detector_height)) for vision_frame in vision_frames ]
+	detect_vision_frames = [ prepare_detect_frame(temp_vision_frame, face_detector_size) for temp_vision_frame in temp_vision_frames ]
+	detections = forward_with_scrfd(detect_vision_frames)
+	return decode_anchor_detections(vision_frames, temp_vision_frames, detections, face_detector_size)
 
 
-def detect_with_scrfd(vision_frame : VisionFrame, face_detector_size : str) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	bounding_boxes = []
-	face_scores = []
-	face_landmarks_5 = []
+def decode_anchor_detections(vision_frames : List[VisionFrame], temp_vision_frames : List[VisionFrame], detections : List[Detection], face_detector_size : str) -> List[FaceDetection]:
+	face_detections = []
 	feature_strides = [ 8, 16, 32 ]
 	feature_map_channel = 3
 	anchor_total = 2
 	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
-	temp_vision_frame = resize_frame_resolution(vision_frame, (face_detector_width, face_detector_height))
-	ratio_height = vision_frame.shape[0] / temp_vision_frame.shape[0]
-	ratio_width = vision_frame.shape[1] / temp_vision_frame.shape[1]
-	detect_vision_frame = prepare_detect_frame(temp_vision_frame, face_detector_size)
-	detection = forward_with_scrfd(detect_vision_frame)
 
-	for index, feature_stride in enumerate(feature_strides):
-		keep_indices = numpy.where(detection[index] >= state_manager.get_item('face_detector_score'))[0]
+	for vision_frame, temp_vision_frame, detection in zip(vision_frames, temp_vision_frames, detections):
+		bounding_boxes = []
+		face_scores = []
+		face_landmarks_5 = []
+		ratio_height = vision_frame.shape[0] / temp_vision_frame.shape[0]
+		ratio_width = vision_frame.shape[1] / temp_vision_frame.shape[1]
 
-		if numpy.any(keep_indices):
-			stride_height = face_detector_height // feature_stride
-			stride_width = face_detector_width // feature_stride
-			anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)
-			bounding_box_raw = detection[index + feature_map_channel] * feature_stride
-			face_landmark_5_raw = detection[index + feature_map_channel * 2] * feature_stride
-
-			for bounding_box in distance_to_bounding_box(anchors, bounding_box_raw)[keep_indices]:
-				bounding_boxes.append(numpy.array(
-				[
-					bounding_box[0] * ratio_width,
-					bounding_box[1] * ratio_height,
-					bounding_box[2] * ratio_width,
-					bounding_box[3] * ratio_height,
-				]))
-
-			for score in detection[index][keep_indices]:
-				face_scores.append(score[0])
-
-			for face_landmark_5 in distance_to_face_landmark_5(anchors, face_landmark_5_raw)[keep_indices]:
-				face_landmarks_5.append(face_landmark_5 * [ ratio_width, ratio_height ])
+		for index, feature_stride in enumerate(feature_strides):
+			keep_indices = numpy.where(detection[index] >= state_manager.get_item('face_detector_score'))[0]
 
-	return bounding_boxes, face_scores, face_landmarks_5
+			if numpy.any(keep_indices):
+				stride_height = face_detector_height // feature_stride
+				stride_width = face_detector_width // feature_stride
+				anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)
+				bounding_box_raw = detection[index + feature_map_channel] * feature_stride
+				face_landmark_5_raw = detection[index + feature_map_channel * 2] * feature_stride
+				bounding_boxes.append(distance_to_bounding_box(anchors, bounding_box_raw)[keep_indices] * [ ratio_width, ratio_height, ratio_width, ratio_height ])
+				face_scores.append(detection[index][keep_indices].ravel())
+				face_landmarks_5.append(distance_to_face_landmark_5(anchors, face_landmark_5_raw)[keep_indices] * [ ratio_width, ratio_height ])
 
+		face_detections.append(create_face_detection(bounding_boxes, face_scores, face_landmarks_5))
+	return face_detections
 
-def detect_with_yoloface(vision_frame : VisionFrame, face_detector_size : str) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	bounding_boxes = []
-	face_scores = []
-	face_landmarks_5 = []
-	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
-	temp_vision_frame = resize_frame_resolution(vision_frame, (face_detector_width, face_detector_height))
-	ratio_height = vision_frame.shape[0] / temp_vision_frame.shape[0]
-	ratio_width = vision_frame.shape[1] / temp_vision_frame.shape[1]
-	detect_vision_frame = prepare_detect_frame(temp_vision_frame, face_detector_size)
-	detection = forward_with_yoloface(detect_vision_frame)
-	detection = numpy.squeeze(detection).T
-	bounding_box_raw, score_raw, face_landmark_5_raw = numpy.split(detection, [ 4, 5 ], axis = 1)
-	keep_indices = numpy.where(score_raw > state_manager.get_item('face_detector_score'))[0]
-
-	if numpy.any(keep_indices):
-		bounding_box_raw, face_landmark_5_raw, score_raw = bounding_box_raw[keep_indices], face_landmark_5_raw[keep_indices], score_raw[keep_indices]
-
-		for bounding_box in bounding_box_raw:
-			bounding_boxes.append(numpy.array(
-			[
-				(bounding_box[0] - bounding_box[2] / 2) * ratio_width,
-				(bounding_box[1] - bounding_box[3] / 2) * ratio_height,
-				(bounding_box[0] + bounding_box[2] / 2) * ratio_width,
-				(bounding_box[1] + bounding_box[3] / 2) * ratio_height,
-			]))
-
-		face_scores = score_raw.ravel().tolist()
-		face_landmark_5_raw[:, 0::3] = (face_landmark_5_raw[:, 0::3]) * ratio_width
-		face_landmark_5_raw[:, 1::3] = (face_landmark_5_raw[:, 1::3]) * ratio_height
-
-		for face_landmark_5 in face_landmark_5_raw:
-			face_landmarks_5.append(numpy.array(face_landmark_5.reshape(-1, 3)[:, :2]))
 
-	return bounding_boxes, face_scores, face_landmarks_5
+def detect_with_yoloface(vision_frame : VisionFrame, face_detector_size : str) -> FaceDetection:
+	return get_first(detect_with_yoloface_batch([ vision_frame ], face_detector_size))
 
 
-def forward_with_retinaface(detect_vision_frame : VisionFrame) -> Detection:
-	face_detector = get_inference_pool().get('retinaface')
+def detect_with_yoloface_batch(vision_frames : List[VisionFrame], face_detector_size : str) -> List[FaceDetection]:
+	face_detections = []
+	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
+	temp_vision_frames = [ resize_frame_resolution(vision_frame, (face_detector_width, face_detector_height)) for vision_frame in vision_frames ]
+	detect_vision_frames = [ prepare_detect_frame(temp_vision_frame, face_detector_size) for temp_vision_frame in temp_vision_frames ]
+	detections = forward_with_yoloface(detect_vision_frames)
+
+	for vision_frame, temp_vision_frame, detection in zip(vision_frames, temp_vision_frames, detections):
+		bounding_boxes = []
+		face_scores = []
+		face_landmarks_5 = []
+		ratio_height = vision_frame.shape[0] / temp_vision_frame.shape[0]
+		ratio_width = vision_frame.shape[1] / temp_vision_frame.shape[1]
+		detection = numpy.squeeze(detection).T
+		bounding_box_raw, score_raw, face_landmark_5_raw = numpy.split(detection, [ 4, 5 ], axis = 1)
+		keep_indices = numpy.where(score_raw > state_manager.get_item('face_detector_score'))[0]
 
-	with thread_semaphore():
-		detection = face_detector.run(None,
-		{
-			'input': detect_vision_frame
-		})
+		if numpy.any(keep_indices):
+			bounding_box_raw, face_landmark_5_raw, score_raw = bounding_box_raw[keep_indices], face_landmark_5_raw[keep_indices], score_raw[keep_indices]
+			center_x, center_y, width, height = bounding_box_raw.T
+			bounding_boxes.append(numpy.column_stack([ center_x - width / 2, center_y - height / 2, center_x + width / 2, center_y + height / 2 ]) * [ ratio_width, ratio_height, ratio_width, ratio_height ])
+			face_scores.append(score_raw.ravel())
+			face_landmarks_5.append(face_landmark_5_raw.reshape(-1, 5, 3)[:, :, :2] * [ ratio_width, ratio_height ])
 
-	return detection
+		face_detections.append(create_face_detection(bounding_boxes, face_scores, face_landmarks_5))
+	return face_detections
 
 
-def forward_with_scrfd(detect_vision_frame : VisionFrame) -> Detection:
-	face_detector = get_inference_pool().get('scrfd')
+def forward_with_retinaface(detect_vision_frames : List[VisionFrame]) -> List[Detection]:
+	face_detector = get_inference_pool().get('retinaface')
+	return forward_batch(face_detector, detect_vision_frames)
 
-	with thread_semaphore():
-		detection = face_detector.run(None,
-		{
-			'input': detect_vision_frame
-		})
 
-	return detection
+def forward_with_scrfd(detect_vision_frames : List[VisionFrame]) -> List[Detection]:
+	face_detector = get_inference_pool().get('scrfd')
+	return forward_batch(face_detector, detect_vision_frames)
 
 
-def forward_with_yoloface(detect_vision_frame : VisionFrame) -> Detection:
+def forward_with_yoloface(detect_vision_frames : List[VisionFrame]) -> List[Detection]:
 	face_detector = get_inference_pool().get('yoloface')
+	return forward_batch(face_detector, detect_vision_frames)
 
-	with thread_semaphore():
-		detection = face_detector.run(None,
-		{
-			'input': detect_vision_frame
-		})
 
-	return detection
+def forward_batch(face_detector : InferenceSession, detect_vision_frames : List[VisionFrame]) -> List[Detection]:
+	with inference_manager.get_session_semaphore(face_detector):
+		detections = inference_manager.run_batch(face_detector, 'input', detect_vision_frames)
+
+	return detections
 
 
 def prepare_detect_frame(temp_vision_frame : VisionFrame, face_detector_size : str) -> VisionFrame:
@@ -5,7 +5,7 @@ import cv2
 import numpy
 from cv2.typing import Size
 
-from facefusion.typing import Anchors, Angle, BoundingBox, Distance, FaceDetectorModel, FaceLandmark5, FaceLandmark68, Mask, Matrix, Points, Scale, Score, Translation, VisionFrame, WarpTemplate, WarpTemplateSet
+from facefusion.typing import Anchors, Angle, BoundingBox, BoundingBoxes, Distance, FaceDetectorModel, FaceLandmark5, FaceLandmark68, Mask, Matrix, Points, Scale, Scores, Translation, VisionFrame, WarpTemplate, WarpTemplateSet
 
 WARP_TEMPLATES : WarpTemplateSet =\
 {
@@ -148,6 +148,11 @@ def transform_points(points : Points, matrix : Matrix) -> Points:
 	return points
 
 
+def normalize_bounding_boxes(bounding_boxes : BoundingBoxes) -> BoundingBoxes:
+	x1, y1, x2, y2 = bounding_boxes.T
+	return numpy.column_stack([ numpy.minimum(x1, x2), numpy.minimum(y1, y2), numpy.maximum(x1, x2), numpy.maximum(y1, y2) ])
+
+
 def transform_bounding_box(bounding_box : BoundingBox, matrix : Matrix) -> BoundingBox:
 	points = numpy.array(
 	[
@@ -162,6 +167,12 @@ def transform_bounding_box(bounding_box : BoundingBox, matrix : Matrix) -> Bound
 	return normalize_bounding_box(numpy.array([ x1, y1, x2, y2 ]))
 
 
+def transform_bounding_boxes(bounding_boxes : BoundingBoxes, matrix : Matrix) -> BoundingBoxes:
+	points = bounding_boxes[:, [ 0, 1, 2, 1, 2, 3, 0, 3 ]].reshape(-1, 2)
+	points = transform_points(points, matrix).reshape(-1, 4, 2)
+	return numpy.column_stack([ numpy.min(points, axis = 1), numpy.max(points, axis = 1) ])
+
+
 def distance_to_bounding_box(points : Points, distance : Distance) -> BoundingBox:
 	x1 = points[:, 0] - distance[:, 0]
 	y1 = points[:, 1] - distance[:, 1]
@@ -208,8 +219,8 @@ def estimate_face_angle(face_landmark_68 : FaceLandmark68) -> Angle:
 	return face_angle
 
 
-def apply_nms(bounding_boxes : List[BoundingBox], face_scores : List[Score], score_threshold : float, nms_threshold : float) -> Sequence[int]:
-	normed_bounding_boxes = [ (x1, y1, x2 - x1, y2 - y1) for (x1, y1, x2, y2) in bounding_boxes ]
+def apply_nms(bounding_boxes : BoundingBoxes, face_scores : Scores, score_threshold : float, nms_threshold : float) -> Sequence[int]:
+	normed_bounding_boxes = numpy.column_stack([ bounding_boxes[:, :2], bounding_boxes[:, 2:] - bounding_boxes[:, :2] ])
 	keep_indices = cv2.dnn.NMSBoxes(normed_bounding_boxes, face_scores, score_threshold = score_threshold, nms_threshold = nms_threshold)
 	return keep_indices
 
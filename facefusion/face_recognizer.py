@@ -1,14 +1,14 @@
 from functools import lru_cache
-from typing import Tuple
+from typing import List, Tuple
 
 import numpy
 
 from facefusion import inference_manager
+from facefusion.common_helper import get_first
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_helper import warp_face_by_face_landmark_5
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import conditional_thread_semaphore
-from facefusion.typing import DownloadScope, Embedding, FaceLandmark5, InferencePool, ModelOptions, ModelSet, VisionFrame
+from facefusion.typing import DownloadScope, Embedding, Face, FaceLandmark5, InferencePool, ModelInputs, ModelOptions, ModelSet, VisionFrame
 
 
 @lru_cache(maxsize = None)
@@ -60,25 +60,49 @@ def pre_check() -> bool:
 
 
 def calc_embedding(temp_vision_frame : VisionFrame, face_landmark_5 : FaceLandmark5) -> Tuple[Embedding, Embedding]:
+	return get_first(calc_embeddings(temp_vision_frame, [ face_landmark_5 ]))
+
+
+def calc_embeddings(temp_vision_frame : VisionFrame, face_landmarks_5 : List[FaceLandmark5]) -> List[Tuple[Embedding, Embedding]]:
 	model_template = get_model_options().get('template')
 	model_size = get_model_options().get('size')
-	crop_vision_frame, matrix = warp_face_by_face_landmark_5(temp_vision_frame, face_landmark_5, model_template, model_size)
+	embeddings = []
+	crop_vision_frames = []
+
+	for face_landmark_5 in face_landmarks_5:
+		crop_vision_frame, matrix = warp_face_by_face_landmark_5(temp_vision_frame, face_landmark_5, model_template, model_size)
+		crop_vision_frames.append(prepare_crop_frame(crop_vision_frame))
+
+	for embedding in forward(crop_vision_frames):
+		embedding = embedding.ravel()
+		normed_embedding = embedding / numpy.linalg.norm(embedding)
+		embeddings.append((embedding, normed_embedding))
+	return embeddings
+
+
+def create_calibration_inputs(model_name : str, model_source_name : str, vision_frame : VisionFrame, faces : List[Face]) -> List[ModelInputs]:
+	model_template = create_static_model_set('full').get(model_name).get('template')
+	model_size = create_static_model_set('full').get(model_name).get('size')
+	model_inputs = []
+
+	for face in faces:
+		crop_vision_frame, _ = warp_face_by_face_landmark_5(vision_frame, face.landmark_set.get('5/68'), model_template, model_size)
+		model_inputs.append(
+		{
+			'input': prepare_crop_frame(crop_vision_frame)
+		})
+	return model_inputs
+
+
+def prepare_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
 	crop_vision_frame = crop_vision_frame / 127.5 - 1
 	crop_vision_frame = crop_vision_frame[:, :, ::-1].transpose(2, 0, 1).astype(numpy.float32)
 	crop_vision_frame = numpy.expand_dims(crop_vision_frame, axis = 0)
-	embedding = forward(crop_vision_frame)
-	embedding = embedding.ravel()
-	normed_embedding = embedding / numpy.linalg.norm(embedding)
-	return embedding, normed_embedding
+	return crop_vision_frame
 
 
-def forward(crop_vision_frame : VisionFrame) -> Embedding:
+def forward(crop_vision_frames : List[VisionFrame]) -> List[Embedding]:
 	face_recognizer = get_inference_pool().get('face_recognizer')
 
-	with conditional_thread_semaphore():
-		embedding = face_recognizer.run(None,
-		{
-			'input': crop_vision_frame
-		})[0]
-
-	return embedding
+	predictions = inference_manager.run_brokered_batch(face_recognizer, 'input', crop_vision_frames)
+	return [ prediction[0] for prediction in predictions ]
@@ -1,24 +1,67 @@
-from typing import List
+from typing import Dict, List, Tuple
 
 import numpy
 
 from facefusion import state_manager
-from facefusion.typing import Face, FaceSelectorOrder, FaceSet, Gender, Race
+from facefusion.typing import Embeddings, Face, FaceSelectorOrder, FaceSet, Gender, Race, ReferenceGallery
+
+REFERENCE_GALLERIES : Dict[str, ReferenceGallery] = {}
 
 
 def find_similar_faces(faces : List[Face], reference_faces : FaceSet, face_distance : float) -> List[Face]:
 	similar_faces : List[Face] = []
 
 	if faces and reference_faces:
+		face_embeddings = numpy.stack([ face.normed_embedding for face in faces ])
+
 		for reference_set in reference_faces:
-			if not similar_faces:
-				for reference_face in reference_faces[reference_set]:
-					for face in faces:
-						if compare_faces(face, reference_face, face_distance):
-							similar_faces.append(face)
+			if not similar_faces and reference_faces.get(reference_set):
+				reference_gallery = get_reference_gallery(reference_set, reference_faces.get(reference_set))
+				face_distances = calc_face_distances(reference_gallery, face_embeddings)
+
+				for _, face_index in numpy.argwhere(face_distances < face_distance):
+					similar_faces.append(faces[face_index])
 	return similar_faces
 
 
+def map_similar_faces(faces : List[Face], reference_faces : List[Face], face_distance : float) -> List[Tuple[int, Face]]:
+	mapped_faces : List[Tuple[int, Face]] = []
+
+	if faces and reference_faces:
+		face_embeddings = numpy.stack([ face.normed_embedding for face in faces ])
+		reference_gallery = get_reference_gallery('mapping', reference_faces)
+		face_distances = calc_face_distances(reference_gallery, face_embeddings)
+
+		for face_index, face in enumerate(faces):
+			reference_index = numpy.argmin(face_distances[:, face_index])
+			if face_distances[reference_index, face_index] < face_distance:
+				mapped_faces.append((int(reference_index), face))
+	return mapped_faces
+
+
+def get_reference_gallery(reference_set : str, reference_faces : List[Face]) -> ReferenceGallery:
+	reference_gallery = REFERENCE_GALLERIES.get(reference_set)
+
+	if not reference_gallery or reference_gallery.get('reference_faces') is not reference_faces or len(reference_gallery.get('reference_embeddings')) != len(reference_faces):
+		reference_gallery = create_reference_gallery(reference_faces)
+		REFERENCE_GALLERIES[reference_set] = reference_gallery
+	return reference_gallery
+
+
+def create_reference_gallery(reference_faces : List[Face]) -> ReferenceGallery:
+	reference_embeddings = numpy.stack([ reference_face.normed_embedding for reference_face in reference_faces ])
+	return\
+	{
+		'reference_faces': reference_faces,
+		'reference_embeddings': reference_embeddings
+	}
+
+
+def calc_face_distances(reference_gallery : ReferenceGallery, face_embeddings : Embeddings) -> Embeddings:
+	reference_embeddings = reference_gallery.get('reference_embeddings')
+	return 1 - numpy.dot(reference_embeddings, face_embeddings.T)
+
+
 def compare_faces(face : Face, reference_face : Face, face_distance : float) -> bool:
 	current_face_distance = calc_face_distance(face, reference_face)
 	return current_face_distance < face_distance
@@ -1,40 +1,74 @@
 import hashlib
+import threading
+from collections import OrderedDict
 from typing import List, Optional
 
 import numpy
 
+from facefusion import state_manager
 from facefusion.typing import Face, FaceSet, FaceStore, VisionFrame
 
 FACE_STORE : FaceStore =\
 {
-	'static_faces': {},
+	'static_faces': OrderedDict(),
+	'static_faces_size': 0,
 	'reference_faces': {}
 }
+FACE_STORE_LOCK : threading.Lock = threading.Lock()
 
 
 def get_face_store() -> FaceStore:
 	return FACE_STORE
 
 
-def get_static_faces(vision_frame : VisionFrame) -> Optional[List[Face]]:
-	frame_hash = create_frame_hash(vision_frame)
-	if frame_hash in FACE_STORE['static_faces']:
-		return FACE_STORE['static_faces'][frame_hash]
+def get_static_faces(frame_hash : str) -> Optional[List[Face]]:
+	with FACE_STORE_LOCK:
+		if frame_hash in FACE_STORE['static_faces']:
+			FACE_STORE['static_faces'].move_to_end(frame_hash)
+			return FACE_STORE['static_faces'][frame_hash]
 	return None
 
 
-def set_static_faces(vision_frame : VisionFrame, faces : List[Face]) -> None:
-	frame_hash = create_frame_hash(vision_frame)
+def set_static_faces(frame_hash : str, faces : List[Face]) -> None:
 	if frame_hash:
-		FACE_STORE['static_faces'][frame_hash] = faces
+		with FACE_STORE_LOCK:
+			if frame_hash in FACE_STORE['static_faces']:
+				FACE_STORE['static_faces_size'] -= calc_faces_size(FACE_STORE['static_faces'].pop(frame_hash))
+			FACE_STORE['static_faces'][frame_hash] = faces
+			FACE_STORE['static_faces_size'] += calc_faces_size(faces)
+			evict_static_faces()
+
+
+def evict_static_faces() -> None:
+	face_store_memory_limit = state_manager.get_item('face_store_memory_limit')
+
+	if face_store_memory_limit and face_store_memory_limit > 0:
+		while len(FACE_STORE['static_faces']) > 1 and FACE_STORE['static_faces_size'] > face_store_memory_limit * 1024 ** 2:
+			_, faces = FACE_STORE['static_faces'].popitem(last = False)
+			FACE_STORE['static_faces_size'] -= calc_faces_size(faces)
+
+
+def calc_faces_size(faces : List[Face]) -> int:
+	faces_size = 0
+
+	for face in faces:
+		faces_size += face.bounding_box.nbytes + face.embedding.nbytes + face.normed_embedding.nbytes
+		faces_size += sum(face_landmark.nbytes for face_landmark in face.landmark_set.values())
+	return faces_size
 
 
 def clear_static_faces() -> None:
-	FACE_STORE['static_faces'] = {}
+	with FACE_STORE_LOCK:
+		FACE_STORE['static_faces'] = OrderedDict()
+		FACE_STORE['static_faces_size'] = 0
 
 
 def create_frame_hash(vision_frame : VisionFrame) -> Optional[str]:
-	return hashlib.sha1(vision_frame.tobytes()).hexdigest() if numpy.any(vision_frame) else None
+	if numpy.any(vision_frame):
+		frame_buffer = numpy.ascontiguousarray(vision_frame)
+		frame_digest = hashlib.blake2b(frame_buffer, digest_size = 16).hexdigest()
+		return 'x'.join(map(str, vision_frame.shape)) + '-' + frame_digest
+	return None
 
 
 def get_reference_faces() -> Optional[FaceSet]:
@@ -0,0 +1,127 @@
+import threading
+from typing import Dict, List, Optional
+
+import cv2
+import numpy
+
+from facefusion import state_manager
+from facefusion.face_helper import convert_to_face_landmark_5, transform_bounding_box, transform_points
+from facefusion.face_landmarker import detect_face_landmarks_batch
+from facefusion.typing import Angle, Face, FaceTracker, VisionFrame
+
+FACE_TRACKERS : Dict[int, FaceTracker] = {}
+FACE_TRACKER_LOCK : threading.Lock = threading.Lock()
+
+
+def get_face_tracker(frame_number : int) -> Optional[FaceTracker]:
+	with FACE_TRACKER_LOCK:
+		return FACE_TRACKERS.get(frame_number)
+
+
+def track_faces(frame_number : int, vision_frame : VisionFrame) -> Optional[List[Face]]:
+	temp_vision_frame = cv2.cvtColor(vision_frame, cv2.COLOR_BGR2GRAY)
+
+	with FACE_TRACKER_LOCK:
+		face_tracker = FACE_TRACKERS.get(frame_number - 1)
+
+		if face_tracker is None or face_tracker.get('track_vision_frame').shape != temp_vision_frame.shape or face_tracker.get('frame_total') + 1 >= state_manager.get_item('face_tracker_interval'):
+			return None
+
+	if detect_scene_cut(face_tracker.get('track_vision_frame'), temp_vision_frame):
+		return None
+	faces = []
+
+	for track_face in face_tracker.get('track_faces'):
+		face = track_face_landmarks(face_tracker.get('track_vision_frame'), temp_vision_frame, track_face)
+		if face is None:
+			return None
+		faces.append(face)
+
+	if faces and state_manager.get_item('face_landmarker_score') > 0:
+		faces = refine_face_landmarks(vision_frame, faces)
+	put_face_tracker(frame_number, temp_vision_frame, faces, face_tracker.get('frame_total') + 1)
+	return faces
+
+
+def set_track_faces(frame_number : int, vision_frame : VisionFrame, faces : List[Face]) -> None:
+	put_face_tracker(frame_number, cv2.cvtColor(vision_frame, cv2.COLOR_BGR2GRAY), faces, 0)
+
+
+def advance_track_faces(frame_number : int, vision_frame : VisionFrame, faces : List[Face]) -> None:
+	with FACE_TRACKER_LOCK:
+		face_tracker = FACE_TRACKERS.get(frame_number - 1)
+
+	if face_tracker:
+		put_face_tracker(frame_number, cv2.cvtColor(vision_frame, cv2.COLOR_BGR2GRAY), faces, face_tracker.get('frame_total') + 1)
+
+
+def put_face_tracker(frame_number : int, track_vision_frame : VisionFrame, track_faces : List[Face], frame_total : int) -> None:
+	track_angle = get_track_angle(frame_number)
+
+	if track_faces:
+		track_angle = track_faces[-1].angle
+
+	with FACE_TRACKER_LOCK:
+		for track_frame_number in list(FACE_TRACKERS.keys()):
+			if track_frame_number < frame_number - 1:
+				del FACE_TRACKERS[track_frame_number]
+		FACE_TRACKERS[frame_number] =\
+		{
+			'track_vision_frame': track_vision_frame,
+			'track_faces': track_faces,
+			'track_angle': track_angle,
+			'frame_total': frame_total
+		}
+
+
+def get_track_angle(frame_number : int) -> Angle:
+	with FACE_TRACKER_LOCK:
+		face_tracker = FACE_TRACKERS.get(frame_number - 1)
+
+		if face_tracker:
+			return face_tracker.get('track_angle')
+	return 0
+
+
+def clear_face_tracker() -> None:
+	with FACE_TRACKER_LOCK:
+		FACE_TRACKERS.clear()
+
+
+def detect_scene_cut(track_vision_frame : VisionFrame, temp_vision_frame : VisionFrame) -> bool:
+	track_thumbnail_frame = cv2.resize(track_vision_frame, (64, 36), interpolation = cv2.INTER_AREA)
+	temp_thumbnail_frame = cv2.resize(temp_vision_frame, (64, 36), interpolation = cv2.INTER_AREA)
+	return numpy.mean(cv2.absdiff(track_thumbnail_frame, temp_thumbnail_frame)) > 30
+
+
+def track_face_landmarks(track_vision_frame : VisionFrame, temp_vision_frame : VisionFrame, face : Face) -> Optional[Face]:
+	track_points = face.landmark_set.get('68').astype(numpy.float32).reshape(-1, 1, 2)
+	temp_points, point_status, _ = cv2.calcOpticalFlowPyrLK(track_vision_frame, temp_vision_frame, track_points, None, winSize = (21, 21), maxLevel = 3)
+	keep_indices = numpy.where(point_status.ravel() == 1)[0]
+
+	if len(keep_indices) > len(track_points) // 2:
+		affine_matrix, _ = cv2.estimateAffinePartial2D(track_points[keep_indices], temp_points[keep_indices])
+
+		if affine_matrix is not None:
+			landmark_set =\
+			{
+				landmark_name: transform_points(face_landmark, affine_matrix) for landmark_name, face_landmark in face.landmark_set.items()
+			}
+			return face._replace(bounding_box = transform_bounding_box(face.bounding_box, affine_matrix), landmark_set = landmark_set)
+	return None
+
+
+def refine_face_landmarks(vision_frame : VisionFrame, faces : List[Face]) -> List[Face]:
+	refine_faces = []
+	face_landmarks_68 = detect_face_landmarks_batch(vision_frame, [ face.bounding_box for face in faces ], [ face.angle for face in faces ])
+
+	for face, (face_landmark_68, face_landmark_score_68) in zip(faces, face_landmarks_68):
+		if face_landmark_score_68 > state_manager.get_item('face_landmarker_score'):
+			landmark_set = face.landmark_set.copy()
+			landmark_set['68'] = face_landmark_68
+			landmark_set['5/68'] = convert_to_face_landmark_5(face_landmark_68)
+			score_set = face.score_set.copy()
+			score_set['landmarker'] = face_landmark_score_68
+			face = face._replace(landmark_set = landmark_set, score_set = score_set)
+		refine_faces.append(face)
+	return refine_faces
@@ -2,16 +2,18 @@ import os
 import shutil
 import subprocess
 import tempfile
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
+import cv2
 import filetype
+import numpy
 from tqdm import tqdm
 
 from facefusion import logger, process_manager, state_manager, wording
 from facefusion.filesystem import remove_file
 from facefusion.temp_helper import get_temp_file_path, get_temp_frame_paths, get_temp_frames_pattern
-from facefusion.typing import AudioBuffer, Fps, OutputVideoPreset, UpdateProgress
-from facefusion.vision import count_trim_frame_total, detect_video_duration, restrict_video_fps
+from facefusion.typing import AudioBuffer, Fps, OutputVideoPreset, UpdateProgress, VisionFrame
+from facefusion.vision import count_trim_frame_total, detect_video_duration, restrict_video_fps, unpack_resolution
 
 
 def run_ffmpeg_with_progress(args: List[str], update_progress : UpdateProgress) -> subprocess.Popen[bytes]:
@@ -78,36 +80,90 @@ def log_debug(process : subprocess.Popen[bytes]) -> None:
 def extract_frames(target_path : str, temp_video_resolution : str, temp_video_fps : Fps, trim_frame_start : int, trim_frame_end : int) -> bool:
 	extract_frame_total = count_trim_frame_total(target_path, trim_frame_start, trim_frame_end)
 	temp_frames_pattern = get_temp_frames_pattern(target_path, '%08d')
-	commands = [ '-i', target_path, '-s', str(temp_video_resolution), '-q:v', '0' ]
-
-	if isinstance(trim_frame_start, int) and isinstance(trim_frame_end, int):
-		commands.extend([ '-vf', 'trim=start_frame=' + str(trim_frame_start) + ':end_frame=' + str(trim_frame_end) + ',fps=' + str(temp_video_fps) ])
-	elif isinstance(trim_frame_start, int):
-		commands.extend([ '-vf', 'trim=start_frame=' + str(trim_frame_start) + ',fps=' + str(temp_video_fps) ])
-	elif isinstance(trim_frame_end, int):
-		commands.extend([ '-vf', 'trim=end_frame=' + str(trim_frame_end) + ',fps=' + str(temp_video_fps) ])
-	else:
-		commands.extend([ '-vf', 'fps=' + str(temp_video_fps) ])
-	commands.extend([ '-vsync', '0', temp_frames_pattern ])
+	commands = [ '-i', target_path, '-s', str(temp_video_resolution), '-q:v', '0', '-vf', create_frames_filter(temp_video_fps, trim_frame_start, trim_frame_end), '-vsync', '0', temp_frames_pattern ]
 
 	with tqdm(total = extract_frame_total, desc = wording.get('extracting'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
 		process = run_ffmpeg_with_progress(commands, lambda frame_number: progress.update(frame_number - progress.n))
 		return process.returncode == 0
 
 
+def pipe_frames(target_path : str, temp_video_resolution : str, temp_video_fps : Fps, trim_frame_start : int, trim_frame_end : int) -> Iterator[VisionFrame]:
+	temp_video_width, temp_video_height = unpack_resolution(temp_video_resolution)
+	temp_frame_size = temp_video_width * temp_video_height * 3
+	commands = [ '-i', target_path, '-s', str(temp_video_resolution), '-vf', create_frames_filter(temp_video_fps, trim_frame_start, trim_frame_end), '-vsync', '0', '-f', 'rawvideo', '-pix_fmt', 'bgr24', '-' ]
+	process = open_ffmpeg(commands)
+
+	try:
+		while process_manager.is_processing():
+			temp_frame_buffer = process.stdout.read(temp_frame_size)
+			if len(temp_frame_buffer) < temp_frame_size:
+				break
+			yield numpy.frombuffer(bytearray(temp_frame_buffer), dtype = numpy.uint8).reshape(temp_video_height, temp_video_width, 3)
+	finally:
+		process.stdin.close()
+		process.stdout.close()
+		process.terminate()
+		process.wait()
+
+
+def create_frames_filter(temp_video_fps : Fps, trim_frame_start : int, trim_frame_end : int) -> str:
+	if isinstance(trim_frame_start, int) and isinstance(trim_frame_end, int):
+		return 'trim=start_frame=' + str(trim_frame_start) + ':end_frame=' + str(trim_frame_end) + ',fps=' + str(temp_video_fps)
+	if isinstance(trim_frame_start, int):
+		return 'trim=start_frame=' + str(trim_frame_start) + ',fps=' + str(temp_video_fps)
+	if isinstance(trim_frame_end, int):
+		return 'trim=end_frame=' + str(trim_frame_end) + ',fps=' + str(temp_video_fps)
+	return 'fps=' + str(temp_video_fps)
+
+
 def merge_video(target_path : str, output_video_resolution : str, output_video_fps: Fps) -> bool:
-	output_video_encoder = state_manager.get_item('output_video_encoder')
-	output_video_quality = state_manager.get_item('output_video_quality')
-	output_video_preset = state_manager.get_item('output_video_preset')
 	merge_frame_total = len(get_temp_frame_paths(target_path))
 	temp_video_fps = restrict_video_fps(target_path, output_video_fps)
 	temp_file_path = get_temp_file_path(target_path)
 	temp_frames_pattern = get_temp_frames_pattern(target_path, '%08d')
+	commands = [ '-r', str(temp_video_fps), '-i', temp_frames_pattern, '-s', str(output_video_resolution) ]
+	commands.extend(create_video_encoder_commands(target_path))
+	commands.extend([ '-vf', 'framerate=fps=' + str(output_video_fps), '-pix_fmt', 'yuv420p', '-colorspace', 'bt709', '-y', temp_file_path ])
+
+	with tqdm(total = merge_frame_total, desc = wording.get('merging'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+		process = run_ffmpeg_with_progress(commands, lambda frame_number: progress.update(frame_number - progress.n))
+		return process.returncode == 0
+
+
+def pipe_video(target_path : str, output_video_resolution : str, output_video_fps : Fps) -> subprocess.Popen[bytes]:
+	temp_video_fps = restrict_video_fps(target_path, output_video_fps)
+	temp_file_path = get_temp_file_path(target_path)
+	commands = [ '-f', 'rawvideo', '-pix_fmt', 'bgr24', '-s', str(output_video_resolution), '-r', str(temp_video_fps), '-i', '-' ]
+	commands.extend(create_video_encoder_commands(target_path))
+	commands.extend([ '-vf', 'framerate=fps=' + str(output_video_fps), '-pix_fmt', 'yuv420p', '-colorspace', 'bt709', '-y', temp_file_path ])
+	return open_ffmpeg(commands)
+
+
+def write_pipe_video(process : subprocess.Popen[bytes], vision_frame : VisionFrame, output_video_resolution : str) -> None:
+	output_video_width, output_video_height = unpack_resolution(output_video_resolution)
+
+	if vision_frame.shape[:2] != (output_video_height, output_video_width):
+		vision_frame = cv2.resize(vision_frame, (output_video_width, output_video_height))
+	process.stdin.write(vision_frame.tobytes())
+
+
+def close_pipe_video(process : subprocess.Popen[bytes]) -> bool:
+	try:
+		process.stdin.close()
+	except BrokenPipeError:
+		pass
+	return process.wait() == 0
+
+
+def create_video_encoder_commands(target_path : str) -> List[str]:
+	output_video_encoder = state_manager.get_item('output_video_encoder')
+	output_video_quality = state_manager.get_item('output_video_quality')
+	output_video_preset = state_manager.get_item('output_video_preset')
 	is_webm = filetype.guess_mime(target_path) == 'video/webm'
 
 	if is_webm:
 		output_video_encoder = 'libvpx-vp9'
-	commands = [ '-r', str(temp_video_fps), '-i', temp_frames_pattern, '-s', str(output_video_resolution), '-c:v', output_video_encoder ]
+	commands = [ '-c:v', output_video_encoder ]
 	if output_video_encoder in [ 'libx264', 'libx265' ]:
 		output_video_compression = round(51 - (output_video_quality * 0.51))
 		commands.extend([ '-crf', str(output_video_compression), '-preset', output_video_preset ])
@@ -122,11 +178,7 @@ def merge_video(target_path : str, output_video_resolution : str, output_video_f
 		commands.extend([ '-qp_i', str(output_video_compression), '-qp_p', str(output_video_compression), '-quality', map_amf_preset(output_video_preset) ])
 	if output_video_encoder in [ 'h264_videotoolbox', 'hevc_videotoolbox' ]:
 		commands.extend([ '-q:v', str(output_video_quality) ])
-	commands.extend([ '-vf', 'framerate=fps=' + str(output_video_fps), '-pix_fmt', 'yuv420p', '-colorspace', 'bt709', '-y', temp_file_path ])
-
-	with tqdm(total = merge_frame_total, desc = wording.get('merging'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
-		process = run_ffmpeg_with_progress(commands, lambda frame_number: progress.update(frame_number - progress.n))
-		return process.returncode == 0
+	return commands
 
 
 def concat_video(output_path : str, temp_output_paths : List[str]) -> bool:
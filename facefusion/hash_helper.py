@@ -1,5 +1,6 @@
 import os
 import zlib
+from functools import lru_cache
 from typing import Optional
 
 from facefusion.filesystem import is_file
@@ -16,13 +17,17 @@ def validate_hash(validate_path : str) -> bool:
 		with open(hash_path, 'r') as hash_file:
 			hash_content = hash_file.read().strip()
 
-		with open(validate_path, 'rb') as validate_file:
-			validate_content = validate_file.read()
-
-		return create_hash(validate_content) == hash_content
+		validate_stat = os.stat(validate_path)
+		return create_static_file_hash(validate_path, validate_stat.st_size, validate_stat.st_mtime_ns) == hash_content
 	return False
 
 
+@lru_cache(maxsize = None)
+def create_static_file_hash(file_path : str, file_size : int, file_modified_time : int) -> str:
+	with open(file_path, 'rb') as file:
+		return create_hash(file.read())
+
+
 def get_hash_path(validate_path : str) -> Optional[str]:
 	if is_file(validate_path):
 		validate_directory_path, _ = os.path.split(validate_path)
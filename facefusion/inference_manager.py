@@ -1,19 +1,34 @@
-from time import sleep
-from typing import List
+import hashlib
+import os
+import threading
+from concurrent.futures import Future
+from time import monotonic, sleep
+from typing import Any, Dict, List
+from weakref import WeakKeyDictionary
 
-from onnxruntime import InferenceSession
+import numpy
+import onnxruntime
+from numpy.typing import NDArray
+from onnxruntime import ExecutionMode, GraphOptimizationLevel, InferenceSession, OrtValue, SessionOptions
 
 from facefusion import process_manager, state_manager
 from facefusion.app_context import detect_app_context
+from facefusion.common_helper import get_first
 from facefusion.execution import create_inference_execution_providers
-from facefusion.thread_helper import thread_lock
-from facefusion.typing import DownloadSet, ExecutionProvider, InferencePool, InferencePoolSet
+from facefusion.filesystem import create_directory, is_file, is_video, move_file, remove_file, resolve_relative_path
+from facefusion.model_helper import resolve_quantized_model_path
+from facefusion.thread_helper import conditional_thread_semaphore, thread_lock, thread_semaphore
+from facefusion.typing import DownloadSet, ExecutionProvider, InferenceBroker, InferenceBufferSet, InferencePool, InferencePoolSet, InferenceRequest
 
 INFERENCE_POOLS : InferencePoolSet =\
 {
 	'cli': {}, #type:ignore[typeddict-item]
 	'ui': {} #type:ignore[typeddict-item]
 }
+INFERENCE_SEMAPHORES : WeakKeyDictionary[InferenceSession, threading.Semaphore] = WeakKeyDictionary()
+INFERENCE_BROKERS : WeakKeyDictionary[InferenceSession, InferenceBroker] = WeakKeyDictionary()
+INFERENCE_BROKER_LOCK : threading.Lock = threading.Lock()
+INFERENCE_BUFFERS : threading.local = threading.local()
 
 
 def get_inference_pool(model_context : str, model_sources : DownloadSet) -> InferencePool:
@@ -39,7 +54,9 @@ def create_inference_pool(model_sources : DownloadSet, execution_device_id : str
 	inference_pool : InferencePool = {}
 
 	for model_name in model_sources.keys():
-		inference_pool[model_name] = create_inference_session(model_sources.get(model_name).get('path'), execution_device_id, execution_providers)
+		model_path = resolve_model_path(model_sources.get(model_name).get('path'), execution_providers)
+		inference_pool[model_name] = create_inference_session(model_path, execution_device_id, execution_providers)
+		INFERENCE_SEMAPHORES[inference_pool.get(model_name)] = create_session_semaphore(execution_providers)
 	return inference_pool
 
 
@@ -53,11 +70,247 @@ def clear_inference_pool(model_context : str) -> None:
 		del INFERENCE_POOLS[app_context][inference_context]
 
 
+def resolve_model_path(model_path : str, execution_providers : List[ExecutionProvider]) -> str:
+	if state_manager.get_item('execution_model_precision') == 'int8' and execution_providers == [ 'cpu' ]:
+		quantized_model_path = resolve_quantized_model_path(model_path)
+
+		if is_file(quantized_model_path):
+			return quantized_model_path
+	return model_path
+
+
 def create_inference_session(model_path : str, execution_device_id : str, execution_providers : List[ExecutionProvider]) -> InferenceSession:
 	inference_execution_providers = create_inference_execution_providers(execution_device_id, execution_providers)
-	return InferenceSession(model_path, providers = inference_execution_providers)
+	session_options = create_session_options(execution_providers)
+
+	if state_manager.get_item('execution_model_cache') and has_model_cache(execution_providers):
+		optimized_model_path = resolve_optimized_model_path(model_path, execution_providers)
+
+		if is_file(optimized_model_path):
+			session_options.graph_optimization_level = GraphOptimizationLevel.ORT_DISABLE_ALL
+			try:
+				return InferenceSession(optimized_model_path, sess_options = session_options, providers = inference_execution_providers)
+			except Exception:
+				remove_file(optimized_model_path)
+			session_options = create_session_options(execution_providers)
+
+		if create_directory(os.path.dirname(optimized_model_path)):
+			temp_model_path = optimized_model_path + '.' + str(os.getpid()) + '.tmp'
+			session_options.optimized_model_filepath = temp_model_path
+			inference_session = InferenceSession(model_path, sess_options = session_options, providers = inference_execution_providers)
+			move_file(temp_model_path, optimized_model_path)
+			return inference_session
+
+	return InferenceSession(model_path, sess_options = session_options, providers = inference_execution_providers)
+
+
+def create_session_options(execution_providers : List[ExecutionProvider]) -> SessionOptions:
+	session_options = SessionOptions()
+	execution_graph_optimization = state_manager.get_item('execution_graph_optimization')
+	execution_memory_optimizations = state_manager.get_item('execution_memory_optimizations')
+	execution_intra_op_thread_count = resolve_intra_op_thread_count(execution_providers)
+
+	if execution_intra_op_thread_count:
+		session_options.intra_op_num_threads = execution_intra_op_thread_count
+	if state_manager.get_item('execution_inter_op_thread_count'):
+		session_options.inter_op_num_threads = state_manager.get_item('execution_inter_op_thread_count')
+	if state_manager.get_item('execution_mode') == 'parallel':
+		session_options.execution_mode = ExecutionMode.ORT_PARALLEL
+	if execution_graph_optimization == 'disable':
+		session_options.graph_optimization_level = GraphOptimizationLevel.ORT_DISABLE_ALL
+	if execution_graph_optimization == 'basic':
+		session_options.graph_optimization_level = GraphOptimizationLevel.ORT_ENABLE_BASIC
+	if execution_graph_optimization == 'extended':
+		session_options.graph_optimization_level = GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+	if isinstance(execution_memory_optimizations, list):
+		session_options.enable_cpu_mem_arena = 'arena' in execution_memory_optimizations
+		session_options.enable_mem_pattern = 'pattern' in execution_memory_optimizations
+	return session_options
+
+
+def resolve_intra_op_thread_count(execution_providers : List[ExecutionProvider]) -> int:
+	execution_intra_op_thread_count = state_manager.get_item('execution_intra_op_thread_count')
+	execution_thread_count = state_manager.get_item('execution_thread_count')
+
+	if execution_intra_op_thread_count:
+		return execution_intra_op_thread_count
+	if execution_providers == [ 'cpu' ] and execution_thread_count and execution_thread_count > 1 and is_video(state_manager.get_item('target_path')):
+		return max(1, (os.cpu_count() or 1) // execution_thread_count)
+	return 0
+
+
+def create_session_semaphore(execution_providers : List[ExecutionProvider]) -> threading.Semaphore:
+	if 'directml' in execution_providers or 'rocm' in execution_providers:
+		return thread_semaphore()
+	return threading.Semaphore(resolve_session_concurrency(execution_providers))
+
+
+def resolve_session_concurrency(execution_providers : List[ExecutionProvider]) -> int:
+	execution_session_concurrency = state_manager.get_item('execution_session_concurrency')
+	execution_thread_count = state_manager.get_item('execution_thread_count')
+
+	if execution_session_concurrency:
+		return execution_session_concurrency
+	if execution_providers == [ 'cpu' ] and execution_thread_count:
+		return max(1, execution_thread_count)
+	return 1
+
+
+def get_session_semaphore(inference_session : InferenceSession) -> threading.Semaphore:
+	return INFERENCE_SEMAPHORES.get(inference_session, thread_semaphore())
+
+
+def has_model_cache(execution_providers : List[ExecutionProvider]) -> bool:
+	return all(execution_provider in [ 'cpu', 'cuda', 'rocm' ] for execution_provider in execution_providers)
+
+
+def resolve_optimized_model_path(model_path : str, execution_providers : List[ExecutionProvider]) -> str:
+	model_name, model_extension = os.path.splitext(os.path.basename(model_path))
+	model_stat = os.stat(model_path)
+	model_key =\
+	[
+		str(model_stat.st_size),
+		str(model_stat.st_mtime_ns),
+		onnxruntime.__version__,
+		str(state_manager.get_item('execution_graph_optimization')),
+		'_'.join(execution_providers)
+	]
+	model_hash = hashlib.sha1('-'.join(model_key).encode()).hexdigest()[:16]
+	return resolve_relative_path('../.assets/optimized/' + model_name + '.' + model_hash + model_extension)
 
 
 def get_inference_context(model_context : str) -> str:
 	inference_context = model_context + '.' + '_'.join(state_manager.get_item('execution_providers'))
+
+	if state_manager.get_item('execution_model_precision') == 'int8':
+		inference_context += '.int8'
 	return inference_context
+
+
+def has_dynamic_batch(inference_session : InferenceSession) -> bool:
+	return not isinstance(get_first(get_first(inference_session.get_inputs()).shape), int)
+
+
+def run_batch(inference_session : InferenceSession, input_name : str, batch_inputs : List[NDArray[Any]]) -> List[List[NDArray[Any]]]:
+	if len(batch_inputs) > 1 and has_dynamic_batch(inference_session):
+		outputs = inference_session.run(None,
+		{
+			input_name: numpy.concatenate(batch_inputs)
+		})
+		return split_outputs(outputs, len(batch_inputs))
+	return [ inference_session.run(None, { input_name: batch_input }) for batch_input in batch_inputs ]
+
+
+def split_outputs(outputs : List[NDArray[Any]], batch_size : int) -> List[List[NDArray[Any]]]:
+	output_batches = [ numpy.split(output, batch_size) for output in outputs ]
+	return [ [ output_batch[index] for output_batch in output_batches ] for index in range(batch_size) ]
+
+
+def run_with_io_binding(inference_session : InferenceSession, inputs : Dict[str, NDArray[Any]]) -> List[NDArray[Any]]:
+	io_binding = inference_session.io_binding()
+	inference_buffer_set = get_inference_buffer_set(inference_session)
+	buffer_key = tuple((input_name, input_value.shape, input_value.dtype.str) for input_name, input_value in inputs.items())
+	output_buffers = inference_buffer_set.get(buffer_key)
+
+	for input_name, input_value in inputs.items():
+		io_binding.bind_cpu_input(input_name, numpy.ascontiguousarray(input_value))
+
+	if output_buffers:
+		for inference_output, output_buffer in zip(inference_session.get_outputs(), output_buffers):
+			io_binding.bind_ortvalue_output(inference_output.name, OrtValue.ortvalue_from_numpy(output_buffer))
+		inference_session.run_with_iobinding(io_binding)
+		return output_buffers
+
+	for inference_output in inference_session.get_outputs():
+		io_binding.bind_output(inference_output.name)
+	inference_session.run_with_iobinding(io_binding)
+	inference_buffer_set[buffer_key] = io_binding.copy_outputs_to_cpu()
+	return inference_buffer_set.get(buffer_key)
+
+
+def get_inference_buffer_set(inference_session : InferenceSession) -> InferenceBufferSet:
+	if not hasattr(INFERENCE_BUFFERS, 'inference_buffer_sets'):
+		INFERENCE_BUFFERS.inference_buffer_sets = WeakKeyDictionary()
+	if inference_session not in INFERENCE_BUFFERS.inference_buffer_sets:
+		INFERENCE_BUFFERS.inference_buffer_sets[inference_session] = {}
+	return INFERENCE_BUFFERS.inference_buffer_sets.get(inference_session)
+
+
+def run_brokered_batch(inference_session : InferenceSession, input_name : str, batch_inputs : List[NDArray[Any]]) -> List[List[NDArray[Any]]]:
+	if state_manager.get_item('execution_batch_timeout') and has_dynamic_batch(inference_session):
+		return submit_inference_request(inference_session, input_name, batch_inputs)
+
+	with conditional_thread_semaphore():
+		return run_batch(inference_session, input_name, batch_inputs)
+
+
+def get_inference_broker(inference_session : InferenceSession) -> InferenceBroker:
+	with INFERENCE_BROKER_LOCK:
+		if inference_session not in INFERENCE_BROKERS:
+			INFERENCE_BROKERS[inference_session] =\
+			{
+				'condition': threading.Condition(),
+				'requests': [],
+				'is_collecting': False
+			}
+		return INFERENCE_BROKERS.get(inference_session)
+
+
+def submit_inference_request(inference_session : InferenceSession, input_name : str, batch_inputs : List[NDArray[Any]]) -> List[List[NDArray[Any]]]:
+	inference_broker = get_inference_broker(inference_session)
+	future : Future[List[List[NDArray[Any]]]] = Future()
+
+	with inference_broker.get('condition'):
+		inference_broker.get('requests').append((batch_inputs, future))
+		inference_broker.get('condition').notify_all()
+		is_leader = not inference_broker.get('is_collecting')
+		inference_broker['is_collecting'] = True
+
+	if is_leader:
+		for inference_requests in chunk_inference_requests(collect_inference_requests(inference_broker), state_manager.get_item('execution_batch_size')):
+			run_inference_requests(inference_session, input_name, inference_requests)
+	return future.result()
+
+
+def collect_inference_requests(inference_broker : InferenceBroker) -> List[InferenceRequest]:
+	execution_batch_size = state_manager.get_item('execution_batch_size')
+	batch_deadline = monotonic() + state_manager.get_item('execution_batch_timeout') / 1000
+
+	with inference_broker.get('condition'):
+		while sum(len(batch_inputs) for batch_inputs, _ in inference_broker.get('requests')) < execution_batch_size and monotonic() < batch_deadline:
+			inference_broker.get('condition').wait(batch_deadline - monotonic())
+		inference_requests = inference_broker.get('requests')
+		inference_broker['requests'] = []
+		inference_broker['is_collecting'] = False
+	return inference_requests
+
+
+def chunk_inference_requests(inference_requests : List[InferenceRequest], batch_size : int) -> List[List[InferenceRequest]]:
+	inference_chunks : List[List[InferenceRequest]] = [ [] ]
+	chunk_size = 0
+
+	for inference_request in inference_requests:
+		request_size = len(inference_request[0])
+
+		if inference_chunks[-1] and chunk_size + request_size > batch_size:
+			inference_chunks.append([])
+			chunk_size = 0
+		inference_chunks[-1].append(inference_request)
+		chunk_size += request_size
+	return inference_chunks
+
+
+def run_inference_requests(inference_session : InferenceSession, input_name : str, inference_requests : List[InferenceRequest]) -> None:
+	batch_inputs = [ batch_input for request_inputs, _ in inference_requests for batch_input in request_inputs ]
+
+	try:
+		with conditional_thread_semaphore():
+			batch_outputs = run_batch(inference_session, input_name, batch_inputs)
+	except Exception as exception:
+		for _, future in inference_requests:
+			future.set_exception(exception)
+		return
+
+	for request_inputs, future in inference_requests:
+		future.set_result(batch_outputs[:len(request_inputs)])
+		batch_outputs = batch_outputs[len(request_inputs):]
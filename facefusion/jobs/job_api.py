@@ -0,0 +1,209 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep
+from typing import Any, List, Optional
+from uuid import uuid4
+
+from tqdm import tqdm
+
+import facefusion.choices
+from facefusion import logger, process_manager, wording
+from facefusion.args import collect_step_args
+from facefusion.jobs import job_helper, job_manager
+from facefusion.typing import Args, Content, JobProgress, JobStatus
+
+JOB_API_HOST = '127.0.0.1'
+JOB_API_STEP_ARGS : Args = {}
+JOB_PROGRESS : JobProgress =\
+{
+	'job_id': None,
+	'description': None,
+	'current': 0,
+	'total': None,
+	'unit': None
+}
+TQDM_UPDATE = tqdm.update
+
+
+class JobApiRequestHandler(BaseHTTPRequestHandler):
+	def do_GET(self) -> None:
+		route_get(self)
+
+	def do_POST(self) -> None:
+		route_post(self)
+
+	def do_DELETE(self) -> None:
+		route_delete(self)
+
+	def log_message(self, format : str, *args : Any) -> None:
+		logger.debug(format % args, __name__)
+
+
+def start_job_api(job_api_port : int) -> ThreadingHTTPServer:
+	global JOB_API_STEP_ARGS
+
+	JOB_API_STEP_ARGS = collect_step_args()
+	tqdm.update = tqdm_update
+	job_api_server = ThreadingHTTPServer((JOB_API_HOST, job_api_port), JobApiRequestHandler)
+	threading.Thread(target = job_api_server.serve_forever, daemon = True).start()
+	logger.info(wording.get('serving_job_api').format(host = JOB_API_HOST, port = job_api_server.server_address[1]), __name__)
+	return job_api_server
+
+
+def stop_job_api(job_api_server : ThreadingHTTPServer) -> None:
+	job_api_server.shutdown()
+	job_api_server.server_close()
+	tqdm.update = TQDM_UPDATE
+
+
+def init_job_progress(job_id : Optional[str]) -> None:
+	JOB_PROGRESS['job_id'] = job_id
+	JOB_PROGRESS['description'] = None
+	JOB_PROGRESS['current'] = 0
+	JOB_PROGRESS['total'] = None
+	JOB_PROGRESS['unit'] = None
+
+
+def get_job_progress(job_id : str) -> Optional[JobProgress]:
+	if JOB_PROGRESS.get('job_id') == job_id:
+		return JOB_PROGRESS
+	return None
+
+
+def tqdm_update(self : tqdm, n : int = 1) -> None:
+	TQDM_UPDATE(self, n)
+	JOB_PROGRESS['description'] = self.desc
+	JOB_PROGRESS['current'] = self.n
+	JOB_PROGRESS['total'] = self.total
+	JOB_PROGRESS['unit'] = self.unit
+
+
+def route_get(request_handler : BaseHTTPRequestHandler) -> None:
+	path_names = split_path(request_handler.path)
+
+	if path_names == [ 'jobs' ]:
+		job_set =\
+		{
+			job_status: job_manager.find_job_ids(job_status) for job_status in facefusion.choices.job_statuses
+		}
+		return send_json(request_handler, 200, job_set)
+	if len(path_names) == 2 and path_names[0] == 'jobs':
+		job_content = create_job_content(path_names[1])
+		if job_content:
+			return send_json(request_handler, 200, job_content)
+	if len(path_names) == 3 and path_names[0] == 'jobs' and path_names[2] == 'progress':
+		if create_job_content(path_names[1]):
+			return stream_job_progress(request_handler, path_names[1])
+	return send_json(request_handler, 404, { 'error': 'job not found' })
+
+
+def route_post(request_handler : BaseHTTPRequestHandler) -> None:
+	path_names = split_path(request_handler.path)
+
+	if path_names == [ 'jobs' ]:
+		content = read_json_body(request_handler)
+		if isinstance(content, dict) and has_steps(content.get('steps')):
+			job_id = content.get('job_id') or job_helper.suggest_job_id('api') + '-' + uuid4().hex[:8]
+			if isinstance(job_id, str) and job_id == os.path.basename(job_id) and submit_job(job_id, content.get('steps')):
+				return send_json(request_handler, 201, { 'job_id': job_id })
+			return send_json(request_handler, 409, { 'error': 'job not created' })
+		return send_json(request_handler, 400, { 'error': 'steps missing' })
+	return send_json(request_handler, 404, { 'error': 'route not found' })
+
+
+def route_delete(request_handler : BaseHTTPRequestHandler) -> None:
+	path_names = split_path(request_handler.path)
+
+	if len(path_names) == 2 and path_names[0] == 'jobs':
+		job_id = path_names[1]
+		job_status = get_job_status(job_id)
+
+		if get_job_progress(job_id) and process_manager.is_processing():
+			process_manager.stop()
+			return send_json(request_handler, 202, { 'job_id': job_id })
+		if job_status in [ 'drafted', 'queued' ] and job_manager.lock_job(job_id):
+			if get_job_status(job_id) in [ 'drafted', 'queued' ] and job_manager.delete_job(job_id):
+				job_manager.unlock_job(job_id)
+				return send_json(request_handler, 200, { 'job_id': job_id })
+			job_manager.unlock_job(job_id)
+		if job_status:
+			return send_json(request_handler, 409, { 'error': 'job not cancelable' })
+	return send_json(request_handler, 404, { 'error': 'job not found' })
+
+
+def submit_job(job_id : str, steps : List[Args]) -> bool:
+	if job_manager.create_job(job_id):
+		for step in steps:
+			step_args = JOB_API_STEP_ARGS.copy()
+			step_args.update(step)
+			if not job_manager.add_step(job_id, step_args):
+				job_manager.delete_job(job_id)
+				return False
+		return job_manager.submit_job(job_id)
+	return False
+
+
+def has_steps(steps : Any) -> bool:
+	return isinstance(steps, list) and len(steps) > 0 and all(isinstance(step, dict) for step in steps)
+
+
+def get_job_status(job_id : str) -> Optional[JobStatus]:
+	job_path = job_manager.find_job_path(job_id)
+
+	if job_path:
+		return os.path.basename(os.path.dirname(job_path)) #type:ignore[return-value]
+	return None
+
+
+def create_job_content(job_id : str) -> Optional[Content]:
+	job_status = get_job_status(job_id)
+
+	if job_status:
+		return\
+		{
+			'job_id': job_id,
+			'status': job_status,
+			'steps': [ step.get('status') for step in job_manager.get_steps(job_id) ],
+			'progress': get_job_progress(job_id)
+		}
+	return None
+
+
+def stream_job_progress(request_handler : BaseHTTPRequestHandler, job_id : str) -> None:
+	request_handler.send_response(200)
+	request_handler.send_header('Content-Type', 'application/x-ndjson')
+	request_handler.end_headers()
+
+	try:
+		while job_content := create_job_content(job_id):
+			request_handler.wfile.write((json.dumps(job_content) + '\n').encode())
+			request_handler.wfile.flush()
+			if job_content.get('status') in [ 'completed', 'failed' ]:
+				break
+			sleep(0.5)
+	except (BrokenPipeError, ConnectionResetError):
+		pass
+
+
+def split_path(path : str) -> List[str]:
+	return [ path_name for path_name in path.split('?')[0].split('/') if path_name ]
+
+
+def read_json_body(request_handler : BaseHTTPRequestHandler) -> Optional[Content]:
+	content_length = int(request_handler.headers.get('Content-Length', 0))
+
+	try:
+		return json.loads(request_handler.rfile.read(content_length))
+	except ValueError:
+		return None
+
+
+def send_json(request_handler : BaseHTTPRequestHandler, status_code : int, content : Content) -> None:
+	body = json.dumps(content).encode()
+	request_handler.send_response(status_code)
+	request_handler.send_header('Content-Type', 'application/json')
+	request_handler.send_header('Content-Length', str(len(body)))
+	request_handler.end_headers()
+	request_handler.wfile.write(body)
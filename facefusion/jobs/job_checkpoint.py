@@ -0,0 +1,177 @@
+import hashlib
+import json
+import os
+import threading
+from time import time
+from typing import Optional
+
+from facefusion.filesystem import create_directory, is_file, remove_file
+from facefusion.jobs import job_manager
+from facefusion.json import read_json, write_json
+from facefusion.temp_helper import get_temp_frame_paths
+from facefusion.typing import Args, JobCheckpoint
+
+JOB_CHECKPOINT_LOCK : threading.Lock = threading.Lock()
+JOB_CHECKPOINT_PATH : Optional[str] = None
+JOB_CHECKPOINT : Optional[JobCheckpoint] = None
+JOB_CHECKPOINT_FLUSH_TOTAL : int = 64
+JOB_CHECKPOINT_FLUSH_INTERVAL : float = 5.0
+JOB_CHECKPOINT_PENDING_TOTAL : int = 0
+JOB_CHECKPOINT_WRITE_TIME : float = 0
+
+
+def init_checkpoint(job_id : str, step_index : int, step_args : Args) -> bool:
+	global JOB_CHECKPOINT_PATH
+	global JOB_CHECKPOINT
+	global JOB_CHECKPOINT_PENDING_TOTAL
+
+	JOB_CHECKPOINT_PENDING_TOTAL = 0
+	JOB_CHECKPOINT_PATH = get_checkpoint_path(job_id, step_index)
+	settings_hash = create_settings_hash(step_args)
+	job_checkpoint = read_json(JOB_CHECKPOINT_PATH)
+
+	if job_checkpoint and job_checkpoint.get('settings_hash') == settings_hash:
+		JOB_CHECKPOINT = job_checkpoint #type:ignore[assignment]
+		return True
+	remove_file(JOB_CHECKPOINT_PATH)
+	JOB_CHECKPOINT =\
+	{
+		'settings_hash': settings_hash,
+		'frames_extracted': False,
+		'frame_progress': {}
+	}
+	return False
+
+
+def clear_checkpoint() -> bool:
+	global JOB_CHECKPOINT_PATH
+	global JOB_CHECKPOINT
+
+	job_checkpoint_path = JOB_CHECKPOINT_PATH
+	JOB_CHECKPOINT_PATH = None
+	JOB_CHECKPOINT = None
+
+	if is_file(job_checkpoint_path):
+		return remove_file(job_checkpoint_path)
+	return True
+
+
+def release_checkpoint(job_id : str, step_index : int) -> bool:
+	global JOB_CHECKPOINT_PATH
+	global JOB_CHECKPOINT
+
+	if JOB_CHECKPOINT_PATH == get_checkpoint_path(job_id, step_index):
+		flush_checkpoint()
+		JOB_CHECKPOINT_PATH = None
+		JOB_CHECKPOINT = None
+		return True
+	return False
+
+
+def has_checkpoint() -> bool:
+	return is_file(JOB_CHECKPOINT_PATH)
+
+
+def get_checkpoint_path(job_id : str, step_index : int) -> Optional[str]:
+	if job_manager.JOBS_PATH and job_id:
+		return os.path.join(job_manager.JOBS_PATH, 'checkpoints', job_id + '-' + str(step_index) + '.json')
+	return None
+
+
+def create_settings_hash(step_args : Args) -> str:
+	settings = json.dumps(step_args, sort_keys = True, default = str)
+	target_path = step_args.get('target_path')
+
+	if is_file(target_path):
+		target_stat = os.stat(target_path)
+		settings += str(target_stat.st_size) + str(target_stat.st_mtime_ns)
+	return hashlib.sha1(settings.encode()).hexdigest()
+
+
+def are_frames_extracted() -> bool:
+	if JOB_CHECKPOINT and has_checkpoint():
+		return JOB_CHECKPOINT.get('frames_extracted')
+	return False
+
+
+def mark_frames_extracted() -> bool:
+	if JOB_CHECKPOINT:
+		with JOB_CHECKPOINT_LOCK:
+			JOB_CHECKPOINT['frames_extracted'] = True
+			JOB_CHECKPOINT['frame_progress'] = {}
+			return write_checkpoint()
+	return False
+
+
+def reset_frame_progress() -> bool:
+	if JOB_CHECKPOINT:
+		with JOB_CHECKPOINT_LOCK:
+			JOB_CHECKPOINT['frames_extracted'] = False
+			JOB_CHECKPOINT['frame_progress'] = {}
+			return write_checkpoint()
+	return False
+
+
+def verify_frame_progress(target_path : str) -> bool:
+	if JOB_CHECKPOINT and (JOB_CHECKPOINT.get('frames_extracted') or JOB_CHECKPOINT.get('frame_progress')) and not get_temp_frame_paths(target_path):
+		reset_frame_progress()
+		return False
+	return True
+
+
+def is_frame_done(checkpoint_stage : str, frame_number : int) -> bool:
+	if JOB_CHECKPOINT:
+		frame_progress = JOB_CHECKPOINT.get('frame_progress').get(checkpoint_stage)
+
+		if frame_progress:
+			return frame_number < frame_progress.get('frame_watermark') or frame_number in frame_progress.get('frame_numbers')
+	return False
+
+
+def mark_frame_done(checkpoint_stage : str, frame_number : int) -> bool:
+	global JOB_CHECKPOINT_PENDING_TOTAL
+
+	if JOB_CHECKPOINT:
+		with JOB_CHECKPOINT_LOCK:
+			frame_progress = JOB_CHECKPOINT.get('frame_progress').setdefault(checkpoint_stage,
+			{
+				'frame_watermark': 0,
+				'frame_numbers': []
+			})
+			frame_numbers = set(frame_progress.get('frame_numbers'))
+			frame_numbers.add(frame_number)
+
+			while frame_progress.get('frame_watermark') in frame_numbers:
+				frame_numbers.remove(frame_progress.get('frame_watermark'))
+				frame_progress['frame_watermark'] += 1
+			frame_progress['frame_numbers'] = sorted(frame_numbers)
+
+			if JOB_CHECKPOINT_PENDING_TOTAL + 1 >= JOB_CHECKPOINT_FLUSH_TOTAL or time() - JOB_CHECKPOINT_WRITE_TIME >= JOB_CHECKPOINT_FLUSH_INTERVAL:
+				return write_checkpoint()
+			JOB_CHECKPOINT_PENDING_TOTAL += 1
+			return True
+	return False
+
+
+def flush_checkpoint() -> bool:
+	if JOB_CHECKPOINT:
+		with JOB_CHECKPOINT_LOCK:
+			if JOB_CHECKPOINT_PENDING_TOTAL:
+				return write_checkpoint()
+			return True
+	return False
+
+
+def write_checkpoint() -> bool:
+	global JOB_CHECKPOINT_PENDING_TOTAL
+	global JOB_CHECKPOINT_WRITE_TIME
+
+	if JOB_CHECKPOINT_PATH and create_directory(os.path.dirname(JOB_CHECKPOINT_PATH)):
+		job_checkpoint_temp_path = JOB_CHECKPOINT_PATH + '.tmp'
+
+		if write_json(job_checkpoint_temp_path, JOB_CHECKPOINT): #type:ignore[arg-type]
+			os.replace(job_checkpoint_temp_path, JOB_CHECKPOINT_PATH)
+			JOB_CHECKPOINT_PENDING_TOTAL = 0
+			JOB_CHECKPOINT_WRITE_TIME = time()
+			return True
+	return False
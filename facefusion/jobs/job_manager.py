@@ -2,9 +2,13 @@ import os
 from copy import copy
 from typing import List, Optional
 
+import psutil
+
 import facefusion.choices
+from facefusion.common_helper import cast_int
 from facefusion.date_helper import get_current_date_time
 from facefusion.filesystem import create_directory, is_directory, is_file, move_file, remove_directory, remove_file, resolve_file_pattern
+from facefusion.jobs import job_checkpoint
 from facefusion.jobs.job_helper import get_step_output_path
 from facefusion.json import read_json, write_json
 from facefusion.typing import Args, Job, JobSet, JobStatus, JobStep, JobStepStatus
@@ -60,6 +64,8 @@ def submit_jobs() -> bool:
 
 
 def delete_job(job_id : str) -> bool:
+	for step_index in range(count_step_total(job_id)):
+		remove_file(job_checkpoint.get_checkpoint_path(job_id, step_index))
 	return delete_job_file(job_id)
 
 
@@ -233,6 +239,58 @@ def delete_job_file(job_id : str) -> bool:
 	return remove_file(job_path)
 
 
+def lock_job(job_id : str) -> bool:
+	job_lock_path = get_job_lock_path(job_id)
+
+	if is_file(job_lock_path) and not is_job_locked(job_id):
+		remove_stale_job_lock(job_lock_path)
+	if create_directory(os.path.dirname(job_lock_path)):
+		try:
+			with os.fdopen(os.open(job_lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY), 'w') as job_lock_file:
+				job_lock_file.write(str(os.getpid()))
+			return True
+		except FileExistsError:
+			return False
+	return False
+
+
+def unlock_job(job_id : str) -> bool:
+	job_lock_path = get_job_lock_path(job_id)
+	return remove_file(job_lock_path)
+
+
+def remove_stale_job_lock(job_lock_path : str) -> bool:
+	stale_job_lock_path = job_lock_path + '.' + str(os.getpid())
+
+	try:
+		os.rename(job_lock_path, stale_job_lock_path)
+	except OSError:
+		return False
+	if is_job_lock_alive(stale_job_lock_path):
+		try:
+			os.link(stale_job_lock_path, job_lock_path)
+		except OSError:
+			pass
+	return remove_file(stale_job_lock_path)
+
+
+def is_job_locked(job_id : str) -> bool:
+	job_lock_path = get_job_lock_path(job_id)
+	return is_job_lock_alive(job_lock_path)
+
+
+def is_job_lock_alive(job_lock_path : str) -> bool:
+	if is_file(job_lock_path):
+		with open(job_lock_path) as job_lock_file:
+			job_lock_pid = cast_int(job_lock_file.read())
+		return job_lock_pid is None or psutil.pid_exists(job_lock_pid)
+	return False
+
+
+def get_job_lock_path(job_id : str) -> str:
+	return os.path.join(JOBS_PATH, 'locks', job_id + '.lock')
+
+
 def suggest_job_path(job_id : str, job_status : JobStatus) -> Optional[str]:
 	job_file_name = get_job_file_name(job_id)
 
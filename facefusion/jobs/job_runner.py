@@ -1,25 +1,40 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Dict, List
+
+import psutil
+
+from facefusion import logger, state_manager
+from facefusion.common_helper import cast_int
 from facefusion.ffmpeg import concat_video
-from facefusion.filesystem import is_image, is_video, move_file, remove_file
-from facefusion.jobs import job_helper, job_manager
-from facefusion.typing import JobOutputSet, JobStep, ProcessStep
+from facefusion.filesystem import is_image, is_video, move_file, remove_directory, remove_file, resolve_file_pattern
+from facefusion.jobs import job_helper, job_manager, job_store
+from facefusion.typing import JobOutputSet, JobRunner, JobStep, ProcessStep
 
 
 def run_job(job_id : str, process_step : ProcessStep) -> bool:
 	queued_job_ids = job_manager.find_job_ids('queued')
 
-	if job_id in queued_job_ids:
+	if job_id in queued_job_ids and job_manager.lock_job(job_id):
+		if job_id not in job_manager.find_job_ids('queued'):
+			job_manager.unlock_job(job_id)
+			return False
 		if run_steps(job_id, process_step) and finalize_steps(job_id):
 			clean_steps(job_id)
-			return job_manager.move_job_file(job_id, 'completed')
+			return job_manager.move_job_file(job_id, 'completed') and job_manager.unlock_job(job_id)
 		clean_steps(job_id)
 		job_manager.move_job_file(job_id, 'failed')
+		job_manager.unlock_job(job_id)
 	return False
 
 
-def run_jobs(process_step : ProcessStep) -> bool:
+def run_jobs(process_step : ProcessStep, job_runner_workers : int = 1) -> bool:
 	queued_job_ids = job_manager.find_job_ids('queued')
 
 	if queued_job_ids:
+		if job_runner_workers > 1:
+			return run_job_workers(run_job, queued_job_ids, process_step, job_runner_workers)
 		for job_id in queued_job_ids:
 			if not run_job(job_id, process_step):
 				return False
@@ -35,10 +50,12 @@ def retry_job(job_id : str, process_step : ProcessStep) -> bool:
 	return False
 
 
-def retry_jobs(process_step : ProcessStep) -> bool:
+def retry_jobs(process_step : ProcessStep, job_runner_workers : int = 1) -> bool:
 	failed_job_ids = job_manager.find_job_ids('failed')
 
 	if failed_job_ids:
+		if job_runner_workers > 1:
+			return run_job_workers(retry_job, failed_job_ids, process_step, job_runner_workers)
 		for job_id in failed_job_ids:
 			if not retry_job(job_id, process_step):
 				return False
@@ -46,6 +63,33 @@ def retry_jobs(process_step : ProcessStep) -> bool:
 	return False
 
 
+def run_job_workers(job_runner : JobRunner, job_ids : List[str], process_step : ProcessStep, job_runner_workers : int) -> bool:
+	with ProcessPoolExecutor(max_workers = job_runner_workers, mp_context = get_context('spawn'), initializer = init_job_worker, initargs = (dict(state_manager.get_state()), job_store.get_job_keys(), job_store.get_step_keys(), job_manager.JOBS_PATH)) as executor:
+		futures = [ executor.submit(job_runner, job_id, process_step) for job_id in job_ids ]
+	clear_job_worker_temp_paths(state_manager.get_item('temp_path'))
+	return all([ future.result() for future in futures ])
+
+
+def init_job_worker(state : Dict[str, Any], job_keys : List[str], step_keys : List[str], jobs_path : str) -> None:
+	for key, value in state.items():
+		state_manager.init_item(key, value) #type:ignore[arg-type]
+	job_store.register_job_keys(job_keys)
+	job_store.register_step_keys(step_keys)
+	state_manager.init_item('temp_path', os.path.join(state_manager.get_item('temp_path'), 'worker-' + str(os.getpid())))
+	logger.init(state_manager.get_item('log_level'))
+	job_manager.init_jobs(jobs_path)
+
+
+def clear_job_worker_temp_paths(temp_path : str) -> bool:
+	if not state_manager.get_item('keep_temp'):
+		for worker_temp_path in resolve_file_pattern(os.path.join(temp_path, 'worker-*')):
+			worker_pid = cast_int(os.path.basename(worker_temp_path).split('-')[-1])
+
+			if worker_pid and not psutil.pid_exists(worker_pid):
+				remove_directory(worker_temp_path)
+	return True
+
+
 def run_step(job_id : str, step_index : int, step : JobStep, process_step : ProcessStep) -> bool:
 	step_args = step.get('args')
 
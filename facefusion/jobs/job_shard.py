@@ -0,0 +1,120 @@
+import os
+import subprocess
+import sys
+from time import sleep
+from typing import List
+
+from facefusion import process_manager, state_manager
+from facefusion.args import collect_step_args
+from facefusion.ffmpeg import concat_video
+from facefusion.filesystem import is_video, remove_directory
+from facefusion.jobs import job_helper, job_manager
+from facefusion.temp_helper import get_temp_directory_path, get_temp_file_path
+from facefusion.typing import JobShardRange
+
+
+def run_shards(target_path : str, trim_frame_start : int, trim_frame_end : int) -> bool:
+	shard_job_id = job_helper.suggest_job_id('shard')
+	shard_ranges = create_shard_ranges(trim_frame_start, trim_frame_end, state_manager.get_item('execution_shard_count'))
+	shard_job_ids = [ shard_job_id + '-' + str(shard_index) for shard_index in range(len(shard_ranges)) ]
+	shard_output_paths = [ get_shard_output_path(target_path, shard_index) for shard_index in range(len(shard_ranges)) ]
+	shard_jobs_path = get_shard_jobs_path(target_path)
+	shard_processes : List[subprocess.Popen[bytes]] = []
+
+	if create_shard_jobs(shard_jobs_path, shard_job_ids, shard_ranges, shard_output_paths):
+		try:
+			for shard_index, shard_job_id in enumerate(shard_job_ids):
+				commands = create_shard_commands(shard_job_id, shard_jobs_path, get_shard_temp_path(target_path, shard_index), len(shard_ranges))
+				shard_processes.append(subprocess.Popen(commands, cwd = get_shard_working_path()))
+			wait_shard_processes(shard_processes)
+		finally:
+			terminate_shard_processes(shard_processes)
+			remove_directory(shard_jobs_path)
+
+	if len(shard_processes) == len(shard_ranges) and all(shard_process.returncode == 0 for shard_process in shard_processes) and all(map(is_video, shard_output_paths)):
+		return concat_video(get_temp_file_path(target_path), shard_output_paths)
+	return False
+
+
+def create_shard_jobs(shard_jobs_path : str, shard_job_ids : List[str], shard_ranges : List[JobShardRange], shard_output_paths : List[str]) -> bool:
+	jobs_path = job_manager.JOBS_PATH
+	shard_job_total = 0
+
+	if job_manager.init_jobs(shard_jobs_path):
+		for shard_job_id, (shard_frame_start, shard_frame_end), shard_output_path in zip(shard_job_ids, shard_ranges, shard_output_paths):
+			step_args = collect_step_args()
+			step_args['trim_frame_start'] = shard_frame_start
+			step_args['trim_frame_end'] = shard_frame_end
+			step_args['output_path'] = shard_output_path
+			step_args['skip_audio'] = True
+
+			if job_manager.create_job(shard_job_id) and job_manager.add_step(shard_job_id, step_args) and job_manager.submit_job(shard_job_id):
+				shard_job_total += 1
+	job_manager.init_jobs(jobs_path)
+	return shard_job_total == len(shard_job_ids)
+
+
+def wait_shard_processes(shard_processes : List[subprocess.Popen[bytes]]) -> bool:
+	while any(shard_process.poll() is None for shard_process in shard_processes):
+		if process_manager.is_stopping() or any(shard_process.poll() for shard_process in shard_processes):
+			return False
+		sleep(0.5)
+	return all(shard_process.returncode == 0 for shard_process in shard_processes)
+
+
+def terminate_shard_processes(shard_processes : List[subprocess.Popen[bytes]]) -> None:
+	for shard_process in shard_processes:
+		if shard_process.poll() is None:
+			shard_process.terminate()
+	for shard_process in shard_processes:
+		shard_process.wait()
+
+
+def create_shard_ranges(trim_frame_start : int, trim_frame_end : int, shard_count : int) -> List[JobShardRange]:
+	shard_ranges = []
+	trim_frame_total = trim_frame_end - trim_frame_start
+	shard_count = max(1, min(shard_count, trim_frame_total))
+
+	for shard_index in range(shard_count):
+		shard_frame_start = trim_frame_start + trim_frame_total * shard_index // shard_count
+		shard_frame_end = trim_frame_start + trim_frame_total * (shard_index + 1) // shard_count
+		shard_ranges.append((shard_frame_start, shard_frame_end))
+	return shard_ranges
+
+
+def create_shard_commands(job_id : str, jobs_path : str, temp_path : str, shard_total : int) -> List[str]:
+	execution_thread_count = max(1, state_manager.get_item('execution_thread_count') // shard_total)
+	commands = [ sys.executable, os.path.join(get_shard_working_path(), 'facefusion.py'), 'job-run', job_id ]
+	commands.extend([ '--config-path', state_manager.get_item('config_path'), '--jobs-path', jobs_path, '--temp-path', temp_path ])
+	commands.extend([ '--execution-device-id', state_manager.get_item('execution_device_id'), '--execution-providers' ] + state_manager.get_item('execution_providers'))
+	commands.extend([ '--execution-thread-count', str(execution_thread_count), '--execution-queue-count', str(state_manager.get_item('execution_queue_count')) ])
+	commands.extend([ '--execution-worker-strategy', state_manager.get_item('execution_worker_strategy'), '--execution-shard-count', '1' ])
+	commands.extend([ '--execution-intra-op-thread-count', str(state_manager.get_item('execution_intra_op_thread_count')), '--execution-inter-op-thread-count', str(state_manager.get_item('execution_inter_op_thread_count')), '--execution-session-concurrency', str(state_manager.get_item('execution_session_concurrency')) ])
+	commands.extend([ '--execution-batch-size', str(state_manager.get_item('execution_batch_size')), '--execution-batch-timeout', str(state_manager.get_item('execution_batch_timeout')) ])
+	commands.extend([ '--execution-mode', state_manager.get_item('execution_mode'), '--execution-graph-optimization', state_manager.get_item('execution_graph_optimization'), '--execution-memory-optimizations' ] + state_manager.get_item('execution_memory_optimizations'))
+	commands.extend([ '--execution-model-precision', state_manager.get_item('execution_model_precision') ])
+	commands.extend([ '--download-providers' ] + state_manager.get_item('download_providers'))
+	commands.extend([ '--video-memory-strategy', state_manager.get_item('video_memory_strategy'), '--system-memory-limit', str(state_manager.get_item('system_memory_limit')), '--face-store-memory-limit', str(state_manager.get_item('face_store_memory_limit')) ])
+	commands.extend([ '--log-level', state_manager.get_item('log_level') ])
+	if state_manager.get_item('face_cache_path'):
+		commands.extend([ '--face-cache-path', state_manager.get_item('face_cache_path') ])
+	if state_manager.get_item('execution_model_cache'):
+		commands.append('--execution-model-cache')
+	return commands
+
+
+def get_shard_working_path() -> str:
+	return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def get_shard_jobs_path(target_path : str) -> str:
+	return os.path.join(get_temp_directory_path(target_path), 'shards', 'jobs')
+
+
+def get_shard_temp_path(target_path : str, shard_index : int) -> str:
+	return os.path.join(get_temp_directory_path(target_path), 'shards', str(shard_index))
+
+
+def get_shard_output_path(target_path : str, shard_index : int) -> str:
+	_, output_file_extension = os.path.splitext(state_manager.get_item('output_path'))
+	return os.path.join(get_temp_directory_path(target_path), 'shard-' + str(shard_index) + output_file_extension)
@@ -1,3 +1,4 @@
+import os
 from functools import lru_cache
 
 import onnx
@@ -9,3 +10,8 @@ from facefusion.typing import ModelInitializer
 def get_static_model_initializer(model_path : str) -> ModelInitializer:
 	model = onnx.load(model_path)
 	return onnx.numpy_helper.to_array(model.graph.initializer[-1])
+
+
+def resolve_quantized_model_path(model_path : str) -> str:
+	model_name, model_extension = os.path.splitext(model_path)
+	return model_name + '.int8' + model_extension
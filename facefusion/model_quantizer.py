@@ -0,0 +1,139 @@
+import os
+from types import ModuleType
+from typing import Any, Dict, List, Optional
+
+import cv2
+import numpy
+from numpy.typing import NDArray
+from onnxruntime import InferenceSession, NodeArg
+from onnxruntime.quantization import CalibrationDataReader, QuantFormat, QuantType, quantize_dynamic, quantize_static
+
+from facefusion import logger, state_manager, wording
+from facefusion.filesystem import is_file, move_file, remove_file
+from facefusion.model_helper import resolve_quantized_model_path
+from facefusion.typing import Face, ModelDrift, ModelInputs, VisionFrame
+
+MODEL_INPUT_TYPES : Dict[str, Any] =\
+{
+	'tensor(float)': numpy.float32,
+	'tensor(float16)': numpy.float16,
+	'tensor(double)': numpy.float64
+}
+
+
+class ModelInputsReader(CalibrationDataReader):
+	def __init__(self, model_inputs : List[ModelInputs]) -> None:
+		self.model_inputs = iter(model_inputs)
+
+	def get_next(self) -> Optional[ModelInputs]:
+		return next(self.model_inputs, None)
+
+
+def quantize_model(model_path : str, model_inputs : List[ModelInputs]) -> bool:
+	quantize_method = state_manager.get_item('quantize_method')
+	quantized_model_path = resolve_quantized_model_path(model_path)
+	temp_model_path = quantized_model_path + '.' + str(os.getpid()) + '.tmp'
+	model_file_name = os.path.basename(model_path)
+	inference_session = InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ])
+
+	logger.info(wording.get('quantizing_model').format(model_file_name = model_file_name), __name__)
+	if quantize_method == 'static':
+		quantize_static(model_path, temp_model_path, ModelInputsReader(model_inputs), quant_format = QuantFormat.QDQ, activation_type = QuantType.QUInt8, weight_type = QuantType.QInt8)
+	if quantize_method == 'dynamic':
+		quantize_dynamic(model_path, temp_model_path, weight_type = QuantType.QUInt8)
+
+	if is_file(temp_model_path):
+		quantized_inference_session = InferenceSession(temp_model_path, providers = [ 'CPUExecutionProvider' ])
+		model_drift = calc_model_drift(inference_session, quantized_inference_session, model_inputs)
+		model_drift_format =\
+		{
+			'model_file_name': model_file_name,
+			'similarity': round(model_drift.get('similarity'), 4),
+			'psnr': round(model_drift.get('psnr'), 2)
+		}
+
+		if model_drift.get('similarity') >= state_manager.get_item('quantize_min_similarity') and model_drift.get('psnr') >= state_manager.get_item('quantize_min_psnr'):
+			logger.info(wording.get('quantizing_model_succeed').format(**model_drift_format), __name__)
+			return move_file(temp_model_path, quantized_model_path)
+		logger.warn(wording.get('quantizing_model_rejected').format(**model_drift_format), __name__)
+		remove_file(temp_model_path)
+	return False
+
+
+def collect_model_inputs(model_module : ModuleType, model_name : str, model_source_name : str, model_path : str, calibration_vision_frames : List[VisionFrame], calibration_faces_set : List[List[Face]]) -> List[ModelInputs]:
+	inference_session = InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ])
+	model_input_names = [ model_input.name for model_input in inference_session.get_inputs() ]
+	model_inputs = []
+
+	if hasattr(model_module, 'create_calibration_inputs'):
+		for calibration_vision_frame, calibration_faces in zip(calibration_vision_frames, calibration_faces_set):
+			for calibration_inputs in model_module.create_calibration_inputs(model_name, model_source_name, calibration_vision_frame, calibration_faces):
+				if all(model_input_name in calibration_inputs for model_input_name in model_input_names):
+					model_inputs.append({ model_input_name: calibration_inputs.get(model_input_name) for model_input_name in model_input_names })
+
+	if not model_inputs:
+		model_inputs = [ create_model_inputs(inference_session, calibration_vision_frame) for calibration_vision_frame in calibration_vision_frames ]
+	return model_inputs
+
+
+def create_model_inputs(inference_session : InferenceSession, calibration_vision_frame : VisionFrame) -> ModelInputs:
+	model_inputs = {}
+
+	for model_input in inference_session.get_inputs():
+		model_inputs[model_input.name] = create_model_input(model_input, calibration_vision_frame)
+	return model_inputs
+
+
+def create_model_input(model_input : NodeArg, calibration_vision_frame : VisionFrame) -> NDArray[Any]:
+	model_input_type = MODEL_INPUT_TYPES.get(model_input.type, numpy.float32)
+	model_input_shape = [ dimension if isinstance(dimension, int) else 1 for dimension in model_input.shape ]
+
+	if len(model_input_shape) == 4:
+		model_input_shape[1:] = [ dimension if isinstance(dimension, int) else 256 for dimension in model_input.shape[1:] ]
+
+		if model_input_shape[1] in [ 1, 3 ]:
+			calibration_vision_frame = cv2.resize(calibration_vision_frame, (model_input_shape[3], model_input_shape[2]))
+			calibration_vision_frame = calibration_vision_frame[:, :, ::-1][:, :, :model_input_shape[1]].transpose(2, 0, 1)
+		else:
+			calibration_vision_frame = cv2.resize(calibration_vision_frame, (model_input_shape[2], model_input_shape[1]))
+			calibration_vision_frame = calibration_vision_frame[:, :, ::-1][:, :, :model_input_shape[3]]
+		return numpy.expand_dims(calibration_vision_frame / 255, axis = 0).astype(model_input_type)
+
+	model_input_vector = numpy.random.default_rng(0).standard_normal(model_input_shape)
+	model_input_vector /= numpy.linalg.norm(model_input_vector, axis = -1, keepdims = True)
+	return model_input_vector.astype(model_input_type)
+
+
+def calc_model_drift(inference_session : InferenceSession, quantized_inference_session : InferenceSession, model_inputs : List[ModelInputs]) -> ModelDrift:
+	model_drift : ModelDrift =\
+	{
+		'similarity': 1.0,
+		'psnr': 100.0
+	}
+
+	for model_input in model_inputs:
+		for output, quantized_output in zip(inference_session.run(None, model_input), quantized_inference_session.run(None, model_input)):
+			model_drift['similarity'] = min(model_drift.get('similarity'), calc_cosine_similarity(output, quantized_output))
+			if output.ndim > 2:
+				model_drift['psnr'] = min(model_drift.get('psnr'), calc_psnr(output, quantized_output))
+	return model_drift
+
+
+def calc_cosine_similarity(output : NDArray[Any], quantized_output : NDArray[Any]) -> float:
+	output = output.ravel().astype(numpy.float64)
+	quantized_output = quantized_output.ravel().astype(numpy.float64)
+	output_norm = numpy.linalg.norm(output) * numpy.linalg.norm(quantized_output)
+
+	if output_norm > 0:
+		return float(numpy.dot(output, quantized_output) / output_norm)
+	return float(numpy.array_equal(output, quantized_output))
+
+
+def calc_psnr(output : NDArray[Any], quantized_output : NDArray[Any]) -> float:
+	output = output.astype(numpy.float64)
+	output_range = max(numpy.ptp(output), 1e-6)
+	output_error = numpy.mean(numpy.square(output - quantized_output.astype(numpy.float64)))
+
+	if output_error > 0:
+		return float(min(10 * numpy.log10(output_range ** 2 / output_error), 100.0))
+	return 100.0
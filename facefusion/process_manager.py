@@ -1,4 +1,4 @@
-from typing import Generator, List
+from typing import Generator, Iterable
 
 from facefusion.typing import ProcessState, QueuePayload
 
@@ -47,7 +47,7 @@ def end() -> None:
 	set_process_state('pending')
 
 
-def manage(queue_payloads : List[QueuePayload]) -> Generator[QueuePayload, None, None]:
+def manage(queue_payloads : Iterable[QueuePayload]) -> Generator[QueuePayload, None, None]:
 	for query_payload in queue_payloads:
 		if is_processing():
 			yield query_payload
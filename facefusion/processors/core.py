@@ -1,15 +1,33 @@
 import importlib
+import itertools
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from queue import Queue
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from queue import Full, Queue
+from threading import current_thread
+from time import time
 from types import ModuleType
-from typing import Any, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+import cv2
+import numpy
 from tqdm import tqdm
 
-from facefusion import logger, state_manager, wording
+from facefusion import logger, process_manager, state_manager, wording
+from facefusion.audio import create_empty_audio_frame, get_voice_frame, read_static_voice
+from facefusion.common_helper import get_first
 from facefusion.exit_helper import hard_exit
-from facefusion.typing import ProcessFrames, QueuePayload
+from facefusion.face_analyser import get_average_face, get_many_faces
+from facefusion.face_selector import sort_faces_by_order
+from facefusion.face_tracker import clear_face_tracker
+from facefusion.face_store import get_reference_faces
+from facefusion.filesystem import filter_audio_paths, filter_image_paths
+from facefusion.jobs import job_checkpoint
+from facefusion.processors.typing import ProcessorChainInputs, SharedFrameWorker
+from facefusion.temp_helper import get_temp_frames_pattern
+from facefusion.typing import Face, FaceSet, Fps, MergeVisionFrame, ProcessFrames, QueuePayload, SchedulerMetrics, UpdateProgress, VisionFrame
+from facefusion.vision import read_image, read_queue_payload_frame, read_static_images, restrict_video_fps, unpack_resolution, write_image
 
 PROCESSORS_METHODS =\
 [
@@ -26,6 +44,13 @@ PROCESSORS_METHODS =\
 	'process_image',
 	'process_video'
 ]
+SCHEDULER_METRICS : SchedulerMetrics =\
+{
+	'start_time': 0.0,
+	'queue_depth': 0,
+	'worker_busy_times': {}
+}
+SHARED_FRAME_WORKER : SharedFrameWorker = {} #type:ignore[typeddict-item]
 
 
 def load_processor_module(processor : str) -> Any:
@@ -54,35 +79,368 @@ def get_processors_modules(processors : List[str]) -> List[ModuleType]:
 
 
 def multi_process_frames(source_paths : List[str], temp_frame_paths : List[str], process_frames : ProcessFrames) -> None:
-	queue_payloads = create_queue_payloads(temp_frame_paths)
-	with tqdm(total = len(queue_payloads), desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+	checkpoint_stage = process_frames.__module__
+	processors = state_manager.get_item('processors') if checkpoint_stage == __name__ else [ checkpoint_stage.split('.')[-1] ]
+	queue_payloads = [ queue_payload for queue_payload in create_queue_payloads(temp_frame_paths) if not job_checkpoint.is_frame_done(checkpoint_stage, queue_payload.get('frame_number')) ]
+	execution_thread_count = state_manager.get_item('execution_thread_count')
+	queue : Queue[Optional[QueuePayload]] = Queue(maxsize = execution_thread_count * state_manager.get_item('execution_queue_count'))
+	reset_scheduler_metrics()
+
+	if checkpoint_stage == __name__:
+		prepare_chain_voices(source_paths)
+
+	with tqdm(total = len(temp_frame_paths), initial = len(temp_frame_paths) - len(queue_payloads), desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
 		progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
-		with ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count')) as executor:
+		with ThreadPoolExecutor(max_workers = execution_thread_count) as executor:
 			futures = []
-			queue : Queue[QueuePayload] = create_queue(queue_payloads)
-			queue_per_future = max(len(queue_payloads) // state_manager.get_item('execution_thread_count') * state_manager.get_item('execution_queue_count'), 1)
 
-			while not queue.empty():
-				future = executor.submit(process_frames, source_paths, pick_queue(queue, queue_per_future), progress.update)
+			for _ in range(execution_thread_count):
+				future = executor.submit(process_frames, source_paths, pull_queue(queue, checkpoint_stage), progress.update)
 				futures.append(future)
 
+			for queue_payload in process_manager.manage(prime_queue_payloads(queue_payloads, processors)):
+				push_queue(queue, queue_payload, futures)
+				SCHEDULER_METRICS['queue_depth'] = queue.qsize()
+
+			for _ in futures:
+				push_queue(queue, None, futures)
+
 			for future_done in as_completed(futures):
 				future_done.result()
+	log_worker_utilisations()
+	job_checkpoint.flush_checkpoint()
+
+
+def push_queue(queue : Queue[Optional[QueuePayload]], queue_payload : Optional[QueuePayload], futures : List[Future[None]]) -> bool:
+	while not all(future.done() for future in futures):
+		try:
+			queue.put(queue_payload, timeout = 0.1)
+			return True
+		except Full:
+			continue
+	return False
+
+
+def pull_queue(queue : Queue[Optional[QueuePayload]], checkpoint_stage : str) -> Iterator[QueuePayload]:
+	worker_name = current_thread().name
+
+	while queue_payload := queue.get():
+		if process_manager.is_processing():
+			busy_start_time = time()
+			yield queue_payload
+			register_worker_busy_time(worker_name, time() - busy_start_time)
+			job_checkpoint.mark_frame_done(checkpoint_stage, queue_payload.get('frame_number'))
+
+
+def prime_queue_payloads(queue_payloads : List[QueuePayload], processors : List[str]) -> Iterator[QueuePayload]:
+	face_detector_batch_size = state_manager.get_item('face_detector_batch_size')
+	target_frames = has_target_frames(processors)
+
+	if has_face_processors(processors) and (face_detector_batch_size > 1 or target_frames):
+		clear_face_tracker()
+
+		for index in range(0, len(queue_payloads), face_detector_batch_size):
+			queue_payloads_batch = []
+
+			for queue_payload in queue_payloads[index:index + face_detector_batch_size]:
+				queue_payload = queue_payload.copy()
+				queue_payload['vision_frame'] = read_image(queue_payload.get('frame_path'))
+				queue_payloads_batch.append(queue_payload)
+			vision_frames = [ queue_payload.get('vision_frame') for queue_payload in queue_payloads_batch ]
+			frame_numbers = [ queue_payload.get('frame_number') for queue_payload in queue_payloads_batch ] if target_frames else None
+			get_many_faces(vision_frames, frame_numbers)
+			yield from queue_payloads_batch
+	else:
+		yield from queue_payloads
+
+
+def prime_vision_frames(vision_frames : Iterator[VisionFrame], processors : List[str]) -> Iterator[VisionFrame]:
+	face_detector_batch_size = state_manager.get_item('face_detector_batch_size')
+	target_frames = has_target_frames(processors)
+	frame_number = 0
+
+	if has_face_processors(processors) and (face_detector_batch_size > 1 or target_frames):
+		clear_face_tracker()
+
+		while vision_frames_batch := list(itertools.islice(vision_frames, face_detector_batch_size)):
+			frame_numbers = list(range(frame_number, frame_number + len(vision_frames_batch))) if target_frames else None
+			get_many_faces(vision_frames_batch, frame_numbers)
+			frame_number += len(vision_frames_batch)
+			yield from vision_frames_batch
+	else:
+		yield from vision_frames
+
+
+def has_face_processors(processors : List[str]) -> bool:
+	return any(processor not in [ 'frame_colorizer', 'frame_enhancer' ] for processor in processors)
+
+
+def has_target_frames(processors : List[str]) -> bool:
+	return processors == state_manager.get_item('processors')[:len(processors)] and (state_manager.get_item('face_tracker_interval') > 1 or bool(state_manager.get_item('face_cache_path')))
+
+
+def reset_scheduler_metrics() -> None:
+	SCHEDULER_METRICS['start_time'] = time()
+	SCHEDULER_METRICS['queue_depth'] = 0
+	SCHEDULER_METRICS['worker_busy_times'] = {}
+
+
+def get_scheduler_metrics() -> SchedulerMetrics:
+	return SCHEDULER_METRICS
+
+
+def register_worker_busy_time(worker_name : str, busy_time : float) -> None:
+	worker_busy_times = SCHEDULER_METRICS.get('worker_busy_times')
+	worker_busy_times[worker_name] = worker_busy_times.get(worker_name, 0) + busy_time
+
+
+def get_worker_utilisations() -> Dict[str, float]:
+	scheduler_time = max(time() - SCHEDULER_METRICS.get('start_time'), 1e-6)
+	worker_utilisations = {}
+
+	for worker_name, worker_busy_time in SCHEDULER_METRICS.get('worker_busy_times').items():
+		worker_utilisations[worker_name] = min(worker_busy_time / scheduler_time, 1.0)
+	return worker_utilisations
+
+
+def log_worker_utilisations() -> None:
+	for worker_name, worker_utilisation in get_worker_utilisations().items():
+		logger.debug(wording.get('worker_utilisation').format(worker = worker_name, utilisation = round(worker_utilisation * 100)), __name__)
+
+
+def multi_process_pipe_frames(source_paths : List[str], target_vision_frames : Iterator[VisionFrame], temp_frame_total : int, merge_vision_frame : Optional[MergeVisionFrame]) -> None:
+	if state_manager.get_item('execution_worker_strategy') == 'process':
+		return multi_process_shared_frames(source_paths, target_vision_frames, temp_frame_total, merge_vision_frame)
+	processor_modules = get_processors_modules(state_manager.get_item('processors'))
+	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
+	source_face = get_source_face(source_paths)
+	source_audio_path = get_first(filter_audio_paths(source_paths))
+	temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
+	temp_frames_pattern = get_temp_frames_pattern(state_manager.get_item('target_path'), '%08d')
+	future_limit = state_manager.get_item('execution_thread_count') * state_manager.get_item('execution_queue_count')
+	reorder_vision_frames : Dict[int, VisionFrame] = {}
+	merge_frame_number = 0
+	reset_scheduler_metrics()
+	prepare_chain_voices(source_paths)
+
+	with tqdm(total = temp_frame_total, desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+		progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
+		with ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count')) as executor:
+			futures : Set[Future[Tuple[int, Optional[VisionFrame]]]] = set()
 
+			for frame_number, target_vision_frame in enumerate(prime_vision_frames(target_vision_frames, state_manager.get_item('processors'))):
+				if not merge_vision_frame and job_checkpoint.is_frame_done(__name__, frame_number):
+					progress.update(1)
+					continue
+				while len(futures) + len(reorder_vision_frames) >= future_limit:
+					futures_done, futures = wait(futures, return_when = FIRST_COMPLETED)
+					merge_frame_number = reorder_merge_frames([ future_done.result() for future_done in futures_done ], reorder_vision_frames, merge_frame_number, merge_vision_frame)
+				inputs = create_chain_inputs(reference_faces, source_face, source_audio_path, temp_video_fps, frame_number, target_vision_frame)
+				temp_frame_path = None if merge_vision_frame else temp_frames_pattern % (frame_number + 1)
+				future = executor.submit(process_pipe_frame, processor_modules, inputs, frame_number, temp_frame_path, progress.update)
+				futures.add(future)
+				SCHEDULER_METRICS['queue_depth'] = len(futures)
+
+			reorder_merge_frames([ future_done.result() for future_done in as_completed(futures) ], reorder_vision_frames, merge_frame_number, merge_vision_frame)
+	log_worker_utilisations()
+	job_checkpoint.flush_checkpoint()
+
+
+def reorder_merge_frames(output_frames : List[Tuple[int, Optional[VisionFrame]]], reorder_vision_frames : Dict[int, VisionFrame], merge_frame_number : int, merge_vision_frame : Optional[MergeVisionFrame]) -> int:
+	for frame_number, output_vision_frame in output_frames:
+		if merge_vision_frame:
+			reorder_vision_frames[frame_number] = output_vision_frame
+		else:
+			job_checkpoint.mark_frame_done(__name__, frame_number)
+
+		while merge_frame_number in reorder_vision_frames:
+			merge_vision_frame(reorder_vision_frames.pop(merge_frame_number))
+			merge_frame_number += 1
+	return merge_frame_number
+
+
+def process_pipe_frame(processor_modules : List[ModuleType], inputs : ProcessorChainInputs, frame_number : int, temp_frame_path : Optional[str], update_progress : UpdateProgress) -> Tuple[int, Optional[VisionFrame]]:
+	busy_start_time = time()
+	output_vision_frame = process_chain_frame(processor_modules, inputs)
+
+	if temp_frame_path:
+		write_image(temp_frame_path, output_vision_frame)
+		output_vision_frame = None
+	register_worker_busy_time(current_thread().name, time() - busy_start_time)
+	update_progress(1)
+	return frame_number, output_vision_frame
+
+
+def multi_process_shared_frames(source_paths : List[str], target_vision_frames : Iterator[VisionFrame], temp_frame_total : int, merge_vision_frame : Optional[MergeVisionFrame]) -> None:
+	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
+	source_face = get_source_face(source_paths)
+	temp_frames_pattern = get_temp_frames_pattern(state_manager.get_item('target_path'), '%08d')
+	slot_total = state_manager.get_item('execution_thread_count') * state_manager.get_item('execution_queue_count')
+	target_vision_frame = next(target_vision_frames, None)
+
+	if target_vision_frame is None:
+		return
+	shared_frame_size = target_vision_frame.nbytes
+	if merge_vision_frame:
+		output_video_width, output_video_height = unpack_resolution(state_manager.get_item('output_video_resolution'))
+		shared_frame_size = max(shared_frame_size, output_video_width * output_video_height * 3)
+	shared_memory = SharedMemory(create = True, size = shared_frame_size * slot_total)
+	free_slot_indices = list(range(slot_total))
+	reorder_vision_frames : Dict[int, VisionFrame] = {}
+	merge_frame_number = 0
+	reset_scheduler_metrics()
+
+	try:
+		with tqdm(total = temp_frame_total, desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+			progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
+			with ProcessPoolExecutor(max_workers = state_manager.get_item('execution_thread_count'), mp_context = get_context('spawn'), initializer = init_shared_frame_worker, initargs = (dict(state_manager.get_state()), reference_faces, source_face, shared_memory.name, shared_frame_size)) as executor:
+				futures : Set[Future[Tuple[int, int, Optional[Tuple[int, ...]]]]] = set()
+
+				for frame_number, target_vision_frame in enumerate(itertools.chain([ target_vision_frame ], target_vision_frames)):
+					if not merge_vision_frame and job_checkpoint.is_frame_done(__name__, frame_number):
+						progress.update(1)
+						continue
+					while len(futures) + len(reorder_vision_frames) >= slot_total:
+						futures_done, futures = wait(futures, return_when = FIRST_COMPLETED)
+						output_frames = collect_shared_frames(futures_done, shared_memory, shared_frame_size, free_slot_indices)
+						merge_frame_number = reorder_merge_frames(output_frames, reorder_vision_frames, merge_frame_number, merge_vision_frame)
+					slot_index = free_slot_indices.pop()
+					write_shared_frame(shared_memory, shared_frame_size, slot_index, target_vision_frame)
+					temp_frame_path = None if merge_vision_frame else temp_frames_pattern % (frame_number + 1)
+					future = executor.submit(process_shared_frame, frame_number, slot_index, target_vision_frame.shape, temp_frame_path)
+					future.add_done_callback(lambda _: progress.update(1))
+					futures.add(future)
+					SCHEDULER_METRICS['queue_depth'] = len(futures)
+
+				output_frames = collect_shared_frames(as_completed(futures), shared_memory, shared_frame_size, free_slot_indices)
+				reorder_merge_frames(output_frames, reorder_vision_frames, merge_frame_number, merge_vision_frame)
+	finally:
+		shared_memory.close()
+		shared_memory.unlink()
+		job_checkpoint.flush_checkpoint()
+
+
+def collect_shared_frames(futures_done : Iterable[Future[Tuple[int, int, Optional[Tuple[int, ...]]]]], shared_memory : SharedMemory, shared_frame_size : int, free_slot_indices : List[int]) -> List[Tuple[int, Optional[VisionFrame]]]:
+	output_frames = []
+
+	for future_done in futures_done:
+		frame_number, slot_index, output_vision_frame_shape = future_done.result()
+		output_vision_frame = None
+		if output_vision_frame_shape:
+			output_vision_frame = read_shared_frame(shared_memory, shared_frame_size, slot_index, output_vision_frame_shape)
+		free_slot_indices.append(slot_index)
+		output_frames.append((frame_number, output_vision_frame))
+	return output_frames
+
+
+def init_shared_frame_worker(state : Dict[str, Any], reference_faces : Optional[FaceSet], source_face : Optional[Face], shared_memory_name : str, shared_frame_size : int) -> None:
+	for key, value in state.items():
+		state_manager.init_item(key, value) #type:ignore[arg-type]
+	process_manager.start()
+	SHARED_FRAME_WORKER['shared_memory'] = SharedMemory(name = shared_memory_name)
+	SHARED_FRAME_WORKER['shared_frame_size'] = shared_frame_size
+	SHARED_FRAME_WORKER['processor_modules'] = get_processors_modules(state_manager.get_item('processors'))
+	SHARED_FRAME_WORKER['reference_faces'] = reference_faces
+	SHARED_FRAME_WORKER['source_face'] = source_face
+	SHARED_FRAME_WORKER['source_audio_path'] = get_first(filter_audio_paths(state_manager.get_item('source_paths')))
+	SHARED_FRAME_WORKER['temp_video_fps'] = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
+	prepare_chain_voices(state_manager.get_item('source_paths'))
+
+
+def process_shared_frame(frame_number : int, slot_index : int, target_vision_frame_shape : Tuple[int, ...], temp_frame_path : Optional[str]) -> Tuple[int, int, Optional[Tuple[int, ...]]]:
+	shared_memory = SHARED_FRAME_WORKER.get('shared_memory')
+	shared_frame_size = SHARED_FRAME_WORKER.get('shared_frame_size')
+	target_vision_frame = read_shared_frame(shared_memory, shared_frame_size, slot_index, target_vision_frame_shape)
+	inputs = create_chain_inputs(SHARED_FRAME_WORKER.get('reference_faces'), SHARED_FRAME_WORKER.get('source_face'), SHARED_FRAME_WORKER.get('source_audio_path'), SHARED_FRAME_WORKER.get('temp_video_fps'), frame_number, target_vision_frame)
+	output_vision_frame = process_chain_frame(SHARED_FRAME_WORKER.get('processor_modules'), inputs)
+
+	if temp_frame_path:
+		write_image(temp_frame_path, output_vision_frame)
+		return frame_number, slot_index, None
+	output_video_width, output_video_height = unpack_resolution(state_manager.get_item('output_video_resolution'))
+	if output_vision_frame.shape[:2] != (output_video_height, output_video_width):
+		output_vision_frame = cv2.resize(output_vision_frame, (output_video_width, output_video_height))
+	write_shared_frame(shared_memory, shared_frame_size, slot_index, output_vision_frame)
+	return frame_number, slot_index, output_vision_frame.shape
+
+
+def read_shared_frame(shared_memory : SharedMemory, shared_frame_size : int, slot_index : int, vision_frame_shape : Tuple[int, ...]) -> VisionFrame:
+	shared_vision_frame = numpy.ndarray(vision_frame_shape, dtype = numpy.uint8, buffer = shared_memory.buf, offset = slot_index * shared_frame_size)
+	return shared_vision_frame.copy()
+
+
+def write_shared_frame(shared_memory : SharedMemory, shared_frame_size : int, slot_index : int, vision_frame : VisionFrame) -> None:
+	shared_vision_frame = numpy.ndarray(vision_frame.shape, dtype = numpy.uint8, buffer = shared_memory.buf, offset = slot_index * shared_frame_size)
+	shared_vision_frame[:] = vision_frame
+
+
+def process_chain_frames(source_paths : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
+	processor_modules = get_processors_modules(state_manager.get_item('processors'))
+	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
+	source_face = get_source_face(source_paths)
+	source_audio_path = get_first(filter_audio_paths(source_paths))
+	temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
+
+	for queue_payload in process_manager.manage(queue_payloads):
+		frame_number = queue_payload.get('frame_number')
+		target_vision_path = queue_payload.get('frame_path')
+		target_vision_frame = read_queue_payload_frame(queue_payload)
+		inputs = create_chain_inputs(reference_faces, source_face, source_audio_path, temp_video_fps, frame_number, target_vision_frame)
+		output_vision_frame = process_chain_frame(processor_modules, inputs)
+		write_image(target_vision_path, output_vision_frame)
+		update_progress(1)
+
+
+def prepare_chain_voices(source_paths : List[str]) -> None:
+	if 'lip_syncer' in state_manager.get_item('processors'):
+		temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
+
+		for source_audio_path in filter_audio_paths(source_paths):
+			read_static_voice(source_audio_path, temp_video_fps)
+
+
+def create_chain_inputs(reference_faces : Optional[FaceSet], source_face : Optional[Face], source_audio_path : Optional[str], temp_video_fps : Fps, frame_number : int, target_vision_frame : VisionFrame) -> ProcessorChainInputs:
+	source_audio_frame = create_empty_audio_frame()
+
+	if 'lip_syncer' in state_manager.get_item('processors'):
+		temp_audio_frame = get_voice_frame(source_audio_path, temp_video_fps, frame_number)
+		if numpy.any(temp_audio_frame):
+			source_audio_frame = temp_audio_frame
+	return\
+	{
+		'reference_faces': reference_faces,
+		'source_face': source_face,
+		'source_audio_frame': source_audio_frame,
+		'source_vision_frame': target_vision_frame.copy(),
+		'target_vision_frame': target_vision_frame
+	}
+
+
+def process_chain_frame(processor_modules : List[ModuleType], inputs : ProcessorChainInputs) -> VisionFrame:
+	target_vision_frame = inputs.get('target_vision_frame')
+
+	for processor_module in processor_modules:
+		target_vision_frame = processor_module.process_frame(
+		{
+			'reference_faces': inputs.get('reference_faces'),
+			'source_face': inputs.get('source_face'),
+			'source_audio_frame': inputs.get('source_audio_frame'),
+			'source_vision_frame': inputs.get('source_vision_frame'),
+			'target_vision_frame': target_vision_frame
+		})
+	return target_vision_frame
 
-def create_queue(queue_payloads : List[QueuePayload]) -> Queue[QueuePayload]:
-	queue : Queue[QueuePayload] = Queue()
-	for queue_payload in queue_payloads:
-		queue.put(queue_payload)
-	return queue
 
+def get_source_face(source_paths : List[str]) -> Optional[Face]:
+	source_frames = read_static_images(filter_image_paths(source_paths))
+	source_faces = []
 
-def pick_queue(queue : Queue[QueuePayload], queue_per_future : int) -> List[QueuePayload]:
-	queues = []
-	for _ in range(queue_per_future):
-		if not queue.empty():
-			queues.append(queue.get())
-	return queues
+	for source_frame in source_frames:
+		temp_faces = get_many_faces([ source_frame ])
+		temp_faces = sort_faces_by_order(temp_faces, 'large-small')
+		if temp_faces:
+			source_faces.append(get_first(temp_faces))
+	return get_average_face(source_faces)
 
 
 def create_queue_payloads(temp_frame_paths : List[str]) -> List[QueuePayload]:
@@ -93,7 +451,8 @@ def create_queue_payloads(temp_frame_paths : List[str]) -> List[QueuePayload]:
 		frame_payload : QueuePayload =\
 		{
 			'frame_number': frame_number,
-			'frame_path': frame_path
+			'frame_path': frame_path,
+			'vision_frame': None
 		}
 		queue_payloads.append(frame_payload)
 	return queue_payloads
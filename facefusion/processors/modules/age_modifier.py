@@ -1,6 +1,6 @@
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import List
+from typing import Iterable, List
 
 import cv2
 import numpy
@@ -22,9 +22,8 @@ from facefusion.filesystem import in_directory, is_image, is_video, resolve_rela
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.typing import AgeModifierDirection, AgeModifierInputs
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import thread_semaphore
 from facefusion.typing import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
-from facefusion.vision import match_frame_color, read_image, read_static_image, write_image
+from facefusion.vision import match_frame_color, read_queue_payload_frame, read_static_image, write_image
 
 
 @lru_cache(maxsize = None)
@@ -171,7 +170,7 @@ def forward(crop_vision_frame : VisionFrame, extend_vision_frame : VisionFrame,
 		if age_modifier_input.name == 'direction':
 			age_modifier_inputs[age_modifier_input.name] = age_modifier_direction
 
-	with thread_semaphore():
+	with inference_manager.get_session_semaphore(age_modifier):
 		crop_vision_frame = age_modifier.run(None, age_modifier_inputs)[0][0]
 
 	return crop_vision_frame
@@ -220,12 +219,12 @@ def process_frame(inputs : AgeModifierInputs) -> VisionFrame:
 	return target_vision_frame
 
 
-def process_frames(source_path : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+def process_frames(source_path : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
 	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
 
 	for queue_payload in process_manager.manage(queue_payloads):
 		target_vision_path = queue_payload['frame_path']
-		target_vision_frame = read_image(target_vision_path)
+		target_vision_frame = read_queue_payload_frame(queue_payload)
 		output_vision_frame = process_frame(
 		{
 			'reference_faces': reference_faces,
@@ -1,6 +1,6 @@
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 import cv2
 import numpy
@@ -22,9 +22,9 @@ from facefusion.processors.live_portrait import create_rotation, limit_expressio
 from facefusion.processors.typing import ExpressionRestorerInputs
 from facefusion.processors.typing import LivePortraitExpression, LivePortraitFeatureVolume, LivePortraitMotionPoints, LivePortraitPitch, LivePortraitRoll, LivePortraitScale, LivePortraitTranslation, LivePortraitYaw
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import conditional_thread_semaphore, thread_semaphore
+from facefusion.thread_helper import conditional_thread_semaphore
 from facefusion.typing import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
-from facefusion.vision import get_video_frame, read_image, read_static_image, write_image
+from facefusion.vision import get_video_frame, read_queue_payload_frame, read_static_image, write_image
 
 
 @lru_cache(maxsize = None)
@@ -205,7 +205,7 @@ def forward_extract_motion(crop_vision_frame : VisionFrame) -> Tuple[LivePortrai
 def forward_generate_frame(feature_volume : LivePortraitFeatureVolume, source_motion_points : LivePortraitMotionPoints, target_motion_points : LivePortraitMotionPoints) -> VisionFrame:
 	generator = get_inference_pool().get('generator')
 
-	with thread_semaphore():
+	with inference_manager.get_session_semaphore(generator):
 		crop_vision_frame = generator.run(None,
 		{
 			'feature_volume': feature_volume,
@@ -258,7 +258,7 @@ def process_frame(inputs : ExpressionRestorerInputs) -> VisionFrame:
 	return target_vision_frame
 
 
-def process_frames(source_path : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+def process_frames(source_path : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
 	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
 
 	for queue_payload in process_manager.manage(queue_payloads):
@@ -267,7 +267,7 @@ def process_frames(source_path : List[str], queue_payloads : List[QueuePayload],
 			frame_number += state_manager.get_item('trim_frame_start')
 		source_vision_frame = get_video_frame(state_manager.get_item('target_path'), frame_number)
 		target_vision_path = queue_payload.get('frame_path')
-		target_vision_frame = read_image(target_vision_path)
+		target_vision_frame = read_queue_payload_frame(queue_payload)
 		output_vision_frame = process_frame(
 		{
 			'reference_faces': reference_faces,
@@ -1,5 +1,5 @@
 from argparse import ArgumentParser
-from typing import List
+from typing import Iterable, List
 
 import cv2
 import numpy
@@ -18,7 +18,7 @@ from facefusion.processors import choices as processors_choices
 from facefusion.processors.typing import FaceDebuggerInputs
 from facefusion.program_helper import find_argument_group
 from facefusion.typing import ApplyStateItem, Args, Face, InferencePool, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
-from facefusion.vision import read_image, read_static_image, write_image
+from facefusion.vision import read_queue_payload_frame, read_static_image, write_image
 
 
 def get_inference_pool() -> InferencePool:
@@ -192,12 +192,12 @@ def process_frame(inputs : FaceDebuggerInputs) -> VisionFrame:
 	return target_vision_frame
 
 
-def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+def process_frames(source_paths : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
 	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
 
 	for queue_payload in process_manager.manage(queue_payloads):
 		target_vision_path = queue_payload['frame_path']
-		target_vision_frame = read_image(target_vision_path)
+		target_vision_frame = read_queue_payload_frame(queue_payload)
 		output_vision_frame = process_frame(
 		{
 			'reference_faces': reference_faces,
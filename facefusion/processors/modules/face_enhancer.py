@@ -1,6 +1,6 @@
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import List
+from typing import Iterable, List
 
 import cv2
 import numpy
@@ -20,9 +20,8 @@ from facefusion.filesystem import in_directory, is_image, is_video, resolve_rela
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.typing import FaceEnhancerInputs, FaceEnhancerWeight
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import thread_semaphore
-from facefusion.typing import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
-from facefusion.vision import read_image, read_static_image, write_image
+from facefusion.typing import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelInputs, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
+from facefusion.vision import read_queue_payload_frame, read_static_image, write_image
 
 
 @lru_cache(maxsize = None)
@@ -317,12 +316,27 @@ def forward(crop_vision_frame : VisionFrame, face_enhancer_weight : FaceEnhancer
 		if face_enhancer_input.name == 'weight':
 			face_enhancer_inputs[face_enhancer_input.name] = face_enhancer_weight
 
-	with thread_semaphore():
-		crop_vision_frame = face_enhancer.run(None, face_enhancer_inputs)[0][0]
+	with inference_manager.get_session_semaphore(face_enhancer):
+		crop_vision_frame = inference_manager.run_with_io_binding(face_enhancer, face_enhancer_inputs)[0][0]
 
 	return crop_vision_frame
 
 
+def create_calibration_inputs(model_name : str, model_source_name : str, vision_frame : VisionFrame, faces : List[Face]) -> List[ModelInputs]:
+	model_template = create_static_model_set('full').get(model_name).get('template')
+	model_size = create_static_model_set('full').get(model_name).get('size')
+	model_inputs = []
+
+	for face in faces:
+		crop_vision_frame, _ = warp_face_by_face_landmark_5(vision_frame, face.landmark_set.get('5/68'), model_template, model_size)
+		model_inputs.append(
+		{
+			'input': prepare_crop_frame(crop_vision_frame),
+			'weight': numpy.array([ 1.0 ]).astype(numpy.double)
+		})
+	return model_inputs
+
+
 def has_weight_input() -> bool:
 	face_enhancer = get_inference_pool().get('face_enhancer')
 
@@ -379,12 +393,12 @@ def process_frame(inputs : FaceEnhancerInputs) -> VisionFrame:
 	return target_vision_frame
 
 
-def process_frames(source_path : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+def process_frames(source_path : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
 	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
 
 	for queue_payload in process_manager.manage(queue_payloads):
 		target_vision_path = queue_payload['frame_path']
-		target_vision_frame = read_image(target_vision_path)
+		target_vision_frame = read_queue_payload_frame(queue_payload)
 		output_vision_frame = process_frame(
 		{
 			'reference_faces': reference_faces,
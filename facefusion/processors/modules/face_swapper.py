@@ -1,6 +1,6 @@
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import List, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 import numpy
 
@@ -15,17 +15,17 @@ from facefusion.execution import has_execution_provider
 from facefusion.face_analyser import get_average_face, get_many_faces, get_one_face
 from facefusion.face_helper import paste_back, warp_face_by_face_landmark_5
 from facefusion.face_masker import create_occlusion_mask, create_region_mask, create_static_box_mask
-from facefusion.face_selector import find_similar_faces, sort_and_filter_faces, sort_faces_by_order
+from facefusion.face_selector import find_similar_faces, map_similar_faces, sort_and_filter_faces, sort_faces_by_order
 from facefusion.face_store import get_reference_faces
 from facefusion.filesystem import filter_image_paths, has_image, in_directory, is_image, is_video, resolve_relative_path, same_file_extension
 from facefusion.model_helper import get_static_model_initializer
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.pixel_boost import explode_pixel_boost, implode_pixel_boost
-from facefusion.processors.typing import FaceSwapperInputs
+from facefusion.processors.typing import FaceSwapperInputs, FaceSwapperMapping
 from facefusion.program_helper import find_argument_group
 from facefusion.thread_helper import conditional_thread_semaphore
-from facefusion.typing import ApplyStateItem, Args, DownloadScope, Embedding, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
-from facefusion.vision import read_image, read_static_image, read_static_images, unpack_resolution, write_image
+from facefusion.typing import ApplyStateItem, Args, DownloadScope, Embedding, Face, InferencePool, ModelInputs, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
+from facefusion.vision import get_video_frame, read_image, read_queue_payload_frame, read_static_image, read_static_images, unpack_resolution, write_image
 
 
 @lru_cache(maxsize = None)
@@ -359,12 +359,14 @@ def register_args(program : ArgumentParser) -> None:
 		known_args, _ = program.parse_known_args()
 		face_swapper_pixel_boost_choices = processors_choices.face_swapper_set.get(known_args.face_swapper_model)
 		group_processors.add_argument('--face-swapper-pixel-boost', help = wording.get('help.face_swapper_pixel_boost'), default = config.get_str_value('processors.face_swapper_pixel_boost', get_first(face_swapper_pixel_boost_choices)), choices = face_swapper_pixel_boost_choices)
-		facefusion.jobs.job_store.register_step_keys([ 'face_swapper_model', 'face_swapper_pixel_boost' ])
+		group_processors.add_argument('--face-swapper-reference-positions', help = wording.get('help.face_swapper_reference_positions'), type = int, default = config.get_int_list('processors.face_swapper_reference_positions'), nargs = '+', metavar = 'FACE_SWAPPER_REFERENCE_POSITIONS')
+		facefusion.jobs.job_store.register_step_keys([ 'face_swapper_model', 'face_swapper_pixel_boost', 'face_swapper_reference_positions' ])
 
 
 def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
 	apply_state_item('face_swapper_model', args.get('face_swapper_model'))
 	apply_state_item('face_swapper_pixel_boost', args.get('face_swapper_pixel_boost'))
+	apply_state_item('face_swapper_reference_positions', args.get('face_swapper_reference_positions'))
 
 
 def pre_check() -> bool:
@@ -384,6 +386,9 @@ def pre_process(mode : ProcessMode) -> bool:
 	if not get_one_face(source_faces):
 		logger.error(wording.get('no_source_face_detected') + wording.get('exclamation_mark'), __name__)
 		return False
+	if mode == 'output' and state_manager.get_item('face_swapper_reference_positions') and not get_face_swapper_mapping():
+		logger.error(wording.get('match_source_and_reference_positions') + wording.get('exclamation_mark'), __name__)
+		return False
 	if mode in [ 'output', 'preview' ] and not is_image(state_manager.get_item('target_path')) and not is_video(state_manager.get_item('target_path')):
 		logger.error(wording.get('choose_image_or_video_target') + wording.get('exclamation_mark'), __name__)
 		return False
@@ -398,6 +403,7 @@ def pre_process(mode : ProcessMode) -> bool:
 
 def post_process() -> None:
 	read_static_image.cache_clear()
+	create_face_swapper_mapping.cache_clear()
 	if state_manager.get_item('video_memory_strategy') in [ 'strict', 'moderate' ]:
 		clear_inference_pool()
 		get_static_model_initializer.cache_clear()
@@ -462,7 +468,7 @@ def forward_swap_face(source_face : Face, crop_vision_frame : VisionFrame) -> Vi
 			face_swapper_inputs[face_swapper_input.name] = crop_vision_frame
 
 	with conditional_thread_semaphore():
-		crop_vision_frame = face_swapper.run(None, face_swapper_inputs)[0][0]
+		crop_vision_frame = inference_manager.run_with_io_binding(face_swapper, face_swapper_inputs)[0][0]
 
 	return crop_vision_frame
 
@@ -479,9 +485,41 @@ def forward_convert_embedding(embedding : Embedding) -> Embedding:
 	return embedding
 
 
+def create_calibration_inputs(model_name : str, model_source_name : str, vision_frame : VisionFrame, faces : List[Face]) -> List[ModelInputs]:
+	state_manager.set_item('face_swapper_model', model_name)
+	model_type = get_model_options().get('type')
+	model_template = get_model_options().get('template')
+	model_size = get_model_options().get('size')
+	model_inputs = []
+
+	for face in faces:
+		if model_source_name == 'face_swapper':
+			crop_vision_frame, _ = warp_face_by_face_landmark_5(vision_frame, face.landmark_set.get('5/68'), model_template, model_size)
+
+			if model_type in [ 'blendswap', 'uniface' ]:
+				source_input = prepare_source_crop_frame(vision_frame, face)
+			else:
+				source_input = prepare_source_embedding(face)
+			model_inputs.append(
+			{
+				'source': source_input,
+				'target': prepare_crop_frame(crop_vision_frame)
+			})
+		if model_source_name == 'embedding_converter':
+			model_inputs.append(
+			{
+				'input': face.embedding.reshape(-1, 512)
+			})
+	return model_inputs
+
+
 def prepare_source_frame(source_face : Face) -> VisionFrame:
+	source_vision_frame = read_static_image(resolve_source_path(source_face))
+	return prepare_source_crop_frame(source_vision_frame, source_face)
+
+
+def prepare_source_crop_frame(source_vision_frame : VisionFrame, source_face : Face) -> VisionFrame:
 	model_type = get_model_options().get('type')
-	source_vision_frame = read_static_image(get_first(state_manager.get_item('source_paths')))
 
 	if model_type == 'blendswap':
 		source_vision_frame, _ = warp_face_by_face_landmark_5(source_vision_frame, source_face.landmark_set.get('5/68'), 'arcface_112_v2', (112, 112))
@@ -493,6 +531,16 @@ def prepare_source_frame(source_face : Face) -> VisionFrame:
 	return source_vision_frame
 
 
+def resolve_source_path(source_face : Face) -> str:
+	face_swapper_mapping = get_face_swapper_mapping()
+
+	if face_swapper_mapping:
+		for source_path, mapping_source_face in zip(face_swapper_mapping.get('source_paths'), face_swapper_mapping.get('source_faces')):
+			if mapping_source_face is source_face:
+				return source_path
+	return get_first(state_manager.get_item('source_paths'))
+
+
 def prepare_source_embedding(source_face : Face) -> Embedding:
 	model_type = get_model_options().get('type')
 
@@ -542,6 +590,42 @@ def normalize_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
 	return crop_vision_frame
 
 
+def get_face_swapper_mapping() -> Optional[FaceSwapperMapping]:
+	face_swapper_reference_positions = state_manager.get_item('face_swapper_reference_positions')
+
+	if face_swapper_reference_positions:
+		source_image_paths = filter_image_paths(state_manager.get_item('source_paths'))
+		return create_face_swapper_mapping(tuple(source_image_paths), state_manager.get_item('target_path'), state_manager.get_item('reference_frame_number'), tuple(face_swapper_reference_positions))
+	return None
+
+
+@lru_cache(maxsize = None)
+def create_face_swapper_mapping(source_paths : Tuple[str, ...], target_path : str, reference_frame_number : int, reference_positions : Tuple[int, ...]) -> Optional[FaceSwapperMapping]:
+	source_faces = []
+
+	if is_video(target_path):
+		reference_frame = get_video_frame(target_path, reference_frame_number)
+	else:
+		reference_frame = read_image(target_path)
+	reference_faces = sort_and_filter_faces(get_many_faces([ reference_frame ]))
+
+	for source_path in source_paths:
+		temp_faces = get_many_faces([ read_static_image(source_path) ])
+		temp_faces = sort_faces_by_order(temp_faces, 'large-small')
+		if temp_faces:
+			source_faces.append(get_first(temp_faces))
+
+	if len(source_faces) == len(source_paths) == len(reference_positions) and 0 <= min(reference_positions) and max(reference_positions) < len(reference_faces):
+		face_swapper_mapping : FaceSwapperMapping =\
+		{
+			'source_paths': list(source_paths),
+			'source_faces': source_faces,
+			'reference_faces': [ reference_faces[reference_position] for reference_position in reference_positions ]
+		}
+		return face_swapper_mapping
+	return None
+
+
 def get_reference_frame(source_face : Face, target_face : Face, temp_vision_frame : VisionFrame) -> VisionFrame:
 	return swap_face(source_face, target_face, temp_vision_frame)
 
@@ -551,7 +635,12 @@ def process_frame(inputs : FaceSwapperInputs) -> VisionFrame:
 	source_face = inputs.get('source_face')
 	target_vision_frame = inputs.get('target_vision_frame')
 	many_faces = sort_and_filter_faces(get_many_faces([ target_vision_frame ]))
+	face_swapper_mapping = get_face_swapper_mapping()
 
+	if face_swapper_mapping:
+		for reference_index, mapped_face in map_similar_faces(many_faces, face_swapper_mapping.get('reference_faces'), state_manager.get_item('reference_face_distance')):
+			target_vision_frame = swap_face(face_swapper_mapping.get('source_faces')[reference_index], mapped_face, target_vision_frame)
+		return target_vision_frame
 	if state_manager.get_item('face_selector_mode') == 'many':
 		if many_faces:
 			for target_face in many_faces:
@@ -568,7 +657,7 @@ def process_frame(inputs : FaceSwapperInputs) -> VisionFrame:
 	return target_vision_frame
 
 
-def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+def process_frames(source_paths : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
 	reference_faces = get_reference_faces() if 'reference' in state_manager.get_item('face_selector_mode') else None
 	source_frames = read_static_images(source_paths)
 	source_faces = []
@@ -582,7 +671,7 @@ def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload]
 
 	for queue_payload in process_manager.manage(queue_payloads):
 		target_vision_path = queue_payload['frame_path']
-		target_vision_frame = read_image(target_vision_path)
+		target_vision_frame = read_queue_payload_frame(queue_payload)
 		output_vision_frame = process_frame(
 		{
 			'reference_faces': reference_faces,
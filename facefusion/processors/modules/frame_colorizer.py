@@ -1,6 +1,6 @@
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import List
+from typing import Iterable, List
 
 import cv2
 import numpy
@@ -15,9 +15,8 @@ from facefusion.filesystem import in_directory, is_image, is_video, resolve_rela
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.typing import FrameColorizerInputs
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import thread_semaphore
 from facefusion.typing import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
-from facefusion.vision import read_image, read_static_image, unpack_resolution, write_image
+from facefusion.vision import read_queue_payload_frame, read_static_image, unpack_resolution, write_image
 
 
 @lru_cache(maxsize = None)
@@ -195,7 +194,7 @@ def colorize_frame(temp_vision_frame : VisionFrame) -> VisionFrame:
 def forward(color_vision_frame : VisionFrame) -> VisionFrame:
 	frame_colorizer = get_inference_pool().get('frame_colorizer')
 
-	with thread_semaphore():
+	with inference_manager.get_session_semaphore(frame_colorizer):
 		color_vision_frame = frame_colorizer.run(None,
 		{
 			'input': color_vision_frame
@@ -259,10 +258,10 @@ def process_frame(inputs : FrameColorizerInputs) -> VisionFrame:
 	return colorize_frame(target_vision_frame)
 
 
-def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+def process_frames(source_paths : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
 	for queue_payload in process_manager.manage(queue_payloads):
 		target_vision_path = queue_payload['frame_path']
-		target_vision_frame = read_image(target_vision_path)
+		target_vision_frame = read_queue_payload_frame(queue_payload)
 		output_vision_frame = process_frame(
 		{
 			'target_vision_frame': target_vision_frame
@@ -1,6 +1,6 @@
 from argparse import ArgumentParser
 from functools import lru_cache
-from typing import List
+from typing import Iterable, List
 
 import cv2
 import numpy
@@ -17,8 +17,8 @@ from facefusion.processors import choices as processors_choices
 from facefusion.processors.typing import FrameEnhancerInputs
 from facefusion.program_helper import find_argument_group
 from facefusion.thread_helper import conditional_thread_semaphore
-from facefusion.typing import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
-from facefusion.vision import create_tile_frames, merge_tile_frames, read_image, read_static_image, write_image
+from facefusion.typing import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelInputs, ModelOptions, ModelSet, ProcessMode, QueuePayload, UpdateProgress, VisionFrame
+from facefusion.vision import create_tile_frames, merge_tile_frames, read_queue_payload_frame, read_static_image, write_image
 
 
 @lru_cache(maxsize = None)
@@ -468,7 +468,7 @@ def forward(tile_vision_frame : VisionFrame) -> VisionFrame:
 	frame_enhancer = get_inference_pool().get('frame_enhancer')
 
 	with conditional_thread_semaphore():
-		tile_vision_frame = frame_enhancer.run(None,
+		tile_vision_frame = inference_manager.run_with_io_binding(frame_enhancer,
 		{
 			'input': tile_vision_frame
 		})[0]
@@ -476,16 +476,30 @@ def forward(tile_vision_frame : VisionFrame) -> VisionFrame:
 	return tile_vision_frame
 
 
+def create_calibration_inputs(model_name : str, model_source_name : str, vision_frame : VisionFrame, faces : List[Face]) -> List[ModelInputs]:
+	model_size = create_static_model_set('full').get(model_name).get('size')
+	tile_vision_frames, _, _ = create_tile_frames(vision_frame, model_size)
+	model_inputs = []
+
+	for tile_vision_frame in tile_vision_frames:
+		model_inputs.append(
+		{
+			'input': prepare_tile_frame(tile_vision_frame)
+		})
+	return model_inputs
+
+
 def prepare_tile_frame(vision_tile_frame : VisionFrame) -> VisionFrame:
 	vision_tile_frame = numpy.expand_dims(vision_tile_frame[:, :, ::-1], axis = 0)
 	vision_tile_frame = vision_tile_frame.transpose(0, 3, 1, 2)
-	vision_tile_frame = vision_tile_frame.astype(numpy.float32) / 255
+	vision_tile_frame = vision_tile_frame.astype(numpy.float32)
+	vision_tile_frame /= 255
 	return vision_tile_frame
 
 
 def normalize_tile_frame(vision_tile_frame : VisionFrame) -> VisionFrame:
 	vision_tile_frame = vision_tile_frame.transpose(0, 2, 3, 1).squeeze(0) * 255
-	vision_tile_frame = vision_tile_frame.clip(0, 255).astype(numpy.uint8)[:, :, ::-1]
+	vision_tile_frame = vision_tile_frame.clip(0, 255, out = vision_tile_frame).astype(numpy.uint8)[:, :, ::-1]
 	return vision_tile_frame
 
 
@@ -505,10 +519,10 @@ def process_frame(inputs : FrameEnhancerInputs) -> VisionFrame:
 	return enhance_frame(target_vision_frame)
 
 
-def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+def process_frames(source_paths : List[str], queue_payloads : Iterable[QueuePayload], update_progress : UpdateProgress) -> None:
 	for queue_payload in process_manager.manage(queue_payloads):
 		target_vision_path = queue_payload['frame_path']
-		target_vision_frame = read_image(target_vision_path)
+		target_vision_frame = read_queue_payload_frame(queue_payload)
 		output_vision_frame = process_frame(
 		{
 			'target_vision_frame': target_vision_frame
@@ -1,8 +1,10 @@
-from typing import Any, Dict, List, Literal, TypedDict
+from multiprocessing.shared_memory import SharedMemory
+from types import ModuleType
+from typing import Any, Dict, List, Literal, Optional, TypedDict
 
 from numpy._typing import NDArray
 
-from facefusion.typing import AppContext, AudioFrame, Face, FaceSet, VisionFrame
+from facefusion.typing import AppContext, AudioFrame, Face, FaceSet, Fps, VisionFrame
 
 AgeModifierModel = Literal['styleganex_age']
 DeepSwapperModel = str
@@ -16,6 +18,12 @@ FrameEnhancerModel = Literal['clear_reality_x4', 'lsdir_x4', 'nomos8k_sc_x4', 'r
 LipSyncerModel = Literal['wav2lip_96', 'wav2lip_gan_96']
 
 FaceSwapperSet = Dict[FaceSwapperModel, List[str]]
+FaceSwapperMapping = TypedDict('FaceSwapperMapping',
+{
+	'source_paths' : List[str],
+	'source_faces' : List[Face],
+	'reference_faces' : List[Face]
+})
 
 AgeModifierInputs = TypedDict('AgeModifierInputs',
 {
@@ -68,6 +76,24 @@ LipSyncerInputs = TypedDict('LipSyncerInputs',
 	'source_audio_frame' : AudioFrame,
 	'target_vision_frame' : VisionFrame
 })
+ProcessorChainInputs = TypedDict('ProcessorChainInputs',
+{
+	'reference_faces' : FaceSet,
+	'source_face' : Face,
+	'source_audio_frame' : AudioFrame,
+	'source_vision_frame' : VisionFrame,
+	'target_vision_frame' : VisionFrame
+})
+SharedFrameWorker = TypedDict('SharedFrameWorker',
+{
+	'shared_memory' : SharedMemory,
+	'shared_frame_size' : int,
+	'processor_modules' : List[ModuleType],
+	'reference_faces' : Optional[FaceSet],
+	'source_face' : Optional[Face],
+	'source_audio_path' : Optional[str],
+	'temp_video_fps' : Fps
+})
 
 ProcessorStateKey = Literal\
 [
@@ -98,6 +124,7 @@ ProcessorStateKey = Literal\
 	'face_enhancer_weight',
 	'face_swapper_model',
 	'face_swapper_pixel_boost',
+	'face_swapper_reference_positions',
 	'frame_colorizer_model',
 	'frame_colorizer_size',
 	'frame_colorizer_blend',
@@ -134,6 +161,7 @@ ProcessorState = TypedDict('ProcessorState',
 	'face_enhancer_weight' : float,
 	'face_swapper_model' : FaceSwapperModel,
 	'face_swapper_pixel_boost' : str,
+	'face_swapper_reference_positions' : List[int],
 	'frame_colorizer_model' : FrameColorizerModel,
 	'frame_colorizer_size' : str,
 	'frame_colorizer_blend' : int,
@@ -43,6 +43,14 @@ def create_jobs_path_program() -> ArgumentParser:
 	return program
 
 
+def create_face_cache_path_program() -> ArgumentParser:
+	program = ArgumentParser(add_help = False)
+	group_paths = program.add_argument_group('paths')
+	group_paths.add_argument('--face-cache-path', help = wording.get('help.face_cache_path'), default = config.get_str_value('paths.face_cache_path'))
+	job_store.register_job_keys([ 'face_cache_path' ])
+	return program
+
+
 def create_source_paths_program() -> ArgumentParser:
 	program = ArgumentParser(add_help = False)
 	group_paths = program.add_argument_group('paths')
@@ -100,7 +108,10 @@ def create_face_detector_program() -> ArgumentParser:
 	group_face_detector.add_argument('--face-detector-size', help = wording.get('help.face_detector_size'), default = config.get_str_value('face_detector.face_detector_size', get_last(face_detector_size_choices)), choices = face_detector_size_choices)
 	group_face_detector.add_argument('--face-detector-angles', help = wording.get('help.face_detector_angles'), type = int, default = config.get_int_list('face_detector.face_detector_angles', '0'), choices = facefusion.choices.face_detector_angles, nargs = '+', metavar = 'FACE_DETECTOR_ANGLES')
 	group_face_detector.add_argument('--face-detector-score', help = wording.get('help.face_detector_score'), type = float, default = config.get_float_value('face_detector.face_detector_score', '0.5'), choices = facefusion.choices.face_detector_score_range, metavar = create_float_metavar(facefusion.choices.face_detector_score_range))
-	job_store.register_step_keys([ 'face_detector_model', 'face_detector_angles', 'face_detector_size', 'face_detector_score' ])
+	group_face_detector.add_argument('--face-detector-batch-size', help = wording.get('help.face_detector_batch_size'), type = int, default = config.get_int_value('face_detector.face_detector_batch_size', '1'), choices = facefusion.choices.face_detector_batch_size_range, metavar = create_int_metavar(facefusion.choices.face_detector_batch_size_range))
+	group_face_detector.add_argument('--face-detector-angle-strategy', help = wording.get('help.face_detector_angle_strategy'), default = config.get_str_value('face_detector.face_detector_angle_strategy', 'full'), choices = facefusion.choices.face_detector_angle_strategies)
+	group_face_detector.add_argument('--face-tracker-interval', help = wording.get('help.face_tracker_interval'), type = int, default = config.get_int_value('face_detector.face_tracker_interval', '1'), choices = facefusion.choices.face_tracker_interval_range, metavar = create_int_metavar(facefusion.choices.face_tracker_interval_range))
+	job_store.register_step_keys([ 'face_detector_model', 'face_detector_angles', 'face_detector_angle_strategy', 'face_detector_size', 'face_detector_score', 'face_detector_batch_size', 'face_tracker_interval' ])
 	return program
 
 
@@ -148,8 +159,9 @@ def create_frame_extraction_program() -> ArgumentParser:
 	group_frame_extraction.add_argument('--trim-frame-start', help = wording.get('help.trim_frame_start'), type = int, default = facefusion.config.get_int_value('frame_extraction.trim_frame_start'))
 	group_frame_extraction.add_argument('--trim-frame-end',	help = wording.get('help.trim_frame_end'), type = int, default = facefusion.config.get_int_value('frame_extraction.trim_frame_end'))
 	group_frame_extraction.add_argument('--temp-frame-format', help = wording.get('help.temp_frame_format'), default = config.get_str_value('frame_extraction.temp_frame_format', 'png'), choices = facefusion.choices.temp_frame_formats)
+	group_frame_extraction.add_argument('--frame-extraction-strategy', help = wording.get('help.frame_extraction_strategy'), default = config.get_str_value('frame_extraction.frame_extraction_strategy', 'disk'), choices = facefusion.choices.frame_extraction_strategies)
 	group_frame_extraction.add_argument('--keep-temp', help = wording.get('help.keep_temp'), action = 'store_true',	default = config.get_bool_value('frame_extraction.keep_temp'))
-	job_store.register_step_keys([ 'trim_frame_start', 'trim_frame_end', 'temp_frame_format', 'keep_temp' ])
+	job_store.register_step_keys([ 'trim_frame_start', 'trim_frame_end', 'temp_frame_format', 'frame_extraction_strategy', 'keep_temp' ])
 	return program
 
 
@@ -164,8 +176,9 @@ def create_output_creation_program() -> ArgumentParser:
 	group_output_creation.add_argument('--output-video-quality', help = wording.get('help.output_video_quality'), type = int, default = config.get_int_value('output_creation.output_video_quality', '80'), choices = facefusion.choices.output_video_quality_range, metavar = create_int_metavar(facefusion.choices.output_video_quality_range))
 	group_output_creation.add_argument('--output-video-resolution', help = wording.get('help.output_video_resolution'), default = config.get_str_value('output_creation.output_video_resolution'))
 	group_output_creation.add_argument('--output-video-fps', help = wording.get('help.output_video_fps'), type = float, default = config.get_str_value('output_creation.output_video_fps'))
+	group_output_creation.add_argument('--video-merge-strategy', help = wording.get('help.video_merge_strategy'), default = config.get_str_value('output_creation.video_merge_strategy', 'disk'), choices = facefusion.choices.video_merge_strategies)
 	group_output_creation.add_argument('--skip-audio', help = wording.get('help.skip_audio'), action = 'store_true', default = config.get_bool_value('output_creation.skip_audio'))
-	job_store.register_step_keys([ 'output_image_quality', 'output_image_resolution', 'output_audio_encoder', 'output_video_encoder', 'output_video_preset', 'output_video_quality', 'output_video_resolution', 'output_video_fps', 'skip_audio' ])
+	job_store.register_step_keys([ 'output_image_quality', 'output_image_resolution', 'output_audio_encoder', 'output_video_encoder', 'output_video_preset', 'output_video_quality', 'output_video_resolution', 'output_video_fps', 'video_merge_strategy', 'skip_audio' ])
 	return program
 
 
@@ -174,7 +187,8 @@ def create_processors_program() -> ArgumentParser:
 	available_processors = [ file.get('name') for file in list_directory('facefusion/processors/modules') ]
 	group_processors = program.add_argument_group('processors')
 	group_processors.add_argument('--processors', help = wording.get('help.processors').format(choices = ', '.join(available_processors)), default = config.get_str_list('processors.processors', 'face_swapper'), nargs = '+')
-	job_store.register_step_keys([ 'processors' ])
+	group_processors.add_argument('--processor-strategy', help = wording.get('help.processor_strategy'), default = config.get_str_value('processors.processor_strategy', 'sequential'), choices = facefusion.choices.processor_strategies)
+	job_store.register_step_keys([ 'processors', 'processor_strategy' ])
 	for processor_module in get_processors_modules(available_processors):
 		processor_module.register_args(program)
 	return program
@@ -198,7 +212,19 @@ def create_execution_program() -> ArgumentParser:
 	group_execution.add_argument('--execution-providers', help = wording.get('help.execution_providers').format(choices = ', '.join(available_execution_providers)), default = config.get_str_list('execution.execution_providers', 'cpu'), choices = available_execution_providers, nargs = '+', metavar = 'EXECUTION_PROVIDERS')
 	group_execution.add_argument('--execution-thread-count', help = wording.get('help.execution_thread_count'), type = int, default = config.get_int_value('execution.execution_thread_count', '4'), choices = facefusion.choices.execution_thread_count_range, metavar = create_int_metavar(facefusion.choices.execution_thread_count_range))
 	group_execution.add_argument('--execution-queue-count', help = wording.get('help.execution_queue_count'), type = int, default = config.get_int_value('execution.execution_queue_count', '1'), choices = facefusion.choices.execution_queue_count_range, metavar = create_int_metavar(facefusion.choices.execution_queue_count_range))
-	job_store.register_job_keys([ 'execution_device_id', 'execution_providers', 'execution_thread_count', 'execution_queue_count' ])
+	group_execution.add_argument('--execution-worker-strategy', help = wording.get('help.execution_worker_strategy'), default = config.get_str_value('execution.execution_worker_strategy', 'thread'), choices = facefusion.choices.execution_worker_strategies)
+	group_execution.add_argument('--execution-shard-count', help = wording.get('help.execution_shard_count'), type = int, default = config.get_int_value('execution.execution_shard_count', '1'), choices = facefusion.choices.execution_shard_count_range, metavar = create_int_metavar(facefusion.choices.execution_shard_count_range))
+	group_execution.add_argument('--execution-intra-op-thread-count', help = wording.get('help.execution_intra_op_thread_count'), type = int, default = config.get_int_value('execution.execution_intra_op_thread_count', '0'), choices = facefusion.choices.execution_op_thread_count_range, metavar = create_int_metavar(facefusion.choices.execution_op_thread_count_range))
+	group_execution.add_argument('--execution-inter-op-thread-count', help = wording.get('help.execution_inter_op_thread_count'), type = int, default = config.get_int_value('execution.execution_inter_op_thread_count', '0'), choices = facefusion.choices.execution_op_thread_count_range, metavar = create_int_metavar(facefusion.choices.execution_op_thread_count_range))
+	group_execution.add_argument('--execution-session-concurrency', help = wording.get('help.execution_session_concurrency'), type = int, default = config.get_int_value('execution.execution_session_concurrency', '0'), choices = facefusion.choices.execution_session_concurrency_range, metavar = create_int_metavar(facefusion.choices.execution_session_concurrency_range))
+	group_execution.add_argument('--execution-batch-size', help = wording.get('help.execution_batch_size'), type = int, default = config.get_int_value('execution.execution_batch_size', '16'), choices = facefusion.choices.execution_batch_size_range, metavar = create_int_metavar(facefusion.choices.execution_batch_size_range))
+	group_execution.add_argument('--execution-batch-timeout', help = wording.get('help.execution_batch_timeout'), type = int, default = config.get_int_value('execution.execution_batch_timeout', '0'), choices = facefusion.choices.execution_batch_timeout_range, metavar = create_int_metavar(facefusion.choices.execution_batch_timeout_range))
+	group_execution.add_argument('--execution-mode', help = wording.get('help.execution_mode'), default = config.get_str_value('execution.execution_mode', 'sequential'), choices = facefusion.choices.execution_modes)
+	group_execution.add_argument('--execution-graph-optimization', help = wording.get('help.execution_graph_optimization'), default = config.get_str_value('execution.execution_graph_optimization', 'all'), choices = facefusion.choices.execution_graph_optimizations)
+	group_execution.add_argument('--execution-memory-optimizations', help = wording.get('help.execution_memory_optimizations').format(choices = ', '.join(facefusion.choices.execution_memory_optimizations)), default = config.get_str_list('execution.execution_memory_optimizations', 'arena pattern'), choices = facefusion.choices.execution_memory_optimizations, nargs = '*', metavar = 'EXECUTION_MEMORY_OPTIMIZATIONS')
+	group_execution.add_argument('--execution-model-cache', help = wording.get('help.execution_model_cache'), action = 'store_true', default = config.get_bool_value('execution.execution_model_cache'))
+	group_execution.add_argument('--execution-model-precision', help = wording.get('help.execution_model_precision'), default = config.get_str_value('execution.execution_model_precision', 'fp32'), choices = facefusion.choices.execution_model_precisions)
+	job_store.register_job_keys([ 'execution_device_id', 'execution_providers', 'execution_thread_count', 'execution_queue_count', 'execution_worker_strategy', 'execution_shard_count', 'execution_intra_op_thread_count', 'execution_inter_op_thread_count', 'execution_session_concurrency', 'execution_batch_size', 'execution_batch_timeout', 'execution_mode', 'execution_graph_optimization', 'execution_memory_optimizations', 'execution_model_cache', 'execution_model_precision' ])
 	return program
 
 
@@ -224,7 +250,8 @@ def create_memory_program() -> ArgumentParser:
 	group_memory = program.add_argument_group('memory')
 	group_memory.add_argument('--video-memory-strategy', help = wording.get('help.video_memory_strategy'), default = config.get_str_value('memory.video_memory_strategy', 'strict'), choices = facefusion.choices.video_memory_strategies)
 	group_memory.add_argument('--system-memory-limit', help = wording.get('help.system_memory_limit'), type = int, default = config.get_int_value('memory.system_memory_limit', '0'), choices = facefusion.choices.system_memory_limit_range, metavar = create_int_metavar(facefusion.choices.system_memory_limit_range))
-	job_store.register_job_keys([ 'video_memory_strategy', 'system_memory_limit' ])
+	group_memory.add_argument('--face-store-memory-limit', help = wording.get('help.face_store_memory_limit'), type = int, default = config.get_int_value('memory.face_store_memory_limit', '512'), choices = facefusion.choices.face_store_memory_limit_range, metavar = create_int_metavar(facefusion.choices.face_store_memory_limit_range))
+	job_store.register_job_keys([ 'video_memory_strategy', 'system_memory_limit', 'face_store_memory_limit' ])
 	return program
 
 
@@ -237,6 +264,17 @@ def create_misc_program() -> ArgumentParser:
 	return program
 
 
+def create_quantize_program() -> ArgumentParser:
+	program = ArgumentParser(add_help = False)
+	group_quantize = program.add_argument_group('quantize')
+	group_quantize.add_argument('--quantize-model-names', help = wording.get('help.quantize_model_names'), default = config.get_str_list('quantize.quantize_model_names', 'inswapper_128 gfpgan_1.4 real_esrgan_x4 2dfan4 arcface'), nargs = '+')
+	group_quantize.add_argument('--quantize-method', help = wording.get('help.quantize_method'), default = config.get_str_value('quantize.quantize_method', 'dynamic'), choices = facefusion.choices.quantize_methods)
+	group_quantize.add_argument('--quantize-calibration-pattern', help = wording.get('help.quantize_calibration_pattern'), default = config.get_str_value('quantize.quantize_calibration_pattern'))
+	group_quantize.add_argument('--quantize-min-similarity', help = wording.get('help.quantize_min_similarity'), type = float, default = config.get_float_value('quantize.quantize_min_similarity', '0.99'), choices = facefusion.choices.quantize_min_similarity_range, metavar = create_float_metavar(facefusion.choices.quantize_min_similarity_range))
+	group_quantize.add_argument('--quantize-min-psnr', help = wording.get('help.quantize_min_psnr'), type = int, default = config.get_int_value('quantize.quantize_min_psnr', '30'), choices = facefusion.choices.quantize_min_psnr_range, metavar = create_int_metavar(facefusion.choices.quantize_min_psnr_range))
+	return program
+
+
 def create_job_id_program() -> ArgumentParser:
 	program = ArgumentParser(add_help = False)
 	program.add_argument('job_id', help = wording.get('help.job_id'))
@@ -250,6 +288,20 @@ def create_job_status_program() -> ArgumentParser:
 	return program
 
 
+def create_job_runner_program() -> ArgumentParser:
+	program = ArgumentParser(add_help = False)
+	group_jobs = program.add_argument_group('jobs')
+	group_jobs.add_argument('--job-runner-workers', help = wording.get('help.job_runner_workers'), type = int, default = config.get_int_value('jobs.job_runner_workers', '1'), choices = facefusion.choices.job_runner_workers_range, metavar = create_int_metavar(facefusion.choices.job_runner_workers_range))
+	return program
+
+
+def create_job_daemon_program() -> ArgumentParser:
+	program = ArgumentParser(add_help = False)
+	group_jobs = program.add_argument_group('jobs')
+	group_jobs.add_argument('--job-api-port', help = wording.get('help.job_api_port'), type = int, default = config.get_int_value('jobs.job_api_port'))
+	return program
+
+
 def create_step_index_program() -> ArgumentParser:
 	program = ArgumentParser(add_help = False)
 	program.add_argument('step_index', help = wording.get('help.step_index'), type = int)
@@ -270,10 +322,11 @@ def create_program() -> ArgumentParser:
 	program.add_argument('-v', '--version', version = metadata.get('name') + ' ' + metadata.get('version'), action = 'version')
 	sub_program = program.add_subparsers(dest = 'command')
 	# general
-	sub_program.add_parser('run', help = wording.get('help.run'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_source_paths_program(), create_target_path_program(), create_output_path_program(), collect_step_program(), create_uis_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('headless-run', help = wording.get('help.headless_run'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_source_paths_program(), create_target_path_program(), create_output_path_program(), collect_step_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('batch-run', help = wording.get('help.batch_run'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_source_pattern_program(), create_target_pattern_program(), create_output_pattern_program(), collect_step_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('run', help = wording.get('help.run'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_face_cache_path_program(), create_source_paths_program(), create_target_path_program(), create_output_path_program(), collect_step_program(), create_uis_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('headless-run', help = wording.get('help.headless_run'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_face_cache_path_program(), create_source_paths_program(), create_target_path_program(), create_output_path_program(), collect_step_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('batch-run', help = wording.get('help.batch_run'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_face_cache_path_program(), create_source_pattern_program(), create_target_pattern_program(), create_output_pattern_program(), collect_step_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
 	sub_program.add_parser('force-download', help = wording.get('help.force_download'), parents = [ create_download_providers_program(), create_download_scope_program(), create_misc_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('quantize-models', help = wording.get('help.quantize_models'), parents = [ create_quantize_program(), create_face_detector_program(), create_face_landmarker_program(), create_execution_program(), create_download_providers_program(), create_misc_program() ], formatter_class = create_help_formatter_large)
 	# job manager
 	sub_program.add_parser('job-list', help = wording.get('help.job_list'), parents = [ create_job_status_program(), create_jobs_path_program(), create_misc_program() ], formatter_class = create_help_formatter_large)
 	sub_program.add_parser('job-create', help = wording.get('help.job_create'), parents = [ create_job_id_program(), create_jobs_path_program(), create_misc_program() ], formatter_class = create_help_formatter_large)
@@ -286,10 +339,11 @@ def create_program() -> ArgumentParser:
 	sub_program.add_parser('job-insert-step', help = wording.get('help.job_insert_step'), parents = [ create_job_id_program(), create_step_index_program(), create_config_path_program(), create_jobs_path_program(), create_source_paths_program(), create_target_path_program(), create_output_path_program(), collect_step_program(), create_misc_program() ], formatter_class = create_help_formatter_large)
 	sub_program.add_parser('job-remove-step', help = wording.get('help.job_remove_step'), parents = [ create_job_id_program(), create_step_index_program(), create_jobs_path_program(), create_misc_program() ], formatter_class = create_help_formatter_large)
 	# job runner
-	sub_program.add_parser('job-run', help = wording.get('help.job_run'), parents = [ create_job_id_program(), create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-run-all', help = wording.get('help.job_run_all'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-retry', help = wording.get('help.job_retry'), parents = [ create_job_id_program(), create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
-	sub_program.add_parser('job-retry-all', help = wording.get('help.job_retry_all'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-run', help = wording.get('help.job_run'), parents = [ create_job_id_program(), create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_face_cache_path_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-run-all', help = wording.get('help.job_run_all'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_face_cache_path_program(), create_job_runner_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-retry', help = wording.get('help.job_retry'), parents = [ create_job_id_program(), create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_face_cache_path_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-retry-all', help = wording.get('help.job_retry_all'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_face_cache_path_program(), create_job_runner_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
+	sub_program.add_parser('job-daemon', help = wording.get('help.job_daemon'), parents = [ create_config_path_program(), create_temp_path_program(), create_jobs_path_program(), create_face_cache_path_program(), create_job_daemon_program(), collect_step_program(), collect_job_program() ], formatter_class = create_help_formatter_large)
 	return ArgumentParser(parents = [ program ], formatter_class = create_help_formatter_small, add_help = True)
 
 
@@ -1,5 +1,7 @@
+import threading
 from collections import namedtuple
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, TypedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Tuple, TypedDict
 
 import numpy
 from numpy.typing import NDArray
@@ -13,8 +15,11 @@ Detection = NDArray[Any]
 Prediction = NDArray[Any]
 
 BoundingBox = NDArray[Any]
+BoundingBoxes = NDArray[Any]
 FaceLandmark5 = NDArray[Any]
+FaceLandmarks5 = NDArray[Any]
 FaceLandmark68 = NDArray[Any]
+Scores = NDArray[Any]
 FaceLandmarkSet = TypedDict('FaceLandmarkSet',
 {
 	'5' : FaceLandmark5, #type:ignore[valid-type]
@@ -27,7 +32,9 @@ FaceScoreSet = TypedDict('FaceScoreSet',
 	'detector' : Score,
 	'landmarker' : Score
 })
+FaceDetection = Tuple[BoundingBoxes, Scores, FaceLandmarks5]
 Embedding = NDArray[numpy.float64]
+Embeddings = NDArray[numpy.float64]
 Gender = Literal['female', 'male']
 Age = range
 Race = Literal['white', 'black', 'latino', 'asian', 'indian', 'arabic']
@@ -47,6 +54,7 @@ FaceSet = Dict[str, List[Face]]
 FaceStore = TypedDict('FaceStore',
 {
 	'static_faces' : FaceSet,
+	'static_faces_size' : int,
 	'reference_faces' : FaceSet
 })
 
@@ -58,6 +66,14 @@ Matrix = NDArray[Any]
 Anchors = NDArray[Any]
 Translation = NDArray[Any]
 
+FaceTracker = TypedDict('FaceTracker',
+{
+	'track_vision_frame' : VisionFrame,
+	'track_faces' : List[Face],
+	'track_angle' : Angle,
+	'frame_total' : int
+})
+
 AudioBuffer = bytes
 Audio = NDArray[Any]
 AudioChunk = NDArray[Any]
@@ -76,12 +92,21 @@ ProcessState = Literal['checking', 'processing', 'stopping', 'pending']
 QueuePayload = TypedDict('QueuePayload',
 {
 	'frame_number' : int,
-	'frame_path' : str
+	'frame_path' : str,
+	'vision_frame' : Optional[VisionFrame]
+})
+SchedulerMetrics = TypedDict('SchedulerMetrics',
+{
+	'start_time' : float,
+	'queue_depth' : int,
+	'worker_busy_times' : Dict[str, float]
 })
 Args = Dict[str, Any]
 UpdateProgress = Callable[[int], None]
-ProcessFrames = Callable[[List[str], List[QueuePayload], UpdateProgress], None]
+ProcessFrames = Callable[[List[str], Iterable[QueuePayload], UpdateProgress], None]
+MergeVisionFrame = Callable[[VisionFrame], None]
 ProcessStep = Callable[[str, int, Args], bool]
+JobRunner = Callable[[str, ProcessStep], bool]
 
 Content = Dict[str, Any]
 
@@ -99,25 +124,45 @@ TableContents = List[List[Any]]
 FaceDetectorModel = Literal['many', 'retinaface', 'scrfd', 'yoloface']
 FaceLandmarkerModel = Literal['many', '2dfan4', 'peppa_wutz']
 FaceDetectorSet = Dict[FaceDetectorModel, List[str]]
+FaceDetectorAngleStrategy = Literal['full', 'adaptive']
 FaceSelectorMode = Literal['many', 'one', 'reference']
 FaceSelectorOrder = Literal['left-right', 'right-left', 'top-bottom', 'bottom-top', 'small-large', 'large-small', 'best-worst', 'worst-best']
+ReferenceGallery = TypedDict('ReferenceGallery',
+{
+	'reference_faces' : List[Face],
+	'reference_embeddings' : Embeddings
+})
 FaceOccluderModel = Literal['xseg_1', 'xseg_2']
 FaceParserModel = Literal['bisenet_resnet_18', 'bisenet_resnet_34']
 FaceMaskType = Literal['box', 'occlusion', 'region']
 FaceMaskRegion = Literal['skin', 'left-eyebrow', 'right-eyebrow', 'left-eye', 'right-eye', 'glasses', 'nose', 'mouth', 'upper-lip', 'lower-lip']
 FaceMaskRegionSet = Dict[FaceMaskRegion, int]
 TempFrameFormat = Literal['bmp', 'jpg', 'png']
+FrameExtractionStrategy = Literal['disk', 'pipe']
 OutputAudioEncoder = Literal['aac', 'libmp3lame', 'libopus', 'libvorbis']
 OutputVideoEncoder = Literal['libx264', 'libx265', 'libvpx-vp9', 'h264_nvenc', 'hevc_nvenc', 'h264_amf', 'hevc_amf','h264_qsv', 'hevc_qsv', 'h264_videotoolbox', 'hevc_videotoolbox']
 OutputVideoPreset = Literal['ultrafast', 'superfast', 'veryfast', 'faster', 'fast', 'medium', 'slow', 'slower', 'veryslow']
+VideoMergeStrategy = Literal['disk', 'pipe']
 
 ModelOptions = Dict[str, Any]
 ModelSet = Dict[str, ModelOptions]
 ModelInitializer = NDArray[Any]
+ModelInputs = Dict[str, NDArray[Any]]
+ModelDrift = TypedDict('ModelDrift',
+{
+	'similarity' : float,
+	'psnr' : float
+})
+QuantizeMethod = Literal['dynamic', 'static']
 
 ExecutionProvider = Literal['cpu', 'coreml', 'cuda', 'directml', 'openvino', 'rocm', 'tensorrt']
 ExecutionProviderValue = Literal['CPUExecutionProvider', 'CoreMLExecutionProvider', 'CUDAExecutionProvider', 'DmlExecutionProvider', 'OpenVINOExecutionProvider', 'ROCMExecutionProvider', 'TensorrtExecutionProvider']
 ExecutionProviderSet = Dict[ExecutionProvider, ExecutionProviderValue]
+ExecutionWorkerStrategy = Literal['thread', 'process']
+ExecutionMode = Literal['sequential', 'parallel']
+ExecutionGraphOptimization = Literal['disable', 'basic', 'extended', 'all']
+ExecutionMemoryOptimization = Literal['arena', 'pattern']
+ExecutionModelPrecision = Literal['fp32', 'int8']
 ValueAndUnit = TypedDict('ValueAndUnit',
 {
 	'value' : int,
@@ -174,6 +219,7 @@ Download = TypedDict('Download',
 DownloadSet = Dict[str, Download]
 
 VideoMemoryStrategy = Literal['strict', 'moderate', 'tolerant']
+ProcessorStrategy = Literal['sequential', 'fused']
 
 File = TypedDict('File',
 {
@@ -186,6 +232,14 @@ AppContext = Literal['cli', 'ui']
 
 InferencePool = Dict[str, InferenceSession]
 InferencePoolSet = Dict[AppContext, Dict[str, InferencePool]]
+InferenceBufferSet = Dict[Tuple[Tuple[str, Tuple[int, ...], str], ...], List[NDArray[Any]]]
+InferenceRequest = Tuple[List[NDArray[Any]], Future[List[List[NDArray[Any]]]]]
+InferenceBroker = TypedDict('InferenceBroker',
+{
+	'condition' : threading.Condition,
+	'requests' : List[InferenceRequest],
+	'is_collecting' : bool
+})
 
 UiWorkflow = Literal['instant_runner', 'job_runner', 'job_manager']
 
@@ -210,6 +264,26 @@ Job = TypedDict('Job',
 	'steps' : List[JobStep]
 })
 JobSet = Dict[str, Job]
+JobFrameProgress = TypedDict('JobFrameProgress',
+{
+	'frame_watermark' : int,
+	'frame_numbers' : List[int]
+})
+JobCheckpoint = TypedDict('JobCheckpoint',
+{
+	'settings_hash' : str,
+	'frames_extracted' : bool,
+	'frame_progress' : Dict[str, JobFrameProgress]
+})
+JobShardRange = Tuple[int, int]
+JobProgress = TypedDict('JobProgress',
+{
+	'job_id' : Optional[str],
+	'description' : Optional[str],
+	'current' : int,
+	'total' : Optional[int],
+	'unit' : Optional[str]
+})
 
 ApplyStateItem = Callable[[Any, Any], None]
 StateKey = Literal\
@@ -218,6 +292,7 @@ StateKey = Literal\
 	'config_path',
 	'temp_path',
 	'jobs_path',
+	'face_cache_path',
 	'source_paths',
 	'target_path',
 	'output_path',
@@ -227,7 +302,10 @@ StateKey = Literal\
 	'face_detector_model',
 	'face_detector_size',
 	'face_detector_angles',
+	'face_detector_angle_strategy',
 	'face_detector_score',
+	'face_detector_batch_size',
+	'face_tracker_interval',
 	'face_landmarker_model',
 	'face_landmarker_score',
 	'face_selector_mode',
@@ -248,6 +326,7 @@ StateKey = Literal\
 	'trim_frame_start',
 	'trim_frame_end',
 	'temp_frame_format',
+	'frame_extraction_strategy',
 	'keep_temp',
 	'output_image_quality',
 	'output_image_resolution',
@@ -257,8 +336,10 @@ StateKey = Literal\
 	'output_video_quality',
 	'output_video_resolution',
 	'output_video_fps',
+	'video_merge_strategy',
 	'skip_audio',
 	'processors',
+	'processor_strategy',
 	'open_browser',
 	'ui_layouts',
 	'ui_workflow',
@@ -266,14 +347,34 @@ StateKey = Literal\
 	'execution_providers',
 	'execution_thread_count',
 	'execution_queue_count',
+	'execution_worker_strategy',
+	'execution_intra_op_thread_count',
+	'execution_inter_op_thread_count',
+	'execution_session_concurrency',
+	'execution_batch_size',
+	'execution_batch_timeout',
+	'execution_mode',
+	'execution_graph_optimization',
+	'execution_memory_optimizations',
+	'execution_model_cache',
+	'execution_model_precision',
+	'execution_shard_count',
 	'download_providers',
 	'download_scope',
 	'video_memory_strategy',
 	'system_memory_limit',
+	'face_store_memory_limit',
 	'log_level',
+	'quantize_model_names',
+	'quantize_method',
+	'quantize_calibration_pattern',
+	'quantize_min_similarity',
+	'quantize_min_psnr',
 	'job_id',
 	'job_status',
-	'step_index'
+	'step_index',
+	'job_runner_workers',
+	'job_api_port'
 ]
 State = TypedDict('State',
 {
@@ -281,6 +382,7 @@ State = TypedDict('State',
 	'config_path' : str,
 	'temp_path' : str,
 	'jobs_path' : str,
+	'face_cache_path' : str,
 	'source_paths' : List[str],
 	'target_path' : str,
 	'output_path' : str,
@@ -290,7 +392,10 @@ State = TypedDict('State',
 	'face_detector_model' : FaceDetectorModel,
 	'face_detector_size' : str,
 	'face_detector_angles' : List[Angle],
+	'face_detector_angle_strategy' : FaceDetectorAngleStrategy,
 	'face_detector_score' : Score,
+	'face_detector_batch_size' : int,
+	'face_tracker_interval' : int,
 	'face_landmarker_model' : FaceLandmarkerModel,
 	'face_landmarker_score' : Score,
 	'face_selector_mode' : FaceSelectorMode,
@@ -311,6 +416,7 @@ State = TypedDict('State',
 	'trim_frame_start' : int,
 	'trim_frame_end' : int,
 	'temp_frame_format' : TempFrameFormat,
+	'frame_extraction_strategy' : FrameExtractionStrategy,
 	'keep_temp' : bool,
 	'output_image_quality' : int,
 	'output_image_resolution' : str,
@@ -320,8 +426,10 @@ State = TypedDict('State',
 	'output_video_quality' : int,
 	'output_video_resolution' : str,
 	'output_video_fps' : float,
+	'video_merge_strategy' : VideoMergeStrategy,
 	'skip_audio' : bool,
 	'processors' : List[str],
+	'processor_strategy' : ProcessorStrategy,
 	'open_browser' : bool,
 	'ui_layouts' : List[str],
 	'ui_workflow' : UiWorkflow,
@@ -329,13 +437,33 @@ State = TypedDict('State',
 	'execution_providers' : List[ExecutionProvider],
 	'execution_thread_count' : int,
 	'execution_queue_count' : int,
+	'execution_worker_strategy' : ExecutionWorkerStrategy,
+	'execution_intra_op_thread_count' : int,
+	'execution_inter_op_thread_count' : int,
+	'execution_session_concurrency' : int,
+	'execution_batch_size' : int,
+	'execution_batch_timeout' : int,
+	'execution_mode' : ExecutionMode,
+	'execution_graph_optimization' : ExecutionGraphOptimization,
+	'execution_memory_optimizations' : List[ExecutionMemoryOptimization],
+	'execution_model_cache' : bool,
+	'execution_model_precision' : ExecutionModelPrecision,
+	'execution_shard_count' : int,
 	'download_providers' : List[DownloadProvider],
 	'download_scope' : DownloadScope,
 	'video_memory_strategy' : VideoMemoryStrategy,
 	'system_memory_limit' : int,
+	'face_store_memory_limit' : int,
 	'log_level' : LogLevel,
+	'quantize_model_names' : List[str],
+	'quantize_method' : QuantizeMethod,
+	'quantize_calibration_pattern' : str,
+	'quantize_min_similarity' : float,
+	'quantize_min_psnr' : int,
 	'job_id' : str,
 	'job_status' : JobStatus,
-	'step_index' : int
+	'step_index' : int,
+	'job_runner_workers' : int,
+	'job_api_port' : Optional[int]
 })
 StateSet = Dict[AppContext, State]
@@ -4,6 +4,7 @@ import gradio
 
 from facefusion import state_manager, wording
 from facefusion.face_store import clear_reference_faces, clear_static_faces
+from facefusion.face_tracker import clear_face_tracker
 from facefusion.filesystem import get_file_size, is_image, is_video
 from facefusion.uis.core import register_ui_component
 from facefusion.uis.typing import ComponentOptions, File
@@ -67,6 +68,7 @@ def listen() -> None:
 def update(file : File) -> Tuple[gradio.Image, gradio.Video]:
 	clear_reference_faces()
 	clear_static_faces()
+	clear_face_tracker()
 	if file and is_image(file.name):
 		state_manager.set_item('target_path', file.name)
 		return gradio.Image(value = file.name, visible = True), gradio.Video(value = None, visible = False)
@@ -8,7 +8,7 @@ from cv2.typing import Size
 import facefusion.choices
 from facefusion.common_helper import is_windows
 from facefusion.filesystem import is_image, is_video, sanitize_path_for_windows
-from facefusion.typing import Duration, Fps, Orientation, Resolution, VisionFrame
+from facefusion.typing import Duration, Fps, Orientation, QueuePayload, Resolution, VisionFrame
 
 
 @lru_cache(maxsize = 128)
@@ -33,6 +33,12 @@ def read_image(image_path : str) -> Optional[VisionFrame]:
 	return None
 
 
+def read_queue_payload_frame(queue_payload : QueuePayload) -> Optional[VisionFrame]:
+	if queue_payload.get('vision_frame') is not None:
+		return queue_payload.get('vision_frame')
+	return read_image(queue_payload.get('frame_path'))
+
+
 def write_image(image_path : str, vision_frame : VisionFrame) -> bool:
 	if image_path:
 		if is_windows():
@@ -7,13 +7,25 @@ WORDING : Dict[str, Any] =\
 	'curl_not_installed': 'CURL is not installed',
 	'ffmpeg_not_installed': 'FFMpeg is not installed',
 	'creating_temp': 'Creating temporary resources',
+	'resuming_checkpoint': 'Resuming from the checkpoint',
+	'resetting_checkpoint': 'Resetting the checkpoint as the temporary frames are missing',
 	'extracting_frames': 'Extracting frames with a resolution of {resolution} and {fps} frames per second',
 	'extracting_frames_succeed': 'Extracting frames succeed',
 	'extracting_frames_failed': 'Extracting frames failed',
+	'extracting_frames_skipped': 'Extracting frames skipped',
+	'piping_frames': 'Piping frames with a resolution of {resolution} and {fps} frames per second',
+	'piping_frames_succeed': 'Piping frames succeed',
+	'piping_frames_failed': 'Piping frames failed',
+	'processor_strategy_overridden': 'Piping frames runs the processors fused, the sequential processor strategy is ignored',
+	'processing_shards': 'Processing {shard_total} shards in parallel',
+	'processing_shards_succeed': 'Processing shards succeed',
+	'processing_shards_failed': 'Processing shards failed',
+	'processing_shards_overridden': 'Sharding restarts the audio of the lip syncer, the video is processed in one process',
 	'analysing': 'Analysing',
 	'extracting': 'Extracting',
 	'streaming': 'Streaming',
 	'processing': 'Processing',
+	'worker_utilisation': 'Worker {worker} was busy {utilisation}% of the time',
 	'merging': 'Merging',
 	'downloading': 'Downloading',
 	'temp_frames_not_found': 'Temporary frames not found',
@@ -26,6 +38,9 @@ WORDING : Dict[str, Any] =\
 	'merging_video': 'Merging video with a resolution of {resolution} and {fps} frames per second',
 	'merging_video_succeed': 'Merging video succeed',
 	'merging_video_failed': 'Merging video failed',
+	'video_merge_strategy_overridden': 'Piping video requires the pipe frame extraction strategy, the video is merged from disk',
+	'execution_worker_strategy_overridden': 'Process workers require the pipe frame extraction strategy, the frames are processed in threads',
+	'piping_video': 'Piping video with a resolution of {resolution} and {fps} frames per second',
 	'skipping_audio': 'Skipping audio',
 	'replacing_audio_succeed': 'Replacing audio succeed',
 	'replacing_audio_skipped': 'Replacing audio skipped',
@@ -44,6 +59,7 @@ WORDING : Dict[str, Any] =\
 	'specify_image_or_video_output': 'Specify the output image or video within a directory',
 	'match_target_and_output_extension': 'Match the target and output extension',
 	'no_source_face_detected': 'No source face detected',
+	'match_source_and_reference_positions': 'Match the source images and reference positions',
 	'processor_not_loaded': 'Processor {processor} could not be loaded',
 	'processor_not_implemented': 'Processor {processor} not implemented correctly',
 	'ui_layout_not_loaded': 'UI layout {ui_layout} could not be loaded',
@@ -70,6 +86,9 @@ WORDING : Dict[str, Any] =\
 	'job_step_not_removed': 'Step {step_index} not removed from job {job_id}',
 	'running_job': 'Running queued job {job_id}',
 	'running_jobs': 'Running all queued jobs',
+	'watching_jobs': 'Watching for queued jobs while keeping the models loaded',
+	'video_memory_strategy_overridden': 'Watching for jobs uses the tolerant video memory strategy',
+	'serving_job_api': 'Serving the job api on http://{host}:{port}',
 	'retrying_job': 'Retrying failed job {job_id}',
 	'retrying_jobs': 'Retrying all failed jobs',
 	'processing_job_succeed': 'Processing of job {job_id} succeed',
@@ -82,6 +101,10 @@ WORDING : Dict[str, Any] =\
 	'validating_source_succeed': 'Validating source for {source_file_name} succeed',
 	'validating_source_failed': 'Validating source for {source_file_name} failed',
 	'deleting_corrupt_source': 'Deleting corrupt source for {source_file_name}',
+	'quantizing_model': 'Quantizing {model_file_name}',
+	'quantizing_model_succeed': 'Quantizing {model_file_name} succeed with a similarity of {similarity} and a psnr of {psnr} dB',
+	'quantizing_model_rejected': 'Quantizing {model_file_name} rejected with a similarity of {similarity} and a psnr of {psnr} dB',
+	'choose_calibration_frames': 'Choose the frames to calibrate the quantization',
 	'time_ago_now': 'just now',
 	'time_ago_minutes': '{minutes} minutes ago',
 	'time_ago_hours': '{hours} hours and {minutes} minutes ago',
@@ -100,6 +123,7 @@ WORDING : Dict[str, Any] =\
 		'config_path': 'choose the config file to override defaults',
 		'temp_path': 'specify the directory for the temporary resources',
 		'jobs_path': 'specify the directory to store jobs',
+		'face_cache_path': 'specify the file to persist the analysed faces across runs',
 		'source_paths': 'choose the image or audio paths',
 		'target_path': 'choose the image or video path',
 		'output_path': 'specify the image or video within a directory',
@@ -111,7 +135,10 @@ WORDING : Dict[str, Any] =\
 		'face_detector_model': 'choose the model responsible for detecting the faces',
 		'face_detector_size': 'specify the frame size provided to the face detector',
 		'face_detector_angles': 'specify the angles to rotate the frame before detecting faces',
+		'face_detector_angle_strategy': 'specify whether every angle is detected or further angles are only tried when the remembered angle finds no face',
 		'face_detector_score': 'filter the detected faces base on the confidence score',
+		'face_detector_batch_size': 'specify the amount of frames provided to the face detector at once',
+		'face_tracker_interval': 'track the faces between full detections that run every n frames',
 		# face landmarker
 		'face_landmarker_model': 'choose the model responsible for detecting the face landmarks',
 		'face_landmarker_score': 'filter the detected face landmarks base on the confidence score',
@@ -136,6 +163,7 @@ WORDING : Dict[str, Any] =\
 		'trim_frame_start': 'specify the starting frame of the target video',
 		'trim_frame_end': 'specify the ending frame of the target video',
 		'temp_frame_format': 'specify the temporary resources format',
+		'frame_extraction_strategy': 'extract the frames to disk or pipe them from ffmpeg into the processors',
 		'keep_temp': 'keep the temporary resources after processing',
 		# output creation
 		'output_image_quality': 'specify the image quality which translates to the compression factor',
@@ -146,9 +174,11 @@ WORDING : Dict[str, Any] =\
 		'output_video_quality': 'specify the video quality which translates to the compression factor',
 		'output_video_resolution': 'specify the video output resolution based on the target video',
 		'output_video_fps': 'specify the video output fps based on the target video',
+		'video_merge_strategy': 'merge the video from the temporary frames on disk or pipe the processed frames into ffmpeg (requires the pipe frame extraction strategy)',
 		'skip_audio': 'omit the audio from the target video',
 		# processors
 		'processors': 'load a single or multiple processors (choices: {choices}, ...)',
+		'processor_strategy': 'run the processors one after another or fused into a single pass per frame',
 		'age_modifier_model': 'choose the model responsible for aging the face',
 		'age_modifier_direction': 'specify the direction in which the age should be modified',
 		'deep_swapper_model': 'choose the model responsible for swapping the face',
@@ -176,6 +206,7 @@ WORDING : Dict[str, Any] =\
 		'face_enhancer_weight': 'specify the degree of weight applied to the face',
 		'face_swapper_model': 'choose the model responsible for swapping the face',
 		'face_swapper_pixel_boost': 'choose the pixel boost resolution for the face swapper',
+		'face_swapper_reference_positions': 'map each source image to the reference face at the given position to swap many identities in one pass',
 		'frame_colorizer_model': 'choose the model responsible for colorizing the frame',
 		'frame_colorizer_size': 'specify the frame size provided to the frame colorizer',
 		'frame_colorizer_blend': 'blend the colorized into the previous frame',
@@ -191,23 +222,45 @@ WORDING : Dict[str, Any] =\
 		'execution_providers': 'inference using different providers (choices: {choices}, ...)',
 		'execution_thread_count': 'specify the amount of parallel threads while processing',
 		'execution_queue_count': 'specify the amount of frames each thread is processing',
+		'execution_worker_strategy': 'run the pipe frame workers as threads or as processes sharing the frames through shared memory',
+		'execution_shard_count': 'split the video into segments that are processed by parallel worker processes',
+		'execution_intra_op_thread_count': 'specify the threads used within an operator of each inference session (0 divides the cores among the execution threads of cpu video runs)',
+		'execution_inter_op_thread_count': 'specify the threads used across operators of each inference session in parallel mode (0 uses the runtime default)',
+		'execution_session_concurrency': 'specify the amount of threads running each inference session at once (0 sizes it per execution provider)',
+		'execution_batch_size': 'specify the maximum amount of inputs the worker threads share in one inference batch',
+		'execution_batch_timeout': 'specify the milliseconds to collect inputs from the worker threads into one inference batch (0 disables it)',
+		'execution_mode': 'choose whether the operators of each inference session run sequential or parallel',
+		'execution_graph_optimization': 'choose the graph optimization level applied when loading the models',
+		'execution_memory_optimizations': 'choose the memory optimizations of the inference sessions (choices: {choices})',
+		'execution_model_cache': 'store the optimized models and reuse them on the next start',
+		'execution_model_precision': 'choose the model precision, int8 uses the quantized models on cpu where available',
 		# download
 		'download_providers': 'download using different providers (choices: {choices}, ...)',
 		'download_scope': 'specify the download scope',
 		# memory
 		'video_memory_strategy': 'balance fast processing and low VRAM usage',
 		'system_memory_limit': 'limit the available RAM that can be used while processing',
+		'face_store_memory_limit': 'limit the RAM in MB used to cache the analysed faces (0 for no limit)',
 		# misc
 		'log_level': 'adjust the message severity displayed in the terminal',
+		# quantize
+		'quantize_model_names': 'choose the models to quantize',
+		'quantize_method': 'choose between dynamic quantization and static quantization calibrated on the frames',
+		'quantize_calibration_pattern': 'choose the frames to calibrate and validate the quantized models using a pattern',
+		'quantize_min_similarity': 'specify the minimum cosine similarity between the outputs of the quantized and original model',
+		'quantize_min_psnr': 'specify the minimum psnr in dB between the image outputs of the quantized and original model',
 		# run
 		'run': 'run the program',
 		'headless_run': 'run the program in headless mode',
 		'batch_run': 'run the program in batch mode',
 		'force_download': 'force automate downloads and exit',
+		'quantize_models': 'quantize the models to int8 for cpu execution and exit',
 		# jobs
 		'job_id': 'specify the job id',
 		'job_status': 'specify the job status',
 		'step_index': 'specify the step index',
+		'job_runner_workers': 'specify the amount of queued jobs to run in parallel worker processes',
+		'job_api_port': 'specify the localhost port to accept job submissions over http',
 		# job manager
 		'job_list': 'list jobs by status',
 		'job_create': 'create a drafted job',
@@ -223,7 +276,8 @@ WORDING : Dict[str, Any] =\
 		'job_run': 'run a queued job',
 		'job_run_all': 'run all queued jobs',
 		'job_retry': 'retry a failed job',
-		'job_retry_all': 'retry all failed jobs'
+		'job_retry_all': 'retry all failed jobs',
+		'job_daemon': 'run queued jobs as they arrive while keeping the models loaded'
 	},
 	'about':
 	{
@@ -1,8 +1,10 @@
 import os
 import tempfile
 
+import numpy
+
 from facefusion.filesystem import create_directory, is_directory, is_file, remove_directory
-from facefusion.typing import JobStatus
+from facefusion.typing import Face, JobStatus
 
 
 def is_test_job_file(file_path : str, job_status : JobStatus) -> bool:
@@ -42,3 +44,20 @@ def prepare_test_output_directory() -> bool:
 	remove_directory(test_outputs_directory)
 	create_directory(test_outputs_directory)
 	return is_directory(test_outputs_directory)
+
+
+def create_face() -> Face:
+	face_landmark_5 = numpy.zeros((5, 2))
+	face_landmark_68 = numpy.zeros((68, 2))
+
+	return Face(
+		bounding_box = numpy.zeros(4),
+		score_set = { 'detector': 0.9, 'landmarker': 0.0 },
+		landmark_set = { '5': face_landmark_5, '5/68': face_landmark_5, '68': face_landmark_68, '68/5': face_landmark_68 },
+		angle = 0,
+		embedding = numpy.zeros(512),
+		normed_embedding = numpy.zeros(512),
+		gender = 'female',
+		age = range(20, 30),
+		race = 'white'
+	)
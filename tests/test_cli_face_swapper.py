@@ -37,3 +37,38 @@ def test_swap_face_to_video() -> None:
 
 	assert subprocess.run(commands).returncode == 0
 	assert is_test_output_file('test-swap-face-to-video.mp4') is True
+
+
+def test_swap_face_to_video_fused() -> None:
+	commands = [ sys.executable, 'facefusion.py', 'headless-run', '--jobs-path', get_test_jobs_directory(), '--processors', 'face_swapper', 'face_debugger', '--processor-strategy', 'fused', '-s', get_test_example_file('source.jpg'), '-t', get_test_example_file('target-240p.mp4'), '-o', get_test_output_file('test-swap-face-to-video-fused.mp4'), '--trim-frame-end', '1' ]
+
+	assert subprocess.run(commands).returncode == 0
+	assert is_test_output_file('test-swap-face-to-video-fused.mp4') is True
+
+
+def test_swap_face_to_video_pipe() -> None:
+	commands = [ sys.executable, 'facefusion.py', 'headless-run', '--jobs-path', get_test_jobs_directory(), '--processors', 'face_swapper', '--frame-extraction-strategy', 'pipe', '-s', get_test_example_file('source.jpg'), '-t', get_test_example_file('target-240p.mp4'), '-o', get_test_output_file('test-swap-face-to-video-pipe.mp4'), '--trim-frame-end', '1' ]
+
+	assert subprocess.run(commands).returncode == 0
+	assert is_test_output_file('test-swap-face-to-video-pipe.mp4') is True
+
+
+def test_swap_face_to_video_pipe_merge() -> None:
+	commands = [ sys.executable, 'facefusion.py', 'headless-run', '--jobs-path', get_test_jobs_directory(), '--processors', 'face_swapper', '--frame-extraction-strategy', 'pipe', '--video-merge-strategy', 'pipe', '-s', get_test_example_file('source.jpg'), '-t', get_test_example_file('target-240p.mp4'), '-o', get_test_output_file('test-swap-face-to-video-pipe-merge.mp4'), '--trim-frame-end', '1' ]
+
+	assert subprocess.run(commands).returncode == 0
+	assert is_test_output_file('test-swap-face-to-video-pipe-merge.mp4') is True
+
+
+def test_swap_face_to_video_shard() -> None:
+	commands = [ sys.executable, 'facefusion.py', 'headless-run', '--jobs-path', get_test_jobs_directory(), '--processors', 'face_swapper', '--execution-shard-count', '2', '-s', get_test_example_file('source.jpg'), '-t', get_test_example_file('target-240p.mp4'), '-o', get_test_output_file('test-swap-face-to-video-shard.mp4'), '--trim-frame-end', '2' ]
+
+	assert subprocess.run(commands).returncode == 0
+	assert is_test_output_file('test-swap-face-to-video-shard.mp4') is True
+
+
+def test_swap_face_to_video_mapping() -> None:
+	commands = [ sys.executable, 'facefusion.py', 'headless-run', '--jobs-path', get_test_jobs_directory(), '--processors', 'face_swapper', '--face-swapper-reference-positions', '0', '-s', get_test_example_file('source.jpg'), '-t', get_test_example_file('target-240p.mp4'), '-o', get_test_output_file('test-swap-face-to-video-mapping.mp4'), '--trim-frame-end', '1' ]
+
+	assert subprocess.run(commands).returncode == 0
+	assert is_test_output_file('test-swap-face-to-video-mapping.mp4') is True
@@ -1,5 +1,6 @@
 import subprocess
 import sys
+from time import sleep
 
 import pytest
 
@@ -145,3 +146,26 @@ def test_job_retry_all() -> None:
 	assert subprocess.run(commands).returncode == 1
 	assert is_test_output_file('test-job-retry-all-1.jpg') is True
 	assert is_test_output_file('test-job-retry-all-2.mp4') is True
+
+
+def test_job_daemon() -> None:
+	commands = [ sys.executable, 'facefusion.py', 'job-daemon', '--jobs-path', get_test_jobs_directory() ]
+	daemon_process = subprocess.Popen(commands)
+
+	commands = [ sys.executable, 'facefusion.py', 'job-create', 'test-job-daemon', '--jobs-path', get_test_jobs_directory() ]
+	subprocess.run(commands)
+
+	commands = [ sys.executable, 'facefusion.py', 'job-add-step', 'test-job-daemon', '--jobs-path', get_test_jobs_directory(), '--processors', 'face_debugger', '-t', get_test_example_file('target-240p.jpg'), '-o', get_test_output_file('test-job-daemon.jpg') ]
+	subprocess.run(commands)
+
+	commands = [ sys.executable, 'facefusion.py', 'job-submit', 'test-job-daemon', '--jobs-path', get_test_jobs_directory() ]
+	subprocess.run(commands)
+
+	for _ in range(60):
+		if is_test_output_file('test-job-daemon.jpg'):
+			break
+		sleep(1)
+	daemon_process.terminate()
+	daemon_process.wait()
+
+	assert is_test_output_file('test-job-daemon.jpg') is True
@@ -0,0 +1,83 @@
+import os
+import tempfile
+
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.face_cache import get_cached_faces, pack_faces, set_cached_faces, set_many_cached_faces, unpack_faces
+from facefusion.typing import Face
+from .helper import create_face
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('face_cache_path', os.path.join(tempfile.mkdtemp(), 'faces.db'))
+	state_manager.init_item('face_detector_model', 'yoloface')
+	state_manager.init_item('face_detector_size', '640x640')
+	state_manager.init_item('face_detector_angles', [ 0 ])
+	state_manager.init_item('face_detector_score', 0.5)
+	state_manager.init_item('face_landmarker_model', '2dfan4')
+	state_manager.init_item('face_landmarker_score', 0.5)
+	state_manager.init_item('download_providers', [ 'github' ])
+	state_manager.init_item('execution_providers', [ 'cpu' ])
+	state_manager.init_item('execution_model_precision', 'fp32')
+
+
+def create_cached_face() -> Face:
+	return create_face()._replace(
+		bounding_box = numpy.array([ 10, 20, 110, 140 ], dtype = numpy.float32),
+		score_set = { 'detector': 0.9, 'landmarker': 0.7 },
+		landmark_set = { '5': numpy.ones((5, 2)), '5/68': numpy.ones((5, 2)) * 2, '68': numpy.ones((68, 2)) * 3, '68/5': numpy.ones((68, 2)) * 4 },
+		angle = 90,
+		embedding = numpy.arange(512, dtype = numpy.float32),
+		normed_embedding = numpy.arange(512, dtype = numpy.float32) / 512,
+		gender = 'male',
+		age = range(30, 40),
+		race = 'indian'
+	)
+
+
+def test_pack_faces() -> None:
+	face = unpack_faces(pack_faces([ create_cached_face() ]))[0]
+
+	assert numpy.array_equal(face.bounding_box, create_cached_face().bounding_box)
+	assert face.score_set == create_cached_face().score_set
+	assert numpy.array_equal(face.landmark_set.get('68/5'), create_cached_face().landmark_set.get('68/5'))
+	assert face.angle == 90
+	assert numpy.array_equal(face.normed_embedding, create_cached_face().normed_embedding)
+	assert face.gender == 'male'
+	assert face.age == range(30, 40)
+	assert face.race == 'indian'
+	assert unpack_faces(pack_faces([])) == []
+
+
+def test_set_cached_faces() -> None:
+	assert get_cached_faces('frame-hash') is None
+
+	set_cached_faces('frame-hash', [ create_cached_face(), create_cached_face() ])
+	set_cached_faces('empty-frame-hash', [])
+
+	assert len(get_cached_faces('frame-hash')) == 2
+	assert get_cached_faces('empty-frame-hash') == []
+
+	state_manager.set_item('face_detector_score', 0.6)
+
+	assert get_cached_faces('frame-hash') is None
+
+	state_manager.set_item('face_detector_score', 0.5)
+	state_manager.set_item('execution_model_precision', 'int8')
+
+	assert get_cached_faces('frame-hash') is None
+
+	state_manager.set_item('execution_model_precision', 'fp32')
+
+	assert len(get_cached_faces('frame-hash')) == 2
+
+
+def test_set_many_cached_faces() -> None:
+	set_many_cached_faces([ 'frame-hash-1', 'frame-hash-2', 'frame-hash-3' ], [ [ create_cached_face() ], [], [ create_cached_face(), create_cached_face() ] ])
+
+	assert len(get_cached_faces('frame-hash-1')) == 1
+	assert get_cached_faces('frame-hash-2') == []
+	assert len(get_cached_faces('frame-hash-3')) == 2
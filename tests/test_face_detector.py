@@ -0,0 +1,41 @@
+import numpy
+import pytest
+
+from facefusion import face_detector, state_manager
+from facefusion.download import conditional_download
+from facefusion.face_detector import detect_faces, detect_faces_batch
+from facefusion.vision import read_static_image
+from .helper import get_test_example_file, get_test_examples_directory
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	conditional_download(get_test_examples_directory(),
+	[
+		'https://github.com/facefusion/facefusion-assets/releases/download/examples-3.0.0/source.jpg'
+	])
+	state_manager.init_item('execution_device_id', 0)
+	state_manager.init_item('execution_providers', [ 'cpu' ])
+	state_manager.init_item('download_providers', [ 'github' ])
+	state_manager.init_item('face_detector_score', 0.5)
+
+
+@pytest.fixture(autouse = True)
+def before_each() -> None:
+	face_detector.clear_inference_pool()
+
+
+def test_detect_faces_batch() -> None:
+	state_manager.init_item('face_detector_model', 'many')
+	state_manager.init_item('face_detector_size', '640x640')
+	face_detector.pre_check()
+
+	source_frame = read_static_image(get_test_example_file('source.jpg'))
+	bounding_boxes, face_scores, _ = detect_faces(source_frame)
+	face_detections = detect_faces_batch([ source_frame, numpy.zeros_like(source_frame), source_frame ])
+
+	assert len(face_detections) == 3
+	assert numpy.allclose(face_detections[0][0], bounding_boxes, atol = 1e-3)
+	assert numpy.allclose(face_detections[0][1], face_scores, atol = 1e-3)
+	assert [ len(face_detection) for face_detection in face_detections[1] ] == [ 0, 0, 0 ]
+	assert numpy.allclose(face_detections[2][0], bounding_boxes, atol = 1e-3)
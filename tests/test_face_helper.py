@@ -0,0 +1,25 @@
+import cv2
+import numpy
+
+from facefusion.face_helper import apply_nms, normalize_bounding_boxes, transform_bounding_box, transform_bounding_boxes
+
+
+def test_normalize_bounding_boxes() -> None:
+	bounding_boxes = numpy.array([ [ 10, 20, 30, 40 ], [ 30, 40, 10, 20 ] ])
+
+	assert numpy.array_equal(normalize_bounding_boxes(bounding_boxes), [ [ 10, 20, 30, 40 ], [ 10, 20, 30, 40 ] ])
+
+
+def test_transform_bounding_boxes() -> None:
+	bounding_boxes = numpy.array([ [ 10, 20, 30, 40 ], [ 50, 60, 90, 80 ] ], dtype = numpy.float64)
+	rotated_matrix = cv2.getRotationMatrix2D((50, 50), 90, 1)
+
+	for bounding_box, transform_box in zip(bounding_boxes, transform_bounding_boxes(bounding_boxes, rotated_matrix)):
+		assert numpy.allclose(transform_box, transform_bounding_box(bounding_box, rotated_matrix))
+
+
+def test_apply_nms() -> None:
+	bounding_boxes = numpy.array([ [ 10, 10, 110, 110 ], [ 12, 12, 112, 112 ], [ 200, 200, 300, 300 ] ], dtype = numpy.float64)
+	face_scores = numpy.array([ 0.8, 0.9, 0.7 ])
+
+	assert sorted(apply_nms(bounding_boxes, face_scores, 0.5, 0.4)) == [ 1, 2 ]
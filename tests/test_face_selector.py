@@ -0,0 +1,41 @@
+from typing import List
+
+import numpy
+
+from facefusion.face_selector import compare_faces, find_similar_faces, map_similar_faces
+from facefusion.typing import Face, FaceSet
+from .helper import create_face
+
+
+def create_faces(embeddings : List[List[float]]) -> List[Face]:
+	faces = []
+
+	for embedding in embeddings:
+		normed_embedding = numpy.array(embedding) / numpy.linalg.norm(embedding)
+		faces.append(create_face()._replace(embedding = normed_embedding, normed_embedding = normed_embedding))
+	return faces
+
+
+def test_find_similar_faces() -> None:
+	faces = create_faces([ [ 1, 0, 0 ], [ 0, 1, 0 ], [ 0.9, 0.1, 0 ] ])
+	reference_faces : FaceSet =\
+	{
+		'origin': create_faces([ [ 0, 0, 1 ] ]),
+		'face_swapper': create_faces([ [ 1, 0.1, 0 ], [ 0, 1, 0.1 ] ])
+	}
+	similar_faces = find_similar_faces(faces, reference_faces, 0.3)
+
+	assert similar_faces == [ faces[0], faces[2], faces[1] ]
+	assert similar_faces == [ face for reference_face in reference_faces.get('face_swapper') for face in faces if compare_faces(face, reference_face, 0.3) ]
+	assert find_similar_faces(faces, { 'origin': [] }, 0.3) == []
+	assert find_similar_faces([], reference_faces, 0.3) == []
+
+
+def test_map_similar_faces() -> None:
+	faces = create_faces([ [ 1, 0, 0 ], [ 0, 1, 0 ], [ 0, 0, 1 ], [ 0.1, 0.9, 0 ] ])
+	reference_faces = create_faces([ [ 0, 1, 0.1 ], [ 1, 0.1, 0 ] ])
+	mapped_faces = map_similar_faces(faces, reference_faces, 0.3)
+
+	assert [ reference_index for reference_index, _ in mapped_faces ] == [ 1, 0, 0 ]
+	assert [ face for _, face in mapped_faces ] == [ faces[0], faces[1], faces[3] ]
+	assert map_similar_faces(faces, [], 0.3) == []
@@ -0,0 +1,61 @@
+from typing import List
+
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.face_store import calc_faces_size, clear_static_faces, create_frame_hash, get_face_store, get_static_faces, set_static_faces
+from facefusion.typing import Face, VisionFrame
+from .helper import create_face
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	state_manager.init_item('face_store_memory_limit', 0)
+	clear_static_faces()
+
+
+def create_vision_frame(fill_value : int) -> VisionFrame:
+	return numpy.full((8, 8, 3), fill_value, dtype = numpy.uint8)
+
+
+def create_vision_hash(fill_value : int) -> str:
+	return create_frame_hash(create_vision_frame(fill_value))
+
+
+def create_faces() -> List[Face]:
+	return [ create_face()._replace(embedding = numpy.zeros(512 * 1024), normed_embedding = numpy.zeros(512 * 1024)) ]
+
+
+def test_set_static_faces() -> None:
+	set_static_faces(create_vision_hash(1), create_faces())
+	set_static_faces(create_vision_hash(1), create_faces())
+
+	assert len(get_face_store().get('static_faces')) == 1
+	assert get_face_store().get('static_faces_size') == calc_faces_size(create_faces())
+	assert get_static_faces(create_vision_hash(2)) is None
+
+
+def test_evict_static_faces() -> None:
+	state_manager.init_item('face_store_memory_limit', 32)
+
+	for fill_value in range(1, 6):
+		set_static_faces(create_vision_hash(fill_value), create_faces())
+		get_static_faces(create_vision_hash(1))
+
+	assert get_static_faces(create_vision_hash(1))
+	assert get_static_faces(create_vision_hash(2)) is None
+	assert get_static_faces(create_vision_hash(5))
+	assert get_face_store().get('static_faces_size') <= 32 * 1024 ** 2
+
+
+def test_create_frame_hash() -> None:
+	vision_frame = numpy.random.randint(0, 255, (24, 32, 3), dtype = numpy.uint8)
+	temp_vision_frame = vision_frame.copy()
+	temp_vision_frame[23, 31, 2] ^= 1
+
+	assert create_frame_hash(vision_frame) == create_frame_hash(vision_frame.copy())
+	assert create_frame_hash(vision_frame) != create_frame_hash(temp_vision_frame)
+	assert create_frame_hash(vision_frame) != create_frame_hash(vision_frame.reshape(32, 24, 3))
+	assert create_frame_hash(vision_frame[:, ::2]) == create_frame_hash(numpy.ascontiguousarray(vision_frame[:, ::2]))
+	assert create_frame_hash(numpy.zeros((24, 32, 3), dtype = numpy.uint8)) is None
@@ -0,0 +1,90 @@
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.face_tracker import advance_track_faces, clear_face_tracker, get_face_tracker, get_track_angle, set_track_faces, track_faces
+from facefusion.typing import Face, VisionFrame
+from .helper import create_face
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('face_landmarker_score', 0)
+	state_manager.init_item('face_tracker_interval', 3)
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	clear_face_tracker()
+
+
+def create_vision_frame(offset_x : int, offset_y : int) -> VisionFrame:
+	vision_frame = numpy.full((240, 320, 3), 64, dtype = numpy.uint8)
+	texture_frame = numpy.random.RandomState(0).randint(0, 255, (80, 80, 3), dtype = numpy.uint8)
+	vision_frame[80 + offset_y:160 + offset_y, 120 + offset_x:200 + offset_x] = texture_frame
+	return vision_frame
+
+
+def create_track_face() -> Face:
+	face_landmark_68 = numpy.stack(numpy.meshgrid(numpy.linspace(130, 190, 17), numpy.linspace(90, 150, 4)), axis = -1).reshape(-1, 2)[:68]
+	face_landmark_5 = numpy.array([ [ 140, 100 ], [ 180, 100 ], [ 160, 120 ], [ 145, 140 ], [ 175, 140 ] ], dtype = numpy.float32)
+
+	return create_face()._replace(
+		bounding_box = numpy.array([ 120, 80, 200, 160 ]),
+		landmark_set = { '5': face_landmark_5, '5/68': face_landmark_5, '68': face_landmark_68, '68/5': face_landmark_68 },
+		embedding = numpy.ones(512),
+		normed_embedding = numpy.ones(512)
+	)
+
+
+def test_track_faces() -> None:
+	assert track_faces(1, create_vision_frame(0, 0)) is None
+
+	set_track_faces(0, create_vision_frame(0, 0), [ create_track_face() ])
+
+	assert track_faces(2, create_vision_frame(3, -2)) is None
+
+	faces = track_faces(1, create_vision_frame(3, -2))
+
+	assert numpy.allclose(faces[0].bounding_box, [ 123, 78, 203, 158 ], atol = 0.5)
+	assert numpy.allclose(faces[0].landmark_set.get('5'), create_track_face().landmark_set.get('5') + [ 3, -2 ], atol = 0.5)
+	assert numpy.array_equal(faces[0].embedding, create_track_face().embedding)
+	assert get_face_tracker(1).get('frame_total') == 1
+	assert track_faces(2, create_vision_frame(4, -1)) is not None
+	assert get_face_tracker(2).get('frame_total') == 2
+	assert track_faces(3, create_vision_frame(4, -1)) is None
+	assert get_face_tracker(0) is None
+
+
+def test_track_faces_with_scene_cut() -> None:
+	set_track_faces(0, create_vision_frame(0, 0), [ create_track_face() ])
+
+	assert track_faces(1, 255 - create_vision_frame(0, 0)) is None
+
+
+def test_advance_track_faces() -> None:
+	advance_track_faces(1, create_vision_frame(0, 0), [ create_track_face() ])
+
+	assert get_face_tracker(1) is None
+
+	set_track_faces(0, create_vision_frame(0, 0), [ create_track_face() ])
+	advance_track_faces(1, create_vision_frame(0, 0), [ create_track_face() ])
+	advance_track_faces(2, create_vision_frame(0, 0), [ create_track_face() ])
+
+	assert get_face_tracker(2).get('frame_total') == 2
+	assert track_faces(3, create_vision_frame(0, 0)) is None
+
+
+def test_get_track_angle() -> None:
+	assert get_track_angle(1) == 0
+
+	set_track_faces(0, create_vision_frame(0, 0), [ create_track_face()._replace(angle = 90) ])
+	set_track_faces(1, create_vision_frame(0, 0), [])
+
+	assert get_track_angle(1) == 90
+	assert get_track_angle(2) == 90
+	assert get_track_angle(5) == 0
+
+	clear_face_tracker()
+
+	assert get_track_angle(1) == 0
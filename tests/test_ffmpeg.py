@@ -5,9 +5,10 @@ import pytest
 
 from facefusion import process_manager, state_manager
 from facefusion.download import conditional_download
-from facefusion.ffmpeg import concat_video, extract_frames, read_audio_buffer, replace_audio, restore_audio
+from facefusion.ffmpeg import close_pipe_video, concat_video, extract_frames, pipe_frames, pipe_video, read_audio_buffer, replace_audio, restore_audio, write_pipe_video
 from facefusion.filesystem import copy_file
 from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_file_path, get_temp_frame_paths
+from facefusion.vision import count_video_frame_total
 from .helper import get_test_example_file, get_test_examples_directory, get_test_output_file, prepare_test_output_directory
 
 
@@ -29,6 +30,9 @@ def before_all() -> None:
 	state_manager.init_item('temp_path', tempfile.gettempdir())
 	state_manager.init_item('temp_frame_format', 'png')
 	state_manager.init_item('output_audio_encoder', 'aac')
+	state_manager.init_item('output_video_encoder', 'libx264')
+	state_manager.init_item('output_video_quality', 80)
+	state_manager.init_item('output_video_preset', 'ultrafast')
 
 
 @pytest.fixture(scope = 'function', autouse = True)
@@ -62,6 +66,46 @@ def test_extract_frames() -> None:
 		clear_temp_directory(target_path)
 
 
+def test_pipe_frames() -> None:
+	pipe_set =\
+	[
+		(get_test_example_file('target-240p-25fps.mp4'), 0, 270, 324),
+		(get_test_example_file('target-240p-25fps.mp4'), 224, 270, 55),
+		(get_test_example_file('target-240p-30fps.mp4'), 124, 224, 100),
+		(get_test_example_file('target-240p-60fps.mp4'), 0, 100, 50)
+	]
+
+	for target_path, trim_frame_start, trim_frame_end, frame_total in pipe_set:
+		vision_frames = list(pipe_frames(target_path, '452x240', 30.0, trim_frame_start, trim_frame_end))
+
+		assert len(vision_frames) == frame_total
+		assert vision_frames[0].shape == (240, 452, 3)
+
+
+def test_pipe_video() -> None:
+	target_path = get_test_example_file('target-240p-25fps.mp4')
+	create_temp_directory(target_path)
+	merge_process = pipe_video(target_path, '904x480', 25.0)
+
+	for vision_frame in pipe_frames(target_path, '452x240', 25.0, 0, 50):
+		write_pipe_video(merge_process, vision_frame, '904x480')
+
+	assert close_pipe_video(merge_process) is True
+	assert count_video_frame_total(get_temp_file_path(target_path)) == 50
+
+	merge_process = pipe_video(target_path, '452x240', 25.0)
+	merge_process.kill()
+	merge_process.wait()
+
+	with pytest.raises(BrokenPipeError):
+		for vision_frame in pipe_frames(target_path, '452x240', 25.0, 0, 50):
+			write_pipe_video(merge_process, vision_frame, '452x240')
+
+	assert close_pipe_video(merge_process) is False
+
+	clear_temp_directory(target_path)
+
+
 def test_concat_video() -> None:
 	output_path = get_test_output_file('test-concat-video.mp4')
 	temp_output_paths =\
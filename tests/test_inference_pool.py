@@ -1,10 +1,17 @@
-from unittest.mock import patch
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
 
+import numpy
+import onnx
 import pytest
-from onnxruntime import InferenceSession
+from onnxruntime import GraphOptimizationLevel, InferenceSession
 
 from facefusion import content_analyser, state_manager
-from facefusion.inference_manager import INFERENCE_POOLS, get_inference_pool
+from facefusion.filesystem import is_file, remove_file
+from facefusion.inference_manager import INFERENCE_POOLS, create_inference_session, create_session_options, create_session_semaphore, get_inference_pool, resolve_intra_op_thread_count, resolve_optimized_model_path, resolve_session_concurrency, run_brokered_batch, run_with_io_binding, split_outputs
+from facefusion.thread_helper import thread_semaphore
 
 
 @pytest.fixture(scope = 'module', autouse = True)
@@ -29,3 +36,121 @@ def test_get_inference_pool() -> None:
 		assert isinstance(INFERENCE_POOLS.get('ui').get('test.cpu').get('content_analyser'), InferenceSession)
 
 	assert INFERENCE_POOLS.get('cli').get('test.cpu').get('content_analyser') == INFERENCE_POOLS.get('ui').get('test.cpu').get('content_analyser')
+
+
+def test_create_session_options() -> None:
+	state_manager.init_item('execution_thread_count', 2)
+	state_manager.init_item('execution_intra_op_thread_count', 3)
+	state_manager.init_item('execution_graph_optimization', 'basic')
+	state_manager.init_item('execution_memory_optimizations', [ 'pattern' ])
+	session_options = create_session_options([ 'cpu' ])
+
+	assert session_options.intra_op_num_threads == 3
+	assert session_options.graph_optimization_level == GraphOptimizationLevel.ORT_ENABLE_BASIC
+	assert session_options.enable_cpu_mem_arena is False
+	assert session_options.enable_mem_pattern is True
+
+	state_manager.init_item('execution_intra_op_thread_count', 0)
+	state_manager.init_item('execution_graph_optimization', 'all')
+	state_manager.init_item('execution_memory_optimizations', [ 'arena', 'pattern' ])
+
+
+def test_resolve_intra_op_thread_count() -> None:
+	state_manager.init_item('execution_thread_count', 2)
+	state_manager.init_item('execution_intra_op_thread_count', 0)
+
+	assert resolve_intra_op_thread_count([ 'cpu' ]) == 0
+
+	with patch('facefusion.inference_manager.is_video', return_value = True):
+		assert resolve_intra_op_thread_count([ 'cpu' ]) == max(1, (os.cpu_count() or 1) // 2)
+		assert resolve_intra_op_thread_count([ 'cuda', 'cpu' ]) == 0
+		assert create_session_options([ 'cuda', 'cpu' ]).intra_op_num_threads == 0
+
+		state_manager.init_item('execution_thread_count', 1)
+
+		assert resolve_intra_op_thread_count([ 'cpu' ]) == 0
+
+	state_manager.init_item('execution_intra_op_thread_count', 3)
+
+	assert resolve_intra_op_thread_count([ 'cuda', 'cpu' ]) == 3
+
+	state_manager.init_item('execution_intra_op_thread_count', 0)
+
+
+def test_resolve_session_concurrency() -> None:
+	state_manager.init_item('execution_thread_count', 4)
+	state_manager.init_item('execution_session_concurrency', 0)
+
+	assert resolve_session_concurrency([ 'cpu' ]) == 4
+	assert resolve_session_concurrency([ 'cuda', 'cpu' ]) == 1
+
+	state_manager.init_item('execution_session_concurrency', 2)
+
+	assert resolve_session_concurrency([ 'cuda', 'cpu' ]) == 2
+
+	state_manager.init_item('execution_session_concurrency', 0)
+
+
+def test_create_session_semaphore() -> None:
+	assert create_session_semaphore([ 'directml' ]) is thread_semaphore()
+	assert create_session_semaphore([ 'rocm', 'cpu' ]) is thread_semaphore()
+	assert create_session_semaphore([ 'cpu' ]) is not thread_semaphore()
+
+
+def test_create_inference_session_with_model_cache() -> None:
+	state_manager.init_item('execution_model_cache', True)
+	model_path = content_analyser.get_model_options().get('sources').get('content_analyser').get('path')
+	optimized_model_path = resolve_optimized_model_path(model_path, [ 'cpu' ])
+	remove_file(optimized_model_path)
+	create_inference_session(model_path, '0', [ 'cpu' ])
+
+	assert is_file(optimized_model_path) is True
+	assert create_inference_session(model_path, '0', [ 'cpu' ])._model_path == optimized_model_path
+
+	state_manager.init_item('execution_model_cache', False)
+
+
+def test_split_outputs() -> None:
+	anchor_outputs = [ numpy.arange(8).reshape(8, 1), numpy.arange(32).reshape(8, 4) ]
+	batch_outputs = [ numpy.arange(40).reshape(2, 5, 4) ]
+
+	assert [ output.shape for output in split_outputs(anchor_outputs, 2)[1] ] == [ (4, 1), (4, 4) ]
+	assert split_outputs(anchor_outputs, 2)[1][0].tolist() == [ [ 4 ], [ 5 ], [ 6 ], [ 7 ] ]
+	assert split_outputs(batch_outputs, 2)[0][0].shape == (1, 5, 4)
+	assert numpy.array_equal(split_outputs(batch_outputs, 2)[1][0], batch_outputs[0][1:])
+
+
+def test_run_brokered_batch() -> None:
+	state_manager.init_item('execution_batch_size', 4)
+	state_manager.init_item('execution_batch_timeout', 20)
+	inference_session = MagicMock()
+	inference_session.get_inputs.return_value = [ MagicMock(shape = [ 'batch', 2 ]) ]
+	inference_session.run.side_effect = lambda output_names, inputs : [ inputs.get('input') * 2 ]
+
+	with ThreadPoolExecutor(max_workers = 4) as executor:
+		batch_outputs = list(executor.map(lambda index : run_brokered_batch(inference_session, 'input', [ numpy.full((1, 2), index) ]), range(4)))
+
+	assert [ batch_output[0][0].tolist() for batch_output in batch_outputs ] == [ [ [ index * 2, index * 2 ] ] for index in range(4) ]
+	assert inference_session.run.call_count < 4
+
+	state_manager.init_item('execution_batch_timeout', 0)
+
+
+def test_run_with_io_binding() -> None:
+	model_path = os.path.join(tempfile.mkdtemp(), 'double.onnx')
+	onnx_graph = onnx.helper.make_graph([ onnx.helper.make_node('Add', [ 'input', 'input' ], [ 'output' ]) ], 'double',
+	[
+		onnx.helper.make_tensor_value_info('input', onnx.TensorProto.FLOAT, [ 'batch', 3 ])
+	],
+	[
+		onnx.helper.make_tensor_value_info('output', onnx.TensorProto.FLOAT, [ 'batch', 3 ])
+	])
+	onnx.save(onnx.helper.make_model(onnx_graph, opset_imports = [ onnx.helper.make_opsetid('', 13) ]), model_path)
+	inference_session = InferenceSession(model_path, providers = [ 'CPUExecutionProvider' ])
+	input_vision_frame = numpy.arange(6, dtype = numpy.float32).reshape(2, 3)
+	output_buffer = run_with_io_binding(inference_session, { 'input': input_vision_frame })[0]
+
+	assert numpy.array_equal(output_buffer, input_vision_frame * 2)
+	assert run_with_io_binding(inference_session, { 'input': input_vision_frame.T.T + 1 })[0] is output_buffer
+	assert numpy.array_equal(output_buffer, (input_vision_frame + 1) * 2)
+	assert run_with_io_binding(inference_session, { 'input': input_vision_frame[:1] })[0].shape == (1, 3)
@@ -0,0 +1,121 @@
+import json
+from http.server import ThreadingHTTPServer
+from typing import Any, Iterator, Optional, Tuple
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+from facefusion import state_manager
+from facefusion.jobs import job_store
+from facefusion.jobs.job_api import init_job_progress, start_job_api, stop_job_api
+from facefusion.jobs.job_manager import clear_jobs, get_steps, init_jobs, is_job_locked, lock_job, move_job_file, unlock_job
+from .helper import get_test_jobs_directory
+
+JOB_API_SERVER : Optional[ThreadingHTTPServer] = None
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> Iterator[None]:
+	global JOB_API_SERVER
+
+	job_store.register_step_keys([ 'target_path', 'output_path', 'output_video_quality' ])
+	state_manager.init_item('output_video_quality', 80)
+	state_manager.init_item('log_level', 'error')
+	JOB_API_SERVER = start_job_api(0)
+	yield
+	stop_job_api(JOB_API_SERVER)
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	clear_jobs(get_test_jobs_directory())
+	init_jobs(get_test_jobs_directory())
+	init_job_progress(None)
+
+
+def request_job_api(method : str, path : str, content : Any = None) -> Tuple[int, Any]:
+	url = 'http://127.0.0.1:' + str(JOB_API_SERVER.server_address[1]) + path
+	data = json.dumps(content).encode() if content is not None else None
+
+	try:
+		with urlopen(Request(url, data = data, method = method)) as response:
+			return response.status, json.loads(response.readline())
+	except HTTPError as exception:
+		return exception.code, json.loads(exception.read())
+
+
+def test_submit_job() -> None:
+	content =\
+	{
+		'job_id': 'job-test-submit-job',
+		'steps':
+		[
+			{
+				'target_path': 'target-1.jpg',
+				'output_path': 'output-1.jpg'
+			}
+		]
+	}
+
+	assert request_job_api('POST', '/jobs', content) == (201, { 'job_id': 'job-test-submit-job' })
+	assert request_job_api('POST', '/jobs', content)[0] == 409
+	assert request_job_api('POST', '/jobs', { 'job_id': 'job-test-submit-job' })[0] == 400
+	assert request_job_api('POST', '/jobs', { 'job_id': 'job-test-submit-job-empty', 'steps': [] })[0] == 400
+	assert request_job_api('GET', '/jobs/job-test-submit-job-empty')[0] == 404
+	assert get_steps('job-test-submit-job')[0].get('args').get('output_video_quality') == 80
+	assert request_job_api('GET', '/jobs')[1].get('queued') == [ 'job-test-submit-job' ]
+
+
+def test_get_job() -> None:
+	content =\
+	{
+		'job_id': 'job-test-get-job',
+		'steps':
+		[
+			{
+				'target_path': 'target-1.jpg',
+				'output_path': 'output-1.jpg'
+			}
+		]
+	}
+
+	assert request_job_api('GET', '/jobs/job-test-get-job')[0] == 404
+
+	request_job_api('POST', '/jobs', content)
+	init_job_progress('job-test-get-job')
+	status_code, job_content = request_job_api('GET', '/jobs/job-test-get-job')
+
+	assert status_code == 200
+	assert job_content.get('status') == 'queued'
+	assert job_content.get('steps') == [ 'queued' ]
+	assert job_content.get('progress').get('job_id') == 'job-test-get-job'
+
+	move_job_file('job-test-get-job', 'completed')
+
+	assert request_job_api('GET', '/jobs/job-test-get-job/progress')[1].get('status') == 'completed'
+
+
+def test_cancel_job() -> None:
+	content =\
+	{
+		'job_id': 'job-test-cancel-job',
+		'steps':
+		[
+			{
+				'target_path': 'target-1.jpg',
+				'output_path': 'output-1.jpg'
+			}
+		]
+	}
+
+	request_job_api('POST', '/jobs', content)
+	lock_job('job-test-cancel-job')
+
+	assert request_job_api('DELETE', '/jobs/job-test-cancel-job')[0] == 409
+
+	unlock_job('job-test-cancel-job')
+
+	assert request_job_api('DELETE', '/jobs/job-test-cancel-job') == (200, { 'job_id': 'job-test-cancel-job' })
+	assert is_job_locked('job-test-cancel-job') is False
+	assert request_job_api('DELETE', '/jobs/job-test-cancel-job')[0] == 404
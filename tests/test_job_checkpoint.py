@@ -0,0 +1,137 @@
+import os
+import tempfile
+from typing import Iterator
+
+import pytest
+
+from facefusion import state_manager
+from facefusion.filesystem import remove_directory
+from facefusion.jobs.job_checkpoint import are_frames_extracted, clear_checkpoint, flush_checkpoint, get_checkpoint_path, has_checkpoint, init_checkpoint, is_frame_done, mark_frame_done, mark_frames_extracted, release_checkpoint, verify_frame_progress
+from facefusion.jobs.job_manager import add_step, clear_jobs, create_job, delete_job, init_jobs
+from facefusion.temp_helper import create_temp_directory, get_temp_directory_path, get_temp_frames_pattern
+from .helper import get_test_jobs_directory
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('temp_path', tempfile.gettempdir())
+	state_manager.init_item('temp_frame_format', 'png')
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> Iterator[None]:
+	clear_jobs(get_test_jobs_directory())
+	init_jobs(get_test_jobs_directory())
+	yield
+	clear_checkpoint()
+
+
+def test_init_checkpoint() -> None:
+	step_args =\
+	{
+		'processors': [ 'face_swapper' ],
+		'output_path': 'output.mp4'
+	}
+
+	assert init_checkpoint('job-test-init-checkpoint', 0, step_args) is False
+	assert has_checkpoint() is False
+
+	mark_frames_extracted()
+
+	assert init_checkpoint('job-test-init-checkpoint', 0, step_args) is True
+	assert has_checkpoint() is True
+	assert are_frames_extracted() is True
+
+	step_args['processors'] = [ 'face_enhancer' ]
+
+	assert init_checkpoint('job-test-init-checkpoint', 0, step_args) is False
+	assert has_checkpoint() is False
+	assert are_frames_extracted() is False
+
+
+def test_mark_frame_done() -> None:
+	step_args =\
+	{
+		'processors': [ 'face_swapper' ]
+	}
+
+	init_checkpoint('job-test-mark-frame-done', 0, step_args)
+	mark_frame_done('face_swapper', 0)
+	mark_frame_done('face_swapper', 1)
+	mark_frame_done('face_swapper', 3)
+
+	assert flush_checkpoint() is True
+	assert init_checkpoint('job-test-mark-frame-done', 0, step_args) is True
+	assert is_frame_done('face_swapper', 0) is True
+	assert is_frame_done('face_swapper', 1) is True
+	assert is_frame_done('face_swapper', 2) is False
+	assert is_frame_done('face_swapper', 3) is True
+	assert is_frame_done('face_enhancer', 0) is False
+
+
+def test_release_checkpoint() -> None:
+	init_checkpoint('job-test-release-checkpoint', 0, {})
+	mark_frames_extracted()
+	mark_frame_done('facefusion.processors.core', 0)
+
+	assert release_checkpoint('job-test-release-checkpoint', 1) is False
+	assert is_frame_done('facefusion.processors.core', 0) is True
+	assert release_checkpoint('job-test-release-checkpoint', 0) is True
+	assert is_frame_done('facefusion.processors.core', 0) is False
+	assert has_checkpoint() is False
+	assert init_checkpoint('job-test-release-checkpoint', 0, {}) is True
+	assert is_frame_done('facefusion.processors.core', 0) is True
+
+
+def test_clear_checkpoint() -> None:
+	init_checkpoint('job-test-clear-checkpoint', 0, {})
+	mark_frame_done('face_swapper', 0)
+
+	assert clear_checkpoint() is True
+	assert has_checkpoint() is False
+	assert is_frame_done('face_swapper', 0) is False
+
+
+def test_mark_frames_extracted() -> None:
+	init_checkpoint('job-test-mark-frames-extracted', 0, {})
+	mark_frame_done('face_swapper', 0)
+	mark_frames_extracted()
+
+	assert init_checkpoint('job-test-mark-frames-extracted', 0, {}) is True
+	assert are_frames_extracted() is True
+	assert is_frame_done('face_swapper', 0) is False
+
+
+def test_resume_checkpoint_without_temp_directory() -> None:
+	target_path = os.path.join(tempfile.gettempdir(), 'target-test-resume-checkpoint.mp4')
+
+	init_checkpoint('job-test-resume-checkpoint', 0, {})
+	create_temp_directory(target_path)
+	open(get_temp_frames_pattern(target_path, '%08d') % 1, 'wb').close()
+	mark_frames_extracted()
+	mark_frame_done('face_swapper', 0)
+	flush_checkpoint()
+
+	assert init_checkpoint('job-test-resume-checkpoint', 0, {}) is True
+	assert verify_frame_progress(target_path) is True
+	assert is_frame_done('face_swapper', 0) is True
+
+	remove_directory(get_temp_directory_path(target_path))
+
+	assert init_checkpoint('job-test-resume-checkpoint', 0, {}) is True
+	assert verify_frame_progress(target_path) is False
+	assert are_frames_extracted() is False
+	assert is_frame_done('face_swapper', 0) is False
+	assert init_checkpoint('job-test-resume-checkpoint', 0, {}) is True
+	assert is_frame_done('face_swapper', 0) is False
+
+
+def test_delete_job_checkpoint() -> None:
+	create_job('job-test-delete-job-checkpoint')
+	add_step('job-test-delete-job-checkpoint', {})
+	init_checkpoint('job-test-delete-job-checkpoint', 0, {})
+	mark_frames_extracted()
+
+	assert os.path.isfile(get_checkpoint_path('job-test-delete-job-checkpoint', 0)) is True
+	assert delete_job('job-test-delete-job-checkpoint') is True
+	assert os.path.isfile(get_checkpoint_path('job-test-delete-job-checkpoint', 0)) is False
@@ -1,9 +1,10 @@
+import os
 from time import sleep
 
 import pytest
 
 from facefusion.jobs.job_helper import get_step_output_path
-from facefusion.jobs.job_manager import add_step, clear_jobs, count_step_total, create_job, delete_job, delete_jobs, find_job_ids, get_steps, init_jobs, insert_step, move_job_file, remix_step, remove_step, set_step_status, set_steps_status, submit_job, submit_jobs
+from facefusion.jobs.job_manager import add_step, clear_jobs, count_step_total, create_job, delete_job, delete_jobs, find_job_ids, get_job_lock_path, get_steps, init_jobs, insert_step, is_job_locked, lock_job, move_job_file, remix_step, remove_stale_job_lock, remove_step, set_step_status, set_steps_status, submit_job, submit_jobs, unlock_job
 from .helper import get_test_jobs_directory
 
 
@@ -96,6 +97,25 @@ def test_delete_jobs() -> None:
 	assert delete_jobs() is True
 
 
+def test_lock_job() -> None:
+	assert is_job_locked('job-test-lock-job') is False
+	assert lock_job('job-test-lock-job') is True
+	assert lock_job('job-test-lock-job') is False
+	assert is_job_locked('job-test-lock-job') is True
+	assert unlock_job('job-test-lock-job') is True
+	assert unlock_job('job-test-lock-job') is False
+
+	with open(get_job_lock_path('job-test-lock-job'), 'w') as job_lock_file:
+		job_lock_file.write('99999999')
+
+	assert is_job_locked('job-test-lock-job') is False
+	assert lock_job('job-test-lock-job') is True
+	assert is_job_locked('job-test-lock-job') is True
+	assert os.listdir(os.path.dirname(get_job_lock_path('job-test-lock-job'))) == [ 'job-test-lock-job.lock' ]
+	assert remove_stale_job_lock(get_job_lock_path('job-test-lock-job')) is True
+	assert is_job_locked('job-test-lock-job') is True
+
+
 @pytest.mark.skip()
 def test_find_jobs() -> None:
 	pass
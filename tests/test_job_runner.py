@@ -1,12 +1,14 @@
+import os
 import subprocess
+import tempfile
 
 import pytest
 
 from facefusion import state_manager
 from facefusion.download import conditional_download
-from facefusion.filesystem import copy_file
-from facefusion.jobs.job_manager import add_step, clear_jobs, create_job, init_jobs, submit_job, submit_jobs
-from facefusion.jobs.job_runner import collect_output_set, finalize_steps, run_job, run_jobs, run_steps
+from facefusion.filesystem import copy_file, create_directory, is_directory
+from facefusion.jobs.job_manager import add_step, clear_jobs, create_job, find_job_ids, init_jobs, submit_job, submit_jobs
+from facefusion.jobs.job_runner import clear_job_worker_temp_paths, collect_output_set, finalize_steps, run_job, run_jobs, run_steps
 from facefusion.typing import Args
 from .helper import get_test_example_file, get_test_examples_directory, get_test_jobs_directory, get_test_output_file, is_test_output_file, prepare_test_output_directory
 
@@ -20,6 +22,8 @@ def before_all() -> None:
 	])
 	subprocess.run([ 'ffmpeg', '-i', get_test_example_file('target-240p.mp4'), '-vframes', '1', get_test_example_file('target-240p.jpg') ])
 	state_manager.init_item('output_audio_encoder', 'aac')
+	state_manager.init_item('temp_path', tempfile.gettempdir())
+	state_manager.init_item('log_level', 'error')
 
 
 @pytest.fixture(scope = 'function', autouse = True)
@@ -104,6 +108,41 @@ def test_run_jobs() -> None:
 	assert run_jobs(process_step) is True
 
 
+def test_run_jobs_with_workers() -> None:
+	args_1 =\
+	{
+		'source_path': get_test_example_file('source.jpg'),
+		'target_path': get_test_example_file('target-240p.mp4'),
+		'output_path': get_test_output_file('output-1.mp4')
+	}
+	args_2 =\
+	{
+		'source_path': get_test_example_file('source.jpg'),
+		'target_path': get_test_example_file('target-240p.jpg'),
+		'output_path': get_test_output_file('output-1.jpg')
+	}
+	args_3 =\
+	{
+		'source_path': get_test_example_file('source.jpg'),
+		'target_path': get_test_example_file('target-invalid.mp4'),
+		'output_path': get_test_output_file('output-2.mp4')
+	}
+
+	create_job('job-test-run-jobs-with-workers-1')
+	create_job('job-test-run-jobs-with-workers-2')
+	create_job('job-test-run-jobs-with-workers-3')
+	add_step('job-test-run-jobs-with-workers-1', args_1)
+	add_step('job-test-run-jobs-with-workers-2', args_2)
+	add_step('job-test-run-jobs-with-workers-3', args_3)
+	submit_jobs()
+
+	assert run_jobs(process_step, 2) is False
+	assert is_test_output_file('output-1.mp4') is True
+	assert is_test_output_file('output-1.jpg') is True
+	assert sorted(find_job_ids('completed')) == [ 'job-test-run-jobs-with-workers-1', 'job-test-run-jobs-with-workers-2' ]
+	assert find_job_ids('failed') == [ 'job-test-run-jobs-with-workers-3' ]
+
+
 @pytest.mark.skip()
 def test_retry_job() -> None:
 	pass
@@ -226,3 +265,15 @@ def test_collect_output_set() -> None:
 	}
 
 	assert collect_output_set('job-test-collect-output-set') == output_set
+
+
+def test_clear_job_worker_temp_paths() -> None:
+	temp_path = os.path.join(tempfile.gettempdir(), 'test-clear-job-worker-temp-paths')
+	dead_worker_temp_path = os.path.join(temp_path, 'worker-99999999')
+	alive_worker_temp_path = os.path.join(temp_path, 'worker-' + str(os.getpid()))
+	create_directory(dead_worker_temp_path)
+	create_directory(alive_worker_temp_path)
+
+	assert clear_job_worker_temp_paths(temp_path) is True
+	assert is_directory(dead_worker_temp_path) is False
+	assert is_directory(alive_worker_temp_path) is True
@@ -0,0 +1,46 @@
+import subprocess
+import sys
+
+from facefusion import process_manager
+from facefusion.jobs.job_manager import clear_jobs, find_job_ids, init_jobs
+from facefusion.jobs.job_shard import create_shard_jobs, create_shard_ranges, terminate_shard_processes, wait_shard_processes
+from .helper import get_test_jobs_directory, get_test_output_file
+
+
+def test_create_shard_ranges() -> None:
+	assert create_shard_ranges(0, 90, 3) == [ (0, 30), (30, 60), (60, 90) ]
+	assert create_shard_ranges(10, 20, 3) == [ (10, 13), (13, 16), (16, 20) ]
+	assert create_shard_ranges(0, 2, 4) == [ (0, 1), (1, 2) ]
+	assert create_shard_ranges(0, 0, 4) == [ (0, 0) ]
+
+
+def test_create_shard_jobs() -> None:
+	shard_jobs_path = get_test_jobs_directory() + '-shards'
+	clear_jobs(get_test_jobs_directory())
+	clear_jobs(shard_jobs_path)
+	init_jobs(get_test_jobs_directory())
+
+	assert create_shard_jobs(shard_jobs_path, [ 'job-test-shard-0', 'job-test-shard-1' ], [ (0, 10), (10, 20) ], [ get_test_output_file('shard-0.mp4'), get_test_output_file('shard-1.mp4') ]) is True
+	assert find_job_ids('queued') == []
+
+	init_jobs(shard_jobs_path)
+
+	assert find_job_ids('queued') == [ 'job-test-shard-0', 'job-test-shard-1' ]
+
+	clear_jobs(shard_jobs_path)
+
+
+def test_wait_shard_processes() -> None:
+	process_manager.start()
+	shard_processes = [ subprocess.Popen([ sys.executable, '-c', 'pass' ]), subprocess.Popen([ sys.executable, '-c', 'pass' ]) ]
+
+	assert wait_shard_processes(shard_processes) is True
+
+	shard_processes = [ subprocess.Popen([ sys.executable, '-c', 'import time; time.sleep(60)' ]), subprocess.Popen([ sys.executable, '-c', 'raise SystemExit(1)' ]) ]
+
+	assert wait_shard_processes(shard_processes) is False
+
+	terminate_shard_processes(shard_processes)
+
+	assert shard_processes[0].returncode != 0
+	process_manager.end()
@@ -0,0 +1,96 @@
+import os
+import tempfile
+from types import ModuleType
+
+import numpy
+import onnx
+import pytest
+
+from facefusion import state_manager
+from facefusion.filesystem import is_file
+from facefusion.inference_manager import resolve_model_path
+from facefusion.model_helper import resolve_quantized_model_path
+from facefusion.model_quantizer import calc_cosine_similarity, calc_psnr, collect_model_inputs, quantize_model
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('quantize_min_similarity', 0.99)
+	state_manager.init_item('quantize_min_psnr', 30)
+
+
+def create_model_path() -> str:
+	model_path = os.path.join(tempfile.mkdtemp(), 'conv.onnx')
+	conv_weight = numpy.random.default_rng(0).standard_normal((3, 3, 3, 3)).astype(numpy.float32) * 0.1
+	onnx_graph = onnx.helper.make_graph([ onnx.helper.make_node('Conv', [ 'input', 'weight' ], [ 'output' ], pads = [ 1, 1, 1, 1 ]) ], 'conv',
+	[
+		onnx.helper.make_tensor_value_info('input', onnx.TensorProto.FLOAT, [ 1, 3, 32, 32 ])
+	],
+	[
+		onnx.helper.make_tensor_value_info('output', onnx.TensorProto.FLOAT, [ 1, 3, 32, 32 ])
+	], [ onnx.numpy_helper.from_array(conv_weight, 'weight') ])
+	onnx.save(onnx.helper.make_model(onnx_graph, opset_imports = [ onnx.helper.make_opsetid('', 13) ]), model_path)
+	return model_path
+
+
+@pytest.mark.parametrize('quantize_method', [ 'dynamic', 'static' ])
+def test_quantize_model(quantize_method : str) -> None:
+	state_manager.init_item('quantize_method', quantize_method)
+	model_path = create_model_path()
+	calibration_vision_frames = [ numpy.random.default_rng(index).integers(0, 255, (48, 64, 3), dtype = numpy.uint8) for index in range(4) ]
+	model_inputs = collect_model_inputs(ModuleType('conv'), 'conv', 'conv', model_path, calibration_vision_frames, [ [] for _ in calibration_vision_frames ])
+
+	assert quantize_model(model_path, model_inputs) is True
+	assert is_file(resolve_quantized_model_path(model_path)) is True
+
+	state_manager.init_item('quantize_min_psnr', 60)
+
+	assert quantize_model(model_path, model_inputs) is False
+
+	state_manager.init_item('quantize_min_psnr', 30)
+
+
+def test_collect_model_inputs() -> None:
+	model_path = create_model_path()
+	model_module = ModuleType('conv')
+	calibration_vision_frames = [ numpy.zeros((48, 64, 3), dtype = numpy.uint8) + 128 ]
+	crop_vision_frame = numpy.ones((1, 3, 32, 32), dtype = numpy.float32)
+
+	assert collect_model_inputs(model_module, 'conv', 'conv', model_path, calibration_vision_frames, [ [] ])[0].get('input').shape == (1, 3, 32, 32)
+
+	model_module.create_calibration_inputs = lambda model_name, model_source_name, vision_frame, faces: [ { 'input': crop_vision_frame, 'weight': numpy.array([ 1.0 ]) } ]
+	model_inputs = collect_model_inputs(model_module, 'conv', 'conv', model_path, calibration_vision_frames, [ [] ])
+
+	assert len(model_inputs) == 1
+	assert list(model_inputs[0].keys()) == [ 'input' ]
+	assert model_inputs[0].get('input') is crop_vision_frame
+
+	model_module.create_calibration_inputs = lambda model_name, model_source_name, vision_frame, faces: []
+
+	assert collect_model_inputs(model_module, 'conv', 'conv', model_path, calibration_vision_frames, [ [] ])[0].get('input').shape == (1, 3, 32, 32)
+
+
+def test_resolve_model_path() -> None:
+	model_path = create_model_path()
+	state_manager.init_item('execution_model_precision', 'int8')
+
+	assert resolve_model_path(model_path, [ 'cpu' ]) == model_path
+
+	state_manager.init_item('quantize_method', 'dynamic')
+	quantize_model(model_path, collect_model_inputs(ModuleType('conv'), 'conv', 'conv', model_path, [ numpy.zeros((32, 32, 3), dtype = numpy.uint8) + 128 ], [ [] ]))
+
+	assert resolve_model_path(model_path, [ 'cpu' ]) == resolve_quantized_model_path(model_path)
+	assert resolve_model_path(model_path, [ 'cuda', 'cpu' ]) == model_path
+
+	state_manager.init_item('execution_model_precision', 'fp32')
+
+	assert resolve_model_path(model_path, [ 'cpu' ]) == model_path
+
+
+def test_calc_model_drift() -> None:
+	output = numpy.arange(12, dtype = numpy.float32).reshape(1, 3, 2, 2)
+
+	assert calc_cosine_similarity(output, output) == pytest.approx(1.0)
+	assert calc_cosine_similarity(numpy.array([ 1.0, 0.0 ]), numpy.array([ 0.0, 1.0 ])) == 0.0
+	assert calc_psnr(output, output) == 100.0
+	assert calc_psnr(output, output + 1.1) == pytest.approx(20 * numpy.log10(11 / 1.1))
@@ -0,0 +1,115 @@
+from multiprocessing.shared_memory import SharedMemory
+from typing import List
+from unittest.mock import patch
+
+import numpy
+import pytest
+
+from facefusion import process_manager, state_manager
+from facefusion.processors.core import create_chain_inputs, create_queue_payloads, get_scheduler_metrics, get_worker_utilisations, has_face_processors, has_target_frames, multi_process_frames, prime_queue_payloads, read_shared_frame, write_shared_frame
+from facefusion.typing import QueuePayload, UpdateProgress
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('execution_thread_count', 4)
+	state_manager.init_item('execution_queue_count', 1)
+	state_manager.init_item('execution_providers', [ 'cpu' ])
+	state_manager.init_item('face_detector_batch_size', 1)
+	state_manager.init_item('face_tracker_interval', 1)
+	state_manager.init_item('face_cache_path', None)
+	state_manager.init_item('processors', [ 'face_swapper', 'face_enhancer' ])
+	state_manager.init_item('log_level', 'error')
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	process_manager.start()
+
+
+def test_create_chain_inputs() -> None:
+	target_vision_frame = numpy.zeros((24, 32, 3), dtype = numpy.uint8)
+	temp_audio_frame = numpy.ones((80, 16))
+
+	with patch('facefusion.processors.core.get_voice_frame', return_value = temp_audio_frame):
+		assert create_chain_inputs(None, None, 'source.mp3', 25.0, 0, target_vision_frame).get('source_audio_frame').dtype == numpy.int16
+
+	state_manager.set_item('processors', [ 'lip_syncer' ])
+
+	with patch('facefusion.processors.core.get_voice_frame', return_value = temp_audio_frame):
+		assert create_chain_inputs(None, None, 'source.mp3', 25.0, 0, target_vision_frame).get('source_audio_frame') is temp_audio_frame
+
+	with patch('facefusion.processors.core.get_voice_frame', return_value = numpy.zeros((80, 16))):
+		assert create_chain_inputs(None, None, 'source.mp3', 25.0, 0, target_vision_frame).get('source_audio_frame').dtype == numpy.int16
+
+	with patch('facefusion.processors.core.get_voice_frame', return_value = None):
+		assert create_chain_inputs(None, None, 'source.mp3', 25.0, 0, target_vision_frame).get('source_audio_frame').dtype == numpy.int16
+
+	state_manager.set_item('processors', [ 'face_swapper', 'face_enhancer' ])
+
+
+def test_multi_process_frames() -> None:
+	frame_numbers = []
+	temp_frame_paths = [ str(index).zfill(8) + '.png' for index in range(100) ]
+
+	def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+		for queue_payload in process_manager.manage(queue_payloads):
+			frame_numbers.append(queue_payload.get('frame_number'))
+			update_progress(1)
+
+	multi_process_frames([], temp_frame_paths, process_frames)
+
+	assert sorted(frame_numbers) == list(range(100))
+	assert get_scheduler_metrics().get('queue_depth') <= 4
+	assert len(get_worker_utilisations()) <= 4
+
+
+def test_multi_process_frames_with_error() -> None:
+	temp_frame_paths = [ str(index).zfill(8) + '.png' for index in range(100) ]
+
+	def process_frames(source_paths : List[str], queue_payloads : List[QueuePayload], update_progress : UpdateProgress) -> None:
+		for _ in process_manager.manage(queue_payloads):
+			raise ValueError
+
+	with pytest.raises(ValueError):
+		multi_process_frames([], temp_frame_paths, process_frames)
+
+
+def test_read_write_shared_frame() -> None:
+	vision_frame = numpy.random.randint(0, 255, (24, 32, 3), dtype = numpy.uint8)
+	shared_memory = SharedMemory(create = True, size = vision_frame.nbytes * 2)
+
+	write_shared_frame(shared_memory, vision_frame.nbytes, 1, vision_frame)
+
+	assert numpy.array_equal(read_shared_frame(shared_memory, vision_frame.nbytes, 1, vision_frame.shape), vision_frame)
+
+	shared_memory.close()
+	shared_memory.unlink()
+
+
+def test_prime_queue_payloads() -> None:
+	queue_payloads = create_queue_payloads([ str(index).zfill(8) + '.png' for index in range(10) ])
+	state_manager.set_item('face_detector_batch_size', 4)
+
+	assert list(prime_queue_payloads(queue_payloads, [ 'frame_enhancer' ])) == queue_payloads
+
+	state_manager.set_item('face_detector_batch_size', 1)
+
+
+def test_has_face_processors() -> None:
+	assert has_face_processors([ 'face_swapper' ]) is True
+	assert has_face_processors([ 'frame_colorizer', 'face_enhancer' ]) is True
+	assert has_face_processors([ 'frame_colorizer', 'frame_enhancer' ]) is False
+	assert has_face_processors([]) is False
+
+
+def test_has_target_frames() -> None:
+	assert has_target_frames([ 'face_swapper', 'face_enhancer' ]) is False
+
+	state_manager.set_item('face_tracker_interval', 3)
+
+	assert has_target_frames([ 'face_swapper', 'face_enhancer' ]) is True
+	assert has_target_frames([ 'face_swapper' ]) is True
+	assert has_target_frames([ 'face_enhancer' ]) is False
+
+	state_manager.set_item('face_tracker_interval', 1)